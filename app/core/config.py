@@ -51,6 +51,48 @@ class Settings(BaseSettings):
     PILOT_GATEWAY_URL: str = Field(default="http://pilot:9090", description="Pilot gateway URL")
     PILOT_POLL_INTERVAL: int = Field(default=300, description="Polling interval in seconds")
     PILOT_LABEL: str = Field(default="pilot", description="Jira label to filter")
+    PILOT_POLL_WORKERS: int = Field(default=4, description="첨부파일 추출/Pilot 전달 동시 처리 수")
+
+    ATTACHMENT_MAX_BYTES: int = Field(default=20 * 1024 * 1024, description="Jira 첨부파일 텍스트 추출 시 다운로드 크기 제한(바이트)")
+    ATTACHMENT_EXTRACT_CONCURRENCY: int = Field(default=4, description="이슈 한 건의 첨부파일 동시 다운로드/추출 수")
+    ATTACHMENT_CACHE_TTL: float = Field(default=86400.0, description="첨부파일 추출 텍스트 캐시 TTL(초)")
+    ATTACHMENT_CACHE_MAX_BYTES: int = Field(default=32 * 1024 * 1024, description="첨부파일 추출 텍스트 캐시 메모리 한도(바이트)")
+
+    JIRA_SEARCH_PAGE_SIZE: int = Field(default=500, description="Jira 검색 페이지당 요청 건수 (Jira가 필드 수에 따라 줄여서 응답할 수 있음)")
+    JIRA_SEARCH_SLICE_DAYS: int = Field(default=7, description="긴 기간 검색 시 동시 조회할 날짜 하위 구간 크기(일)")
+    JIRA_SEARCH_CONCURRENCY: int = Field(default=4, description="하위 구간 동시 검색 개수")
+    JIRA_RATE_LIMIT_PER_SEC: float = Field(default=10.0, description="모든 Jira 요청이 공유하는 초당 요청 수 (토큰 버킷)")
+
+    JIRA_CACHE_ENABLED: bool = Field(default=True, description="Jira 검색 결과 캐시 사용 여부")
+    JIRA_CACHE_TTL: float = Field(default=60.0, description="현재 기간 검색 결과 캐시 TTL(초)")
+    JIRA_CACHE_HISTORIC_TTL: float = Field(default=600.0, description="이미 지난 기간 검색 결과 캐시 TTL(초)")
+    JIRA_CACHE_STALE_TTL: float = Field(default=300.0, description="TTL 이후 stale 값을 돌려주며 백그라운드 갱신하는 구간(초)")
+    JIRA_CACHE_MAX_BYTES: int = Field(default=64 * 1024 * 1024, description="검색 결과 캐시 메모리 한도(바이트, LRU)")
+
+    JIRA_MIRROR_ENABLED: bool = Field(default=False, description="Jira 이슈 로컬 미러(jira_issues) 동기화 및 조회 사용 여부")
+    JIRA_MIRROR_SYNC_INTERVAL: int = Field(default=120, description="미러 델타 동기화 주기(초)")
+    JIRA_MIRROR_BACKFILL_DAYS: int = Field(default=400, description="미러가 보관하는 기간(일) — 이보다 오래된 구간은 Jira로 조회")
+    JIRA_MIRROR_RECONCILE_HOURS: int = Field(default=24, description="전체 재조정(삭제 반영) 주기(시간)")
+    ASSIGNEE_DIRECTORY_TTL: float = Field(default=300.0, description="/issues/assignees 메모리 스냅샷 유지 시간(초)")
+
+    PM_ROLLUP_ENABLED: bool = Field(default=True, description="PM 주간/월간 보고서 집계를 (ISO 주차, 프로젝트, 담당자) 롤업 컬렉션에서 읽고 이슈 변경 시 증분 갱신")
+
+    ISMS_STATS_MATERIALIZED: bool = Field(default=True, description="ISMS-P 대시보드 통계를 요약 컬렉션에 저장해 두고 변경 시 재계산")
+
+    AUTH_PRINCIPAL_CACHE_TTL: float = Field(default=30.0, description="get_current_user 사용자 정보 캐시 TTL(초) — 관리자 변경은 즉시 무효화, 다른 워커는 TTL 이내 반영")
+    USER_DIRECTORY_TTL: float = Field(default=300.0, description="사용자 이름 디렉터리 스냅샷 유지 시간(초) — 같은 프로세스의 사용자 변경은 즉시 반영")
+    USER_DIRECTORY_CHANGE_STREAM: bool = Field(default=False, description="users change stream으로 다른 워커의 변경도 즉시 반영 (레플리카셋 필요)")
+    AUTH_TOKEN_REFRESH_INTERVAL: int = Field(default=60, description="내부망 슬라이딩 세션 토큰 재발급 최소 간격(초) — 토큰 iat 기준")
+
+    HTTP_CLIENT_MAX_CONNECTIONS: int = Field(default=20, description="공유 httpx 클라이언트 최대 동시 연결 수")
+    HTTP_CLIENT_MAX_KEEPALIVE: int = Field(default=10, description="공유 httpx 클라이언트 keep-alive 유지 연결 수")
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = Field(default=30.0, description="유휴 keep-alive 연결 만료(초)")
+    HTTP_CLIENT_TIMEOUT: float = Field(default=30.0, description="공유 httpx 클라이언트 기본 타임아웃(초)")
+    HTTP_CLIENT_HTTP2: bool = Field(default=False, description="HTTP/2 사용 여부 (h2 패키지 필요)")
+
+    CPU_POOL_WORKERS: int = Field(default=2, description="Excel 파싱 등 CPU 작업 프로세스 풀 크기")
+    CPU_POOL_MAX_QUEUE: int = Field(default=8, description="CPU 작업 대기열 최대 길이 — 넘으면 503")
+    CPU_POOL_SLOW_JOB_SECONDS: float = Field(default=5.0, description="이 시간(초)보다 오래 걸린 CPU 작업은 로그로 남김")
 
     model_config = SettingsConfigDict(
         env_file=DOTENV,
@@ -0,0 +1,186 @@
+"""프로세스 전역 CPU 작업 풀 (Excel/XML 파싱 등).
+
+openpyxl 파싱처럼 CPU를 오래 쓰는 동기 함수를 이벤트 루프 밖 프로세스 풀에서 실행한다.
+큰 업로드 하나가 다른 사용자의 요청까지 멈추지 않도록 한다.
+
+- 동시에 실행되는 작업은 CPU_POOL_WORKERS개. 나머지는 대기열에서 기다린다
+- 대기열이 CPU_POOL_MAX_QUEUE를 넘으면 바로 CpuPoolBusy를 낸다 (라우터에서 503)
+- 워커 프로세스가 죽으면(OOM kill 등) 풀이 통째로 깨지므로 새 풀로 바꾸고 그 작업은
+  CpuWorkerCrashed로 실패시킨다 (라우터에서 503). 둘 다 CpuPoolUnavailable이다
+- 작업 이름별 대기/실행 시간과 현재 대기열 길이를 stats()로 노출한다 (/health/metrics, 관리자 전용)
+
+넘기는 함수는 모듈 최상위 함수여야 하고(pickle), 인자/반환값도 pickle 가능해야 한다.
+HttpClientManager와 같은 방식으로 lifespan에서 init/close 한다.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CpuPoolUnavailable(RuntimeError):
+    """풀에서 작업을 처리하지 못했다 — 잠시 후 다시 시도하면 되는 경우 (503)."""
+
+
+class CpuPoolBusy(CpuPoolUnavailable):
+    """대기열이 가득 차 작업을 받을 수 없다."""
+
+
+class CpuWorkerCrashed(CpuPoolUnavailable):
+    """작업 중 워커 프로세스가 비정상 종료됐다. 풀은 새로 만들어졌다."""
+
+
+@dataclass
+class _JobStats:
+    count: int = 0
+    errors: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+    run_total: float = 0.0
+    run_max: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        done = max(self.count, 1)
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "wait_avg_s": round(self.wait_total / done, 3),
+            "wait_max_s": round(self.wait_max, 3),
+            "run_avg_s": round(self.run_total / done, 3),
+            "run_max_s": round(self.run_max, 3),
+        }
+
+
+@dataclass
+class _Active:
+    name: str
+    submitted: float
+    started: Optional[float] = None
+
+
+@dataclass
+class _State:
+    executor: Optional[ProcessPoolExecutor] = None
+    running: Optional[asyncio.Semaphore] = None
+    waiting: int = 0
+    active: Dict[int, _Active] = field(default_factory=dict)
+    jobs: Dict[str, _JobStats] = field(default_factory=dict)
+    restarts: int = 0
+
+
+class CpuPool:
+    _state = _State()
+    _ids = itertools.count(1)
+
+    @staticmethod
+    def _new_executor() -> ProcessPoolExecutor:
+        # fork는 부모의 이벤트 루프/Mongo 클라이언트 상태까지 복제하므로 spawn을 쓴다
+        return ProcessPoolExecutor(
+            max_workers=settings.CPU_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    @classmethod
+    def init_pool(cls) -> None:
+        if cls._state.executor is not None:
+            return
+        cls._state.executor = cls._new_executor()
+        cls._state.running = asyncio.Semaphore(settings.CPU_POOL_WORKERS)
+
+    @classmethod
+    def _replace_broken(cls, broken: ProcessPoolExecutor) -> None:
+        """깨진 풀을 새 풀로 바꾼다. 같은 풀에서 동시에 실패한 작업들이 한 번만 바꾸도록 비교한다."""
+        st = cls._state
+        if st.executor is not broken:
+            return
+        broken.shutdown(wait=False, cancel_futures=True)
+        st.executor = cls._new_executor()
+        st.restarts += 1
+        logger.warning("CPU 작업 풀 워커가 비정상 종료되어 풀을 다시 만들었습니다 (%d회째)", st.restarts)
+
+    @classmethod
+    def close_pool(cls) -> None:
+        if cls._state.executor is not None:
+            cls._state.executor.shutdown(wait=False, cancel_futures=True)
+            cls._state.executor = None
+            cls._state.running = None
+
+    @classmethod
+    async def run(cls, name: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """fn(*args)를 풀에서 실행하고 결과를 돌려준다. name은 지표 집계 키."""
+        st = cls._state
+        if st.executor is None:
+            # lifespan 밖(스크립트 등)에서 호출된 경우 대비
+            cls.init_pool()
+        if st.waiting >= settings.CPU_POOL_MAX_QUEUE:
+            raise CpuPoolBusy("처리 대기 중인 작업이 많습니다. 잠시 후 다시 시도해주세요.")
+
+        job_id = next(cls._ids)
+        job = _Active(name=name, submitted=time.monotonic())
+        st.active[job_id] = job
+        stats = st.jobs.setdefault(name, _JobStats())
+        st.waiting += 1
+        try:
+            try:
+                await st.running.acquire()
+            finally:
+                st.waiting -= 1
+            executor = st.executor
+            try:
+                job.started = time.monotonic()
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(executor, fn, *args)
+            except BrokenProcessPool:
+                stats.errors += 1
+                cls._replace_broken(executor)
+                raise CpuWorkerCrashed(
+                    "처리 중 작업 프로세스가 비정상 종료되었습니다. 파일 크기를 확인하고 잠시 후 다시 시도해주세요."
+                ) from None
+            except Exception:
+                stats.errors += 1
+                raise
+            finally:
+                st.running.release()
+                wait = job.started - job.submitted
+                run = time.monotonic() - job.started
+                stats.count += 1
+                stats.wait_total += wait
+                stats.wait_max = max(stats.wait_max, wait)
+                stats.run_total += run
+                stats.run_max = max(stats.run_max, run)
+                if run > settings.CPU_POOL_SLOW_JOB_SECONDS:
+                    logger.info("CPU 작업 %s: 대기 %.2fs, 실행 %.2fs", name, wait, run)
+        finally:
+            st.active.pop(job_id, None)
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        st = cls._state
+        now = time.monotonic()
+        return {
+            "workers": settings.CPU_POOL_WORKERS,
+            "max_queue": settings.CPU_POOL_MAX_QUEUE,
+            "queued": st.waiting,
+            "running": sum(1 for j in st.active.values() if j.started is not None),
+            "restarts": st.restarts,
+            "active": [
+                {
+                    "name": j.name,
+                    "state": "running" if j.started is not None else "queued",
+                    "elapsed_s": round(now - j.submitted, 3),
+                }
+                for j in st.active.values()
+            ],
+            "jobs": {name: s.as_dict() for name, s in st.jobs.items()},
+        }
@@ -0,0 +1,66 @@
+"""프로세스 전역 httpx.AsyncClient (커넥션 풀 + keep-alive).
+
+Jira 검색/이슈 조회, 첨부파일 다운로드, Pilot 전달처럼 같은 호스트로 반복 요청하는
+경로에서 매 호출마다 TCP/TLS 연결을 새로 맺지 않도록 하나의 클라이언트를 공유한다.
+MongoClientManager와 같은 방식으로 lifespan에서 init/close 한다.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClientManager:
+    _client: Optional[httpx.AsyncClient] = None
+
+    @staticmethod
+    def _http2_available() -> bool:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    @classmethod
+    def init_client(cls) -> None:
+        """
+        앱 시작 시 한 번만 호출해서 공유 클라이언트 생성.
+        """
+        if cls._client is not None:
+            return
+        http2 = settings.HTTP_CLIENT_HTTP2
+        if http2 and not cls._http2_available():
+            logger.warning("HTTP_CLIENT_HTTP2=true 이지만 h2 패키지가 없어 HTTP/1.1로 동작합니다.")
+            http2 = False
+        cls._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.HTTP_CLIENT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE,
+                keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+            ),
+            http2=http2,
+        )
+
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """
+        어디서든 공유 클라이언트가 필요할 때 호출.
+        """
+        if cls._client is None or cls._client.is_closed:
+            # lifespan 밖(스크립트 등)에서 호출된 경우 대비
+            cls._client = None
+            cls.init_client()
+        return cls._client
+
+    @classmethod
+    async def close_client(cls) -> None:
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
@@ -34,12 +34,18 @@ def create_access_token(subject: str, expires_delta: Optional[timedelta] = None)
     return encoded_jwt
 
 
-def decode_token(token: str) -> Optional[str]:
+def decode_token_claims(token: str) -> Optional[dict]:
     try:
-        payload = jwt.decode(
+        return jwt.decode(
             token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
         )
-        email: str = payload.get("sub")
-        return email
     except JWTError:
         return None
+
+
+def decode_token(token: str) -> Optional[str]:
+    payload = decode_token_claims(token)
+    if payload is None:
+        return None
+    email: str = payload.get("sub")
+    return email
@@ -0,0 +1,14 @@
+"""감사 로그 원천(이력) 컬렉션 MongoDB 인덱스 초기화."""
+from app.db.mongo import MongoClientManager
+
+
+async def create_audit_indexes() -> None:
+    db = MongoClientManager.get_db()
+    for col_name in MongoClientManager.AUDIT_LOG_COLLECTIONS.values():
+        col = db[col_name]
+        # /admin/audit-log 컬렉션별 정렬 + keyset 페이지네이션 (changed_at desc, _id desc)
+        await col.create_index([("changed_at", -1), ("_id", -1)])
+        # 액션 필터
+        await col.create_index([("action", 1), ("changed_at", -1), ("_id", -1)])
+        # 수행자 필터 (distinct + $in)
+        await col.create_index([("changed_by", 1), ("changed_at", -1), ("_id", -1)])
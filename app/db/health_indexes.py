@@ -0,0 +1,15 @@
+"""서버 점검 보고서 / 호스트별 사용률 시계열 MongoDB 인덱스 초기화."""
+from app.db.mongo import MongoClientManager
+
+
+async def create_health_indexes() -> None:
+    db = MongoClientManager.get_db()
+
+    reports = db[MongoClientManager.HEALTH_REPORTS]
+    await reports.create_index("report_date")
+
+    metrics = db[MongoClientManager.HEALTH_METRICS]
+    # 호스트 추이 조회 + 업로드 시 upsert 키
+    await metrics.create_index([("host", 1), ("report_date", 1)], unique=True)
+    # 보고서 재업로드/삭제 시 해당 보고일 교체
+    await metrics.create_index("report_date")
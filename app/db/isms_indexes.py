@@ -0,0 +1,29 @@
+"""ISMS-P 컬렉션 MongoDB 인덱스 초기화."""
+from app.db.mongo import MongoClientManager
+from app.services.isms_vuln_import import NATURAL_KEY_FIELD
+
+
+async def create_isms_indexes() -> None:
+    col = MongoClientManager.get_isms_vulnerabilities_collection()
+    await col.create_index("source_sheet")
+    await col.create_index("risk_level")
+    await col.create_index("control_status")
+    # 담당자별 통계 / 조치 진행률 $match 및 목록 필터
+    await col.create_index([("assignee", 1), ("control_status", 1)])
+    await col.create_index([("planned_date", 1), ("control_status", 1)])
+    await col.create_index([("ip_address", 1), ("assignee", 1)])
+    # 가져오기 upsert 키. 예전 데이터의 중복 레코드는 키가 없으므로(backfill_natural_keys) partial
+    await col.create_index(
+        NATURAL_KEY_FIELD,
+        unique=True,
+        partialFilterExpression={NATURAL_KEY_FIELD: {"$type": "string"}},
+    )
+    # 가져오기 시 이미지 매칭용 자연키
+    await col.create_index([("check_code", 1), ("hostname", 1), ("check_date", 1)])
+
+    await MongoClientManager.get_isms_import_logs_collection().create_index("created_at")
+    # 롤백용 역패치 청크 — 가져오기 이력 하나의 청크를 순서대로 읽는다
+    await MongoClientManager.get_isms_import_patches_collection().create_index(
+        [("log_id", 1), ("seq", 1)], unique=True,
+    )
+    await MongoClientManager.get_isms_import_jobs_collection().create_index("created_at")
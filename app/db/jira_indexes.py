@@ -0,0 +1,16 @@
+"""Jira 이슈 미러(jira_issues)·담당자 디렉터리 MongoDB 인덱스 초기화."""
+from app.db.mongo import MongoClientManager
+
+
+async def create_jira_indexes() -> None:
+    col = MongoClientManager.get_jira_issues_collection()
+    # _id = issue key
+    await col.create_index("updated_at")
+    await col.create_index("created_at")
+    await col.create_index("due_day")
+    await col.create_index([("assignee_name", 1), ("updated_at", 1)])
+    await col.create_index([("assignee_account_id", 1), ("updated_at", 1)])
+    await col.create_index("run_id")
+
+    # _id = 담당자 표시 이름
+    await MongoClientManager.get_jira_assignees_collection().create_index("last_seen")
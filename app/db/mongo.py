@@ -31,6 +31,9 @@ class MongoClientManager:
         "VMware":      (ASSETS_VMWARE,   ASSETS_VMWARE_HISTORY),
     }
     PILOT_POLL_STATE = "pilot_poll_state"
+    JIRA_ISSUES = "jira_issues"
+    JIRA_SYNC_STATE = "jira_sync_state"
+    JIRA_ASSIGNEES = "jira_assignees"
     DELAYED_DIGEST_STATE = "delayed_digest_state"
     INSPECTION_CHECKLISTS = "inspection_checklists"
     INSPECTION_HISTORY = "inspection_history"
@@ -51,10 +54,30 @@ class MongoClientManager:
     ACTIVITY_LOGS = "activity_logs"
     HEALTH_REPORTS = "health_reports"
     HEALTH_ACTIONS = "health_report_actions"
+    HEALTH_METRICS = "health_report_metrics"
     APP_SETTINGS = "app_settings"
     LINKS = "links"
     DDAYS = "ddays"
     ENV_CATEGORIES = "env_categories"
+    DOCUMENT_TEXT_CHUNKS = "document_text_chunks"
+
+    # 감사 로그(/admin/audit-log) 카테고리 → 이력 컬렉션
+    # 순서는 changed_at이 같은 항목끼리의 정렬 순서로도 쓰이므로 바꾸면 기존 커서가 어긋난다
+    AUDIT_LOG_COLLECTIONS: dict = {
+        "서버": ASSETS_SERVER_HISTORY,
+        "네트워크": ASSETS_NETWORK_HISTORY,
+        "정보보호시스템": ASSETS_SECURITY_HISTORY,
+        "DBMS": ASSETS_DBMS_HISTORY,
+        "VMware": ASSETS_VMWARE_HISTORY,
+        "작업계획서": JOB_PLANS_HISTORY,
+        "작업계획서(서비스외)": JOB_NON_SERVICE_PLANS_HISTORY,
+        "작업결과서": JOB_RESULTS_HISTORY,
+        "서버실 점검": INSPECTION_HISTORY,
+        "당직": WATCH_HISTORY,
+        "로그인": AUTH_LOGS,
+        "활동": ACTIVITY_LOGS,
+    }
+    AUDIT_LOG_ASSET_CATEGORIES = ("서버", "네트워크", "정보보호시스템", "DBMS", "VMware")
 
     # ── Service Request (SR) ─────────────────────────────────────
     SERVICE_REQUESTS        = "service_requests"
@@ -80,10 +103,15 @@ class MongoClientManager:
     PM_ISSUE_HISTORY = "pm_issue_history"
     PM_WEEKLY_REPORTS = "pm_weekly_reports"
     PM_MONTHLY_REPORTS = "pm_monthly_reports"
+    PM_PERIOD_ROLLUP = "pm_period_rollup"
+    PM_ROLLUP_TOMBSTONES = "pm_rollup_tombstones"
 
     # ── ISMS-P 취약점 관리 ────────────────────────────────────────
     ISMS_VULNERABILITIES = "isms_vulnerabilities"
     ISMS_IMPORT_LOGS = "isms_import_logs"
+    ISMS_IMPORT_JOBS = "isms_import_jobs"
+    ISMS_IMPORT_PATCHES = "isms_import_patches"
+    ISMS_VULN_SUMMARY = "isms_vuln_summary"
 
 
     @classmethod
@@ -149,6 +177,18 @@ class MongoClientManager:
     def get_pilot_poll_state_collection(cls):
         return cls.get_db()[cls.PILOT_POLL_STATE]
 
+    @classmethod
+    def get_jira_issues_collection(cls):
+        return cls.get_db()[cls.JIRA_ISSUES]
+
+    @classmethod
+    def get_jira_sync_state_collection(cls):
+        return cls.get_db()[cls.JIRA_SYNC_STATE]
+
+    @classmethod
+    def get_jira_assignees_collection(cls):
+        return cls.get_db()[cls.JIRA_ASSIGNEES]
+
     @classmethod
     def get_delayed_digest_state_collection(cls):
         return cls.get_db()[cls.DELAYED_DIGEST_STATE]
@@ -278,6 +318,14 @@ class MongoClientManager:
     def get_pm_monthly_reports_collection(cls):
         return cls.get_db()[cls.PM_MONTHLY_REPORTS]
 
+    @classmethod
+    def get_pm_period_rollup_collection(cls):
+        return cls.get_db()[cls.PM_PERIOD_ROLLUP]
+
+    @classmethod
+    def get_pm_rollup_tombstones_collection(cls):
+        return cls.get_db()[cls.PM_ROLLUP_TOMBSTONES]
+
     # ── ISMS-P 컬렉션 접근자 ─────────────────────────────────────
     @classmethod
     def get_isms_vulnerabilities_collection(cls):
@@ -287,6 +335,18 @@ class MongoClientManager:
     def get_isms_import_logs_collection(cls):
         return cls.get_db()[cls.ISMS_IMPORT_LOGS]
 
+    @classmethod
+    def get_isms_import_jobs_collection(cls):
+        return cls.get_db()[cls.ISMS_IMPORT_JOBS]
+
+    @classmethod
+    def get_isms_import_patches_collection(cls):
+        return cls.get_db()[cls.ISMS_IMPORT_PATCHES]
+
+    @classmethod
+    def get_isms_vuln_summary_collection(cls):
+        return cls.get_db()[cls.ISMS_VULN_SUMMARY]
+
     @classmethod
     async def close_client(cls) -> None:
         if cls._client is not None:
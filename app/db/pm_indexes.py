@@ -37,3 +37,10 @@ async def create_pm_indexes() -> None:
 
     await db[MongoClientManager.PM_ISSUE_COMMENTS].create_index("issue_id")
     await db[MongoClientManager.PM_ISSUE_HISTORY].create_index("issue_id")
+
+    # 기간 롤업: 보고서 집계는 주차 목록으로 조회
+    await db[MongoClientManager.PM_PERIOD_ROLLUP].create_index("week")
+    # 롤업 삭제 기록: 재구축 중 삭제분 재반영용 — 재구축 한 번보다 충분히 길게 보관
+    await db[MongoClientManager.PM_ROLLUP_TOMBSTONES].create_index(
+        "deleted_at", expireAfterSeconds=7 * 24 * 3600
+    )
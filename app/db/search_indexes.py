@@ -0,0 +1,57 @@
+"""검색 토큰(search_tokens) 인덱스 초기화 및 기존 문서 채우기."""
+from __future__ import annotations
+
+import logging
+from typing import List, Mapping, Tuple
+
+from pymongo import UpdateOne
+
+from app.db.mongo import MongoClientManager
+from app.utils.search_tokens import (
+    ASSET_SEARCH_FIELDS, DOCUMENT_SEARCH_FIELDS, SEARCH_FIELD, SEARCH_VERSION,
+    SEARCH_VERSION_FIELD, SR_SEARCH_FIELDS, search_fields,
+)
+
+logger = logging.getLogger(__name__)
+
+_BATCH = 500
+
+
+def _targets() -> List[Tuple[str, Mapping[str, str]]]:
+    targets = [(MongoClientManager.SERVICE_REQUESTS, SR_SEARCH_FIELDS)]
+    for col_name, _hist in MongoClientManager.CATEGORY_COLLECTIONS.values():
+        targets.append((col_name, ASSET_SEARCH_FIELDS))
+    targets.append(("document_files", DOCUMENT_SEARCH_FIELDS))
+    return targets
+
+
+async def create_search_indexes() -> None:
+    db = MongoClientManager.get_db()
+    for col_name, _spec in _targets():
+        await db[col_name].create_index(SEARCH_FIELD)
+
+    # 문서 본문 역색인 (app/services/document_index.py)
+    chunks = db[MongoClientManager.DOCUMENT_TEXT_CHUNKS]
+    await chunks.create_index("grams")
+    await chunks.create_index([("file_id", 1), ("seq", 1)])
+
+
+async def backfill_search_tokens() -> None:
+    """토큰이 없거나 버전이 다른 문서에 search_tokens를 채운다. 멱등."""
+    db = MongoClientManager.get_db()
+    for col_name, spec in _targets():
+        col = db[col_name]
+        projection = {field: 1 for field in spec.values()}
+        ops: list = []
+        updated = 0
+        async for doc in col.find({SEARCH_VERSION_FIELD: {"$ne": SEARCH_VERSION}}, projection):
+            ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": search_fields(doc, spec)}))
+            if len(ops) >= _BATCH:
+                await col.bulk_write(ops, ordered=False)
+                updated += len(ops)
+                ops = []
+        if ops:
+            await col.bulk_write(ops, ordered=False)
+            updated += len(ops)
+        if updated:
+            logger.info("%s 검색 토큰 채움: %d건", col_name, updated)
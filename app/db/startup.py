@@ -612,3 +612,34 @@ async def run_startup() -> None:
     from app.db.notification_indexes import create_notification_indexes
     await create_notification_indexes()
     logger.info("알림 인덱스 생성 완료")
+
+    from app.db.isms_indexes import create_isms_indexes
+    from app.services.isms_vuln_import import backfill_natural_keys
+    await create_isms_indexes()
+    await backfill_natural_keys()
+    logger.info("ISMS-P 인덱스 생성 완료")
+
+    from app.services.isms_import_jobs import fail_interrupted_jobs
+    await fail_interrupted_jobs()
+
+    from app.db.audit_indexes import create_audit_indexes
+    await create_audit_indexes()
+    logger.info("감사 로그 인덱스 생성 완료")
+
+    from app.db.jira_indexes import create_jira_indexes
+    await create_jira_indexes()
+    logger.info("Jira 미러 인덱스 생성 완료")
+
+    from app.db.search_indexes import backfill_search_tokens, create_search_indexes
+    await create_search_indexes()
+    await backfill_search_tokens()
+    logger.info("검색 토큰 인덱스 생성 완료")
+
+    from app.services.document_index import backfill_document_index_soon
+    backfill_document_index_soon()
+
+    from app.db.health_indexes import create_health_indexes
+    from app.services.health_metrics import backfill_metrics
+    await create_health_indexes()
+    await backfill_metrics()
+    logger.info("서버 점검 시계열 인덱스 생성 완료")
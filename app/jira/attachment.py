@@ -1,50 +1,108 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import os
-import subprocess
 import tempfile
-from typing import Optional
+from typing import AsyncIterator, List, Optional, Tuple
 
-import httpx
+from app.core.config import settings
+from app.core.http_client import HttpClientManager
+from app.utils.ttl_cache import AsyncTtlCache
 
 logger = logging.getLogger(__name__)
 
 SUPPORTED_EXTENSIONS = {"hwp", "txt", "md"}
 
+# Jira attachment id는 내용이 바뀌지 않으므로 id → 추출 텍스트, 내용 해시 → 추출 텍스트를
+# 함께 캐시해 같은 첨부파일을 다시 다운로드하거나 같은 내용을 다시 변환하지 않는다.
+# 동시에 같은 첨부파일을 요청하면 하나의 다운로드/변환으로 합쳐진다.
+# 변환 실패(hwp5txt 시간 초과/오류/미설치)는 ExtractionFailed로 던져 캐시에 남기지 않는다 —
+# 일시적인 실패가 TTL 동안 그 첨부파일의 본문을 가리지 않도록.
+_text_cache = AsyncTtlCache(
+    ttl=settings.ATTACHMENT_CACHE_TTL,
+    max_bytes=settings.ATTACHMENT_CACHE_MAX_BYTES,
+    sizeof=lambda text: len(text.encode("utf-8")) if text else 1,
+)
 
-async def _download(url: str, auth: tuple) -> bytes:
-    async with httpx.AsyncClient(timeout=60.0, auth=auth, follow_redirects=True) as client:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        return resp.content
+
+def text_cache_stats() -> dict:
+    return _text_cache.stats()
+
+
+class AttachmentTooLarge(ValueError):
+    pass
 
 
-def _extract_hwp(data: bytes) -> Optional[str]:
-    tmp_path = None
+class ExtractionFailed(RuntimeError):
+    pass
+
+
+async def _download(url: str, auth: tuple, dest: str) -> str:
+    """url을 dest 파일로 스트리밍 저장하고 sha256 hex를 반환. 크기 제한 초과 시 AttachmentTooLarge."""
+    limit = settings.ATTACHMENT_MAX_BYTES
+    digest = hashlib.sha256()
+    received = 0
+    client = HttpClientManager.get_client()
+    async with client.stream("GET", url, auth=auth, follow_redirects=True, timeout=60.0) as resp:
+        resp.raise_for_status()
+        declared = resp.headers.get("Content-Length")
+        if declared and declared.isdigit() and int(declared) > limit:
+            raise AttachmentTooLarge(f"{declared} bytes > {limit}")
+        with open(dest, "wb") as f:
+            async for chunk in resp.aiter_bytes():
+                received += len(chunk)
+                if received > limit:
+                    raise AttachmentTooLarge(f"> {limit} bytes")
+                digest.update(chunk)
+                f.write(chunk)
+    return digest.hexdigest()
+
+
+async def _extract_hwp(path: str) -> str:
     try:
-        with tempfile.NamedTemporaryFile(suffix=".hwp", delete=False) as f:
-            f.write(data)
-            tmp_path = f.name
-
-        result = subprocess.run(
-            ["hwp5txt", tmp_path],
-            capture_output=True,
-            text=True,
-            timeout=30,
+        proc = await asyncio.create_subprocess_exec(
+            "hwp5txt", path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-        if result.returncode == 0:
-            return result.stdout.strip()
-        logger.warning("[Attachment] hwp5txt failed: %s", result.stderr[:200])
-        return None
     except FileNotFoundError:
-        logger.warning("[Attachment] hwp5txt not found — pyhwp 미설치")
-        return None
+        raise ExtractionFailed("hwp5txt not found — pyhwp 미설치")
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise ExtractionFailed("hwp5txt timeout")
+    if proc.returncode == 0:
+        return stdout.decode("utf-8", errors="replace").strip()
+    raise ExtractionFailed(f"hwp5txt failed: {stderr.decode('utf-8', errors='replace')[:200]}")
+
+
+async def _extract_file(path: str, ext: str) -> str:
+    """추출한 텍스트. 실패하면 ExtractionFailed (캐시하지 않는다)."""
+    try:
+        if ext == "hwp":
+            return await _extract_hwp(path)
+        with open(path, "rb") as f:
+            return f.read().decode("utf-8", errors="replace")
+    except ExtractionFailed:
+        raise
     except Exception as e:
-        logger.warning("[Attachment] HWP 추출 실패: %s", e)
-        return None
+        raise ExtractionFailed(str(e)) from e
+
+
+async def _download_and_extract(url: str, ext: str, auth: tuple) -> str:
+    fd, tmp_path = tempfile.mkstemp(suffix=f".{ext}")
+    os.close(fd)
+    try:
+        digest = await _download(url, auth, tmp_path)
+        return await _text_cache.get_or_load(
+            ("sha256", digest), lambda: _extract_file(tmp_path, ext)
+        )
     finally:
-        if tmp_path and os.path.exists(tmp_path):
+        if os.path.exists(tmp_path):
             os.unlink(tmp_path)
 
 
@@ -60,18 +118,50 @@ async def extract_text_from_attachment(attachment: dict, auth: tuple) -> Optiona
         logger.info("[Attachment] 지원하지 않는 형식 건너뜀: %s", filename)
         return None
 
+    size = attachment.get("size")
+    if isinstance(size, int) and size > settings.ATTACHMENT_MAX_BYTES:
+        logger.info("[Attachment] 크기 제한 초과로 건너뜀: %s (%d bytes)", filename, size)
+        return None
+
+    cache_key: Tuple[str, str] = ("attachment", str(attachment.get("id") or content_url))
     try:
-        data = await _download(content_url, auth)
+        text = await _text_cache.get_or_load(
+            cache_key, lambda: _download_and_extract(content_url, ext, auth)
+        )
+    except AttachmentTooLarge as e:
+        logger.info("[Attachment] 크기 제한 초과로 건너뜀: %s (%s)", filename, e)
+        return None
+    except ExtractionFailed as e:
+        logger.warning("[Attachment] 텍스트 추출 실패 (%s): %s", filename, e)
+        return None
     except Exception as e:
         logger.warning("[Attachment] 다운로드 실패 (%s): %s", filename, e)
         return None
 
-    if ext == "hwp":
-        text = _extract_hwp(data)
-    else:
-        text = data.decode("utf-8", errors="replace")
-
     if not text:
         return None
 
     return f"[첨부파일: {filename}]\n{text}"
+
+
+async def iter_attachment_texts(
+    attachments: List[dict],
+    auth: tuple,
+    concurrency: Optional[int] = None,
+) -> AsyncIterator[Tuple[dict, Optional[str]]]:
+    """첨부파일들을 최대 concurrency개씩 동시에 다운로드/추출하고 끝나는 순서대로 (attachment, text)를 낸다."""
+    sem = asyncio.Semaphore(max(concurrency or settings.ATTACHMENT_EXTRACT_CONCURRENCY, 1))
+
+    async def run(att: dict) -> Tuple[dict, Optional[str]]:
+        async with sem:
+            return att, await extract_text_from_attachment(att, auth)
+
+    tasks = [asyncio.create_task(run(att)) for att in attachments]
+    try:
+        for fut in asyncio.as_completed(tasks):
+            yield await fut
+    finally:
+        # 클라이언트가 스트림 도중 끊으면 남은 작업 취소
+        for t in tasks:
+            if not t.done():
+                t.cancel()
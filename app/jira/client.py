@@ -1,9 +1,22 @@
 from __future__ import annotations
 from typing import Dict, Any, List, Optional
-import httpx
 import asyncio
 
+import httpx
+
 from app.core.config import settings
+from app.core.http_client import HttpClientManager
+from app.jira.rate_limiter import TokenBucket
+
+# 같은 Jira 계정의 rate limit을 공유하므로 모든 JiraClient 인스턴스가 하나의 버킷을 쓴다
+_limiter: TokenBucket | None = None
+
+
+def get_rate_limiter() -> TokenBucket:
+    global _limiter
+    if _limiter is None:
+        _limiter = TokenBucket(settings.JIRA_RATE_LIMIT_PER_SEC)
+    return _limiter
 
 
 class JiraClient:
@@ -12,20 +25,28 @@ class JiraClient:
         base_url: str | None = None,
         email: str | None = None,
         token: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
         self.base_url = base_url or settings.JIRA_BASE_URL
         self.email = email or settings.JIRA_EMAIL
         self.token = token or settings.JIRA_API_TOKEN
+        # 지정하지 않으면 프로세스 전역 풀(HttpClientManager)을 사용
+        self._http_client = http_client
 
     @property
     def auth(self):
         return (self.email, self.token)
 
+    @property
+    def http(self) -> httpx.AsyncClient:
+        return self._http_client or HttpClientManager.get_client()
+
     async def search(
         self, jql: str, fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         url = f"{self.base_url}/rest/api/3/search/jql"  # enhanced search
-        max_results = 100  # per request (Jira allows up to 1000; 100 is a good default)
+        # Jira가 요청 필드 수에 따라 더 적게 돌려줄 수 있으므로 nextPageToken 기준으로만 종료한다
+        max_results = settings.JIRA_SEARCH_PAGE_SIZE
         fields = fields or [
             "summary",
             "status",
@@ -44,44 +65,72 @@ class JiraClient:
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient(
-            timeout=30.0, headers=headers, auth=self.auth
-        ) as client:
-            while True:
-                payload: Dict[str, Any] = {
-                    "jql": jql,
-                    "maxResults": max_results,
-                    "fields": fields,
-                    "fieldsByKeys": False,
-                    # Useful expansion so you can map field IDs <-> names if needed
-                    "expand": "names,schema",
-                }
-                if next_token:
-                    payload["nextPageToken"] = next_token
-
-                r = await client.post(url, json=payload)
-
-                # Handle common errors explicitly
-                if r.status_code == 401:
-                    raise RuntimeError("Jira 인증에 실패했습니다. 이메일/토큰을 확인해주세요.")
-                if r.status_code == 429:
-                    # Respect server backoff if present
-                    retry_after = int(r.headers.get("Retry-After", "2"))
-                    await asyncio.sleep(retry_after)
-                    continue
-                if r.status_code >= 400:
-                    raise RuntimeError(f"Jira 오류 {r.status_code}: {r.text}")
-
-                data = r.json()
-                issues = data.get("issues", [])
-                all_issues.extend(issues)
-
-                # Enhanced search paginates via nextPageToken
-                next_token = data.get("nextPageToken")
-                if not next_token or not issues:
-                    break
+        client = self.http
+        limiter = get_rate_limiter()
+        while True:
+            payload: Dict[str, Any] = {
+                "jql": jql,
+                "maxResults": max_results,
+                "fields": fields,
+                "fieldsByKeys": False,
+                # Useful expansion so you can map field IDs <-> names if needed
+                "expand": "names,schema",
+            }
+            if next_token:
+                payload["nextPageToken"] = next_token
+
+            await limiter.acquire()
+            r = await client.post(
+                url, json=payload, headers=headers, auth=self.auth, timeout=30.0
+            )
+
+            # Handle common errors explicitly
+            if r.status_code == 401:
+                raise RuntimeError("Jira 인증에 실패했습니다. 이메일/토큰을 확인해주세요.")
+            if r.status_code == 429:
+                # Respect server backoff if present — 다른 in-flight 요청도 함께 대기
+                retry_after = int(r.headers.get("Retry-After", "2"))
+                limiter.pause(retry_after)
+                continue
+            if r.status_code >= 400:
+                raise RuntimeError(f"Jira 오류 {r.status_code}: {r.text}")
+
+            data = r.json()
+            issues = data.get("issues", [])
+            all_issues.extend(issues)
+
+            # Enhanced search paginates via nextPageToken
+            next_token = data.get("nextPageToken")
+            if not next_token or not issues:
+                break
         return all_issues
 
+    async def search_many(
+        self,
+        jqls: List[str],
+        fields: Optional[List[str]] = None,
+        concurrency: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """여러 JQL(보통 같은 조건의 날짜 하위 구간)을 동시에 검색해 issue key 기준으로 병합.
+
+        하위 구간 경계가 겹치므로 먼저 나온 항목을 남기고 중복을 제거한다.
+        """
+        if len(jqls) == 1:
+            return await self.search(jqls[0], fields)
+
+        sem = asyncio.Semaphore(concurrency or settings.JIRA_SEARCH_CONCURRENCY)
+
+        async def run(jql: str) -> List[Dict[str, Any]]:
+            async with sem:
+                return await self.search(jql, fields)
+
+        chunks = await asyncio.gather(*(run(j) for j in jqls))
+        merged: Dict[str, Dict[str, Any]] = {}
+        for issues in chunks:
+            for issue in issues:
+                merged.setdefault(issue.get("key"), issue)
+        return list(merged.values())
+
     async def get_issue(
         self, key: str, fields: Optional[List[str]] = None
     ) -> Dict[str, Any]:
@@ -89,13 +138,13 @@ class JiraClient:
         params: Dict[str, Any] = {}
         if fields:
             params["fields"] = ",".join(fields)
-        async with httpx.AsyncClient(timeout=30.0, auth=self.auth) as client:
-            r = await client.get(url, params=params)
-            if r.status_code == 404:
-                raise RuntimeError(f"이슈 {key}를 찾을 수 없습니다.")
-            if r.status_code >= 400:
-                raise RuntimeError(f"Jira 오류 {r.status_code}: {r.text}")
-            return r.json()
+        client = self.http
+        r = await client.get(url, params=params, auth=self.auth, timeout=30.0)
+        if r.status_code == 404:
+            raise RuntimeError(f"이슈 {key}를 찾을 수 없습니다.")
+        if r.status_code >= 400:
+            raise RuntimeError(f"Jira 오류 {r.status_code}: {r.text}")
+        return r.json()
 
     def issue_url(self, key: str) -> str:
         return f"{self.base_url}/browse/{key}"
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List
 
 
@@ -49,6 +49,25 @@ class JqlBuilder:
             order=order,
         )
 
+    def split(self, step: timedelta) -> List["JqlBuilder"]:
+        """[start, end]를 step 길이의 하위 구간 빌더 목록으로 나눈다.
+
+        JQL 날짜 조건은 양 끝을 포함하므로 인접 구간 경계의 이슈는 양쪽에 모두 잡힌다.
+        결과를 합칠 때 issue key로 중복 제거해야 한다.
+        """
+        if self.start is None or self.end is None:
+            raise ValueError("JQL을 나누려면 start/end가 설정되어야 합니다.")
+        if step <= timedelta(0) or self.end - self.start <= step:
+            return [self]
+
+        parts: List[JqlBuilder] = []
+        cursor = self.start
+        while cursor < self.end:
+            nxt = min(cursor + step, self.end)
+            parts.append(self.between(cursor, nxt))
+            cursor = nxt
+        return parts
+
     def build(self) -> str:
         if self.start is None or self.end is None:
             raise ValueError("JQL을 만들려면 start/end가 설정되어야 합니다.")
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """동시에 진행 중인 모든 Jira 요청이 공유하는 토큰 버킷.
+
+    - acquire(): 토큰이 생길 때까지 대기 후 1개 소비
+    - pause(seconds): 429 Retry-After 수신 시 버킷 전체를 seconds 동안 막는다
+      (한 요청이 429를 받으면 다른 in-flight 요청도 같이 물러난다)
+    """
+
+    def __init__(self, rate: float, capacity: int | None = None) -> None:
+        self.rate = max(rate, 0.001)
+        self.capacity = max(capacity or int(rate) or 1, 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        now = time.monotonic()
+        self._blocked_until = max(self._blocked_until, now + seconds)
+        # 대기 후에는 버킷을 비운 상태에서 다시 채워지도록 한다
+        self._tokens = 0.0
+        self._updated = max(self._updated, self._blocked_until)
@@ -31,10 +31,15 @@ from app.routers.isms_p import imports as isms_imports_router
 from app.routers.isms_p import vulnerabilities as isms_vulnerabilities_router
 
 from app.core.config import settings
+from app.core.http_client import HttpClientManager
+from app.core.cpu_pool import CpuPool
 from app.db.mongo import MongoClientManager
 from app.db.startup import run_startup
 from app.services.jira_poller import JiraPollerService
+from app.services.jira_mirror import JiraIssueSyncService
 from app.services.delayed_digest_service import DelayedDigestService
+from app.services.pm.period_rollup import ensure_rollup
+from app.services.user_directory import user_directory
 from app.middleware.activity_logger import ActivityLoggerMiddleware
 
 
@@ -42,6 +47,8 @@ from app.middleware.activity_logger import ActivityLoggerMiddleware
 async def lifespan(app: FastAPI):
     # ---- startup ----
     MongoClientManager.init_client()
+    HttpClientManager.init_client()
+    CpuPool.init_pool()
     await run_startup()
 
     poller = None
@@ -50,6 +57,18 @@ async def lifespan(app: FastAPI):
         poller.start()
         logging.getLogger(__name__).info("JiraPollerService started")
 
+    mirror_sync = None
+    if settings.JIRA_MIRROR_ENABLED:
+        mirror_sync = JiraIssueSyncService()
+        mirror_sync.start()
+        logging.getLogger(__name__).info("JiraIssueSyncService started")
+
+    if settings.USER_DIRECTORY_CHANGE_STREAM:
+        user_directory.start()
+
+    if settings.PM_ROLLUP_ENABLED:
+        await ensure_rollup()
+
     digest_service = None
     if settings.DELAYED_DIGEST_ENABLED:
         digest_service = DelayedDigestService()
@@ -61,8 +80,13 @@ async def lifespan(app: FastAPI):
     # ---- shutdown ----
     if poller:
         poller.stop()
+    if mirror_sync:
+        mirror_sync.stop()
     if digest_service:
         digest_service.stop()
+    user_directory.stop()
+    CpuPool.close_pool()
+    await HttpClientManager.close_client()
     await MongoClientManager.close_client()
 
 
@@ -93,9 +93,30 @@ class ImportResultOut(BaseModel):
     log_id: str
 
 
+class ImportJobProgressOut(BaseModel):
+    phase: str | None = None    # read / write / images
+    done: int = 0
+    total: int = 0
+
+
+class ImportJobOut(BaseModel):
+    id: str
+    status: str                 # queued / running / succeeded / failed
+    filename: str | None = None
+    log_id: str | None = None   # 가져오기 이력 — 실패해도 반영된 만큼 롤백할 수 있다
+    uploader_email: str | None = None
+    progress: ImportJobProgressOut = ImportJobProgressOut()
+    result: ImportResultOut | None = None
+    error: str | None = None
+    created_at: str | None = None
+    started_at: str | None = None
+    finished_at: str | None = None
+
+
 class ImportLogOut(BaseModel):
     id: str
     created_at: str | None = None
+    status: str = "done"        # running / done / failed (failed도 반영된 만큼 롤백 가능)
     records_before: int
     inserted: int
     updated: int
@@ -345,6 +345,7 @@ class SRStats(BaseModel):
     cancelled: int
     urgent_count: int
     by_type: Dict[str, int] = {}
+    by_priority: Dict[str, int] = {}
     by_department: Dict[str, int] = {}
     by_system: Dict[str, int] = {}
     by_assignee: Dict[str, int] = {}
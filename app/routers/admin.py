@@ -1,4 +1,5 @@
 # app/routers/admin.py
+import asyncio
 from datetime import datetime, timezone
 from typing import Any, Optional, Literal
 
@@ -8,7 +9,9 @@ from pydantic import BaseModel, EmailStr
 from app.core.config import settings
 from app.db.mongo import MongoClientManager
 from app.models.user import UserPublic
-from app.routers.auth import get_current_user
+from app.routers.auth import get_current_user, invalidate_principal
+from app.services.audit_log import count_total, matching_actors, merged_page
+from app.services.user_directory import user_directory
 from app.utils.mongo import oid as parse_oid
 
 router = APIRouter()
@@ -117,6 +120,8 @@ async def update_user(
     if update:
         await users.update_one({"_id": _id}, {"$set": update})
         doc = await users.find_one({"_id": _id})
+        invalidate_principal(doc["email"])
+        user_directory.invalidate()
 
     return UserListItem(
         id=str(doc["_id"]),
@@ -201,6 +206,7 @@ async def approve_pending_user(
         "permissions": [],
     }
     result = await users.insert_one(user_doc)
+    user_directory.invalidate()
 
     # ✅ pending 이력 유지: status 업데이트
     await pending.update_one(
@@ -232,6 +238,7 @@ async def block_user(user_id: str, admin: UserPublic = Depends(require_admin)):
         raise HTTPException(status_code=400, detail="관리자 계정은 차단할 수 없습니다.")
     await users.update_one({"_id": _id}, {"$set": {"is_blocked": True}})
     doc = await users.find_one({"_id": _id})
+    invalidate_principal(doc["email"])
     return UserListItem(
         id=str(doc["_id"]), email=doc["email"], full_name=doc.get("full_name"),
         team=doc.get("team"),
@@ -250,6 +257,7 @@ async def unblock_user(user_id: str, admin: UserPublic = Depends(require_admin))
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
     await users.update_one({"_id": _id}, {"$set": {"is_blocked": False}})
     doc = await users.find_one({"_id": _id})
+    invalidate_principal(doc["email"])
     return UserListItem(
         id=str(doc["_id"]), email=doc["email"], full_name=doc.get("full_name"),
         team=doc.get("team"),
@@ -271,8 +279,9 @@ class AuditLogItem(BaseModel):
 
 
 class AuditLogResponse(BaseModel):
-    total: int
+    total: Optional[int] = None
     items: list[AuditLogItem]
+    next_cursor: Optional[str] = None
 
 
 class ActorOption(BaseModel):
@@ -282,10 +291,9 @@ class ActorOption(BaseModel):
 
 @router.get("/audit-log/actors", response_model=list[ActorOption])
 async def get_audit_log_actors(admin: UserPublic = Depends(require_admin)):
-    users = MongoClientManager.get_users_collection()
     options = [
-        ActorOption(email=doc["email"], name=doc.get("full_name") or doc["email"])
-        async for doc in users.find({}, {"email": 1, "full_name": 1})
+        ActorOption(email=email, name=name)
+        for email, name in await user_directory.all_by_email()
     ]
     return sorted(options, key=lambda o: o.name)
 
@@ -313,10 +321,17 @@ def _diff_from_after(after: dict) -> list[dict]:
     return result
 
 
+# page(offset) 조회는 앞쪽 이만큼까지만 — 그 뒤는 next_cursor로 이어서 조회한다
+# (offset은 컬렉션마다 skip+limit건을 읽어야 해서 깊어질수록 느려진다)
+_AUDIT_MAX_OFFSET = 1000
+
+
 @router.get("/audit-log", response_model=AuditLogResponse)
 async def get_audit_log(
     page: int = Query(default=1, ge=1),
-    page_size: int = Query(default=50, ge=1, le=10000),
+    page_size: int = Query(default=50, ge=1, le=500),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 next_cursor — 지정 시 page 무시"),
+    with_total: bool = Query(default=True),
     actor: Optional[str] = Query(default=None),
     action: Optional[str] = Query(default=None),
     category: Optional[str] = Query(default=None),
@@ -325,36 +340,18 @@ async def get_audit_log(
     to_date: Optional[str] = Query(default=None),
     admin: UserPublic = Depends(require_admin),
 ):
-    db = MongoClientManager.get_db()
-    asset_category_map = {
-        "서버": MongoClientManager.ASSETS_SERVER_HISTORY,
-        "네트워크": MongoClientManager.ASSETS_NETWORK_HISTORY,
-        "정보보호시스템": MongoClientManager.ASSETS_SECURITY_HISTORY,
-        "DBMS": MongoClientManager.ASSETS_DBMS_HISTORY,
-        "VMware": MongoClientManager.ASSETS_VMWARE_HISTORY,
-    }
-    category_map = {
-        **asset_category_map,
-        "작업계획서": MongoClientManager.JOB_PLANS_HISTORY,
-        "작업계획서(서비스외)": MongoClientManager.JOB_NON_SERVICE_PLANS_HISTORY,
-        "작업결과서": MongoClientManager.JOB_RESULTS_HISTORY,
-        "서버실 점검": MongoClientManager.INSPECTION_HISTORY,
-        "당직": MongoClientManager.WATCH_HISTORY,
-        "로그인": MongoClientManager.AUTH_LOGS,
-        "활동": MongoClientManager.ACTIVITY_LOGS,
-    }
-
+    category_map = MongoClientManager.AUDIT_LOG_COLLECTIONS
     if category and category in category_map:
-        target_categories = {category: category_map[category]}
+        target_categories = [category]
     elif category_group == "assets":
-        target_categories = asset_category_map
+        target_categories = list(MongoClientManager.AUDIT_LOG_ASSET_CATEGORIES)
     else:
-        target_categories = category_map
+        target_categories = list(category_map)
 
     # 공통 필터 조건
     query: dict = {}
     if actor:
-        query["changed_by"] = {"$regex": actor, "$options": "i"}
+        query["changed_by"] = {"$in": await matching_actors(target_categories, actor)}
     if action:
         query["action"] = action.upper()
     if from_date or to_date:
@@ -365,42 +362,42 @@ async def get_audit_log(
             dt_filter["$lte"] = datetime.fromisoformat(to_date)
         query["changed_at"] = dt_filter
 
-    # Build email→name lookup for display
-    users_col = MongoClientManager.get_users_collection()
-    email_to_name: dict[str, str] = {
-        doc["email"]: doc.get("full_name") or doc["email"]
-        async for doc in users_col.find({}, {"email": 1, "full_name": 1})
-    }
-
-    all_items: list[dict] = []
-    for cat_name, col_name in target_categories.items():
-        col = db[col_name]
-        async for doc in col.find(query):
-            raw_by = doc.get("changed_by", "")
-            all_items.append({
-                "id": str(doc["_id"]),
-                "category": cat_name,
-                "asset_id": str(doc.get("asset_id", "")),
-                "action": doc.get("action", ""),
-                "source": doc.get("source"),
-                "changed_at": doc.get("changed_at"),
-                "changed_by": email_to_name.get(raw_by, raw_by),
-                "diff": doc.get("diff") or (
-                    _diff_from_after(doc.get("after") or {})
-                    if doc.get("action") == "CREATE" and doc.get("after")
-                    else None
-                ),
-            })
-
-    all_items.sort(key=lambda x: x["changed_at"] or datetime.min, reverse=True)
-    total = len(all_items)
-    start = (page - 1) * page_size
-    paged = all_items[start: start + page_size]
-
-    return AuditLogResponse(
-        total=total,
-        items=[AuditLogItem(**item) for item in paged],
-    )
+    # 페이지 조회와 전체 건수(인덱스 count)를 동시에
+    skip = 0 if cursor else (page - 1) * page_size
+    if skip + page_size > _AUDIT_MAX_OFFSET:
+        raise HTTPException(
+            status_code=400,
+            detail=f"page 조회는 앞쪽 {_AUDIT_MAX_OFFSET}건까지만 가능합니다. next_cursor로 이어서 조회하세요.",
+        )
+    page_task = merged_page(target_categories, query, limit=page_size, skip=skip, cursor=cursor)
+    if with_total:
+        (rows, next_cursor), total = await asyncio.gather(
+            page_task, count_total(target_categories, query),
+        )
+    else:
+        (rows, next_cursor), total = await page_task, None
+
+    email_to_name = await user_directory.names_by_email(doc.get("changed_by") for _, doc in rows)
+
+    items: list[AuditLogItem] = []
+    for cat_name, doc in rows:
+        raw_by = doc.get("changed_by", "")
+        items.append(AuditLogItem(
+            id=str(doc["_id"]),
+            category=cat_name,
+            asset_id=str(doc.get("asset_id", "")),
+            action=doc.get("action", ""),
+            source=doc.get("source"),
+            changed_at=doc.get("changed_at"),
+            changed_by=email_to_name.get(raw_by, raw_by),
+            diff=doc.get("diff") or (
+                _diff_from_after(doc.get("after") or {})
+                if doc.get("action") == "CREATE" and doc.get("after")
+                else None
+            ),
+        ))
+
+    return AuditLogResponse(total=total, items=items, next_cursor=next_cursor)
 
 
 class AdminChangePasswordRequest(BaseModel):
@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response,
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from pydantic import BaseModel
 
+from app.core.config import settings
 from app.db.mongo import MongoClientManager
 from app.models.user import UserCreate, UserPublic, Token
 from app.core.security import (
@@ -14,7 +15,10 @@ from app.core.security import (
     verify_password,
     create_access_token,
     decode_token,
+    decode_token_claims,
 )
+from app.utils.ttl_cache import AsyncTtlCache
+
 router = APIRouter()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
@@ -39,6 +43,40 @@ async def authenticate_user(email: str, password: str) -> Optional[dict]:
     return user
 
 
+# 토큰 subject(email) → 사용자 정보. 거의 모든 API가 get_current_user를 거치므로 짧은 TTL 동안
+# users.find_one을 생략한다. 관리자 변경(update_user/block/unblock)은 invalidate_principal()로
+# 즉시 반영되고, 다른 워커 프로세스에서는 TTL 이내에 반영된다.
+_PRINCIPAL_FIELDS = {"email": 1, "full_name": 1, "team": 1, "is_admin": 1, "permissions": 1, "is_blocked": 1}
+_principal_cache = AsyncTtlCache(ttl=settings.AUTH_PRINCIPAL_CACHE_TTL, max_bytes=10_000)
+
+
+def invalidate_principal(email: Optional[str] = None) -> None:
+    """email의 캐시된 사용자 정보를 버린다. email이 없으면 전체."""
+    if email is None:
+        _principal_cache.clear()
+    else:
+        _principal_cache.invalidate(email)
+
+
+def principal_cache_stats() -> dict:
+    return _principal_cache.stats()
+
+
+async def _get_principal(email: str) -> Optional[dict]:
+    users = MongoClientManager.get_users_collection()
+    return await _principal_cache.get_or_load(
+        email, lambda: users.find_one({"email": email}, _PRINCIPAL_FIELDS)
+    )
+
+
+def _refresh_due(claims: dict) -> bool:
+    """마지막 발급(iat) 후 AUTH_TOKEN_REFRESH_INTERVAL이 지났을 때만 재발급."""
+    iat = claims.get("iat")
+    if not isinstance(iat, (int, float)):
+        return True
+    return datetime.now(timezone.utc).timestamp() - iat >= settings.AUTH_TOKEN_REFRESH_INTERVAL
+
+
 async def get_current_user(
     request: Request,
     response: Response,
@@ -47,7 +85,8 @@ async def get_current_user(
     from app.utils.ip import is_internal_ip
     from app.utils.token_expiry import get_expire_minutes
 
-    email = decode_token(token)
+    claims = decode_token_claims(token)
+    email = claims.get("sub") if claims else None
     if email is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -55,7 +94,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = await get_user_by_email(email)
+    user = await _get_principal(email)
     if user is None:
         raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다.")
 
@@ -66,7 +105,9 @@ async def get_current_user(
     # 이렇게 하면 계속 사용 중일 땐 로그인이 유지되고, ACCESS_TOKEN_EXPIRE_MINUTES(내부망) 동안
     # 아무 요청도 없어야만(=안 움직였을 때) 실제로 로그아웃된다.
     # 단, 백그라운드 폴링(X-Background-Poll)은 실제 사용자 활동이 아니므로 연장에서 제외.
-    if internal and not is_background_poll:
+    # 요청마다 새로 서명하지 않고 토큰이 AUTH_TOKEN_REFRESH_INTERVAL보다 오래됐을 때만 재발급한다
+    # (세션 만료가 최대 그 간격만큼 앞당겨질 뿐 동작은 같다).
+    if internal and not is_background_poll and _refresh_due(claims):
         refreshed = create_access_token(
             subject=email,
             expires_delta=timedelta(minutes=await get_expire_minutes(is_external=False)),
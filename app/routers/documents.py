@@ -4,7 +4,6 @@ import io
 import logging
 import mimetypes
 import os
-import re
 import shutil
 import subprocess
 import tempfile
@@ -26,6 +25,8 @@ from app.core.security import decode_token
 from app.utils.html_preview import make_self_contained
 from app.utils.mongo import fmt_dt
 from app.utils.mongo import oid as parse_oid
+from app.services import document_index
+from app.utils.search_tokens import DOCUMENT_SEARCH_FIELDS, SEARCH_EXCLUDE, search_fields
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -33,6 +34,9 @@ router = APIRouter()
 UPLOAD_DIR = Path("/app/uploads/documents")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
+# 목록/메타 응답에는 본문(text_content)과 검색 토큰이 필요 없다
+_META_PROJECTION = {"text_content": 0, **SEARCH_EXCLUDE}
+
 
 def _now() -> datetime:
     return datetime.now(timezone.utc)
@@ -221,20 +225,6 @@ def _lo_convert(src: Path, target_format: str, out_dir: Path) -> Path:
     return out_file
 
 
-def _snippet(text: str, q: str, context: int = 120) -> str:
-    idx = text.lower().find(q.lower())
-    if idx == -1:
-        return text[:context * 2] if text else ""
-    start = max(0, idx - context)
-    end = min(len(text), idx + len(q) + context)
-    s = text[start:end]
-    if start > 0:
-        s = "…" + s
-    if end < len(text):
-        s = s + "…"
-    return s
-
-
 # ── Endpoints ─────────────────────────────────────────────────────────────────
 
 @router.post("/upload")
@@ -284,7 +274,9 @@ async def upload_files(
             "created_at": _now(),
             "created_by": current_user.email,
         }
+        doc.update(search_fields(doc, DOCUMENT_SEARCH_FIELDS))
         result = await db["document_files"].insert_one(doc)
+        await document_index.index_document(result.inserted_id, text_content)
         uploaded.append(str(result.inserted_id))
 
     return {"uploaded": len(uploaded), "ids": uploaded}
@@ -331,7 +323,7 @@ async def list_folders(current_user: UserPublic = Depends(get_current_user)):
 async def list_root_files(current_user: UserPublic = Depends(get_current_user)):
     db = _db()
     files = await db["document_files"].find(
-        {"folder_id": None, "is_deleted": {"$ne": True}}
+        {"folder_id": None, "is_deleted": {"$ne": True}}, _META_PROJECTION
     ).to_list(length=None)
     return [_file_out(f) for f in files]
 
@@ -343,7 +335,7 @@ async def list_files_in_folder(
 ):
     db = _db()
     files = await db["document_files"].find(
-        {"folder_id": folder_id, "is_deleted": {"$ne": True}}
+        {"folder_id": folder_id, "is_deleted": {"$ne": True}}, _META_PROJECTION
     ).to_list(length=None)
     return [_file_out(f) for f in files]
 
@@ -353,22 +345,27 @@ async def search_documents(
     q: str = Query(..., min_length=1),
     current_user: UserPublic = Depends(get_current_user),
 ):
+    """본문/파일명 검색 — 단어는 AND, "따옴표"는 구절. 점수순, 스니펫과 하이라이트 구간 포함."""
     db = _db()
-    pattern = re.compile(re.escape(q), re.IGNORECASE)
+    hits = await document_index.search(q)
+    if not hits:
+        return []
     files = await db["document_files"].find(
-        {
-            "is_deleted": {"$ne": True},
-            "$or": [
-                {"name": pattern},
-                {"text_content": pattern},
-            ],
-        }
-    ).to_list(length=200)
+        {"_id": {"$in": [h["file_id"] for h in hits]}, "is_deleted": {"$ne": True}},
+        _META_PROJECTION,
+    ).to_list(length=None)
+    by_id = {f["_id"]: f for f in files}
 
     results = []
-    for f in files:
+    for h in hits:
+        f = by_id.get(h["file_id"])
+        if f is None:
+            continue
         item = _file_out(f)
-        item["snippet"] = _snippet(f.get("text_content", ""), q)
+        item["snippet"] = h["snippet"]
+        item["highlights"] = h["highlights"]
+        item["offset"] = h["offset"]
+        item["score"] = h["score"]
         results.append(item)
     return results
 
@@ -514,9 +511,11 @@ async def replace_file(
             "size": len(content),
             "updated_at": _now(),
             "updated_by": current_user.email,
+            **search_fields({"name": filename}, DOCUMENT_SEARCH_FIELDS),
         }},
     )
-    updated = await db["document_files"].find_one({"_id": parse_oid(file_id)})
+    await document_index.index_document(parse_oid(file_id), text_content)
+    updated = await db["document_files"].find_one({"_id": parse_oid(file_id)}, _META_PROJECTION)
     return _file_out(updated)
 
 
@@ -534,6 +533,7 @@ async def update_file(
     update: dict = {}
     if "name" in body and body["name"]:
         update["name"] = body["name"]
+        update.update(search_fields(update, DOCUMENT_SEARCH_FIELDS))
     if "folder_id" in body:
         update["folder_id"] = body["folder_id"]  # None 허용 (루트로 이동)
 
@@ -544,7 +544,7 @@ async def update_file(
         {"_id": parse_oid(file_id)},
         {"$set": update},
     )
-    updated = await db["document_files"].find_one({"_id": parse_oid(file_id)})
+    updated = await db["document_files"].find_one({"_id": parse_oid(file_id)}, _META_PROJECTION)
     return _file_out(updated)
 
 
@@ -568,6 +568,7 @@ async def delete_file(
         {"_id": parse_oid(file_id)},
         {"$set": {"is_deleted": True}},
     )
+    await document_index.remove_document(parse_oid(file_id))
     return {"ok": True}
 
 
@@ -630,8 +631,10 @@ async def convert_to_docx(
         "created_at": _now(),
         "created_by": current_user.email,
     }
+    doc.update(search_fields(doc, DOCUMENT_SEARCH_FIELDS))
     result = await db["document_files"].insert_one(doc)
     doc["_id"] = result.inserted_id
+    await document_index.index_document(result.inserted_id, text)
     return _file_out(doc)
 
 
@@ -693,7 +696,8 @@ async def save_edit_content(
         {"_id": parse_oid(file_id)},
         {"$set": {"text_content": new_text, "size": file_path.stat().st_size}},
     )
-    updated = await db["document_files"].find_one({"_id": parse_oid(file_id)})
+    await document_index.index_document(parse_oid(file_id), new_text)
+    updated = await db["document_files"].find_one({"_id": parse_oid(file_id)}, _META_PROJECTION)
     return _file_out(updated)
 
 
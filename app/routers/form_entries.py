@@ -25,6 +25,7 @@ from app.db.mongo import MongoClientManager
 from app.models.form_entry import FormEntryCreate, FormEntryOut, FormEntryPatch
 from app.models.user import UserPublic
 from app.routers.auth import get_current_user
+from app.services.user_directory import user_directory
 from app.utils.mongo import fmt_dt, oid as parse_oid
 
 router = APIRouter()
@@ -962,13 +963,9 @@ async def import_entry_from_file(
     return {"data": extracted, "skipped": skipped, "images": images}
 
 
-async def _email_to_name_map() -> dict[str, str]:
+async def _email_to_name_map(emails) -> dict[str, str]:
     """이메일 → 이름 변환 맵 (full_name 없으면 email 그대로)"""
-    users_col = MongoClientManager.get_users_collection()
-    return {
-        doc["email"]: doc.get("full_name") or doc["email"]
-        async for doc in users_col.find({}, {"email": 1, "full_name": 1})
-    }
+    return await user_directory.names_by_email(emails)
 
 
 def _strip_images(data: Any) -> Any:
@@ -994,7 +991,9 @@ async def list_entries(
         query["is_deleted"] = {"$ne": True}
     docs = [doc async for doc in col.find(query).sort("created_at", -1)]
 
-    name_map = await _email_to_name_map()
+    name_map = await _email_to_name_map(
+        e for doc in docs for e in (doc.get("created_by"), doc.get("updated_by"))
+    )
 
     def resolve(val: str | None) -> str | None:
         if val is None:
@@ -1019,7 +1018,7 @@ async def get_entry(
     if not doc:
         raise HTTPException(status_code=404, detail="찾을 수 없습니다.")
 
-    name_map = await _email_to_name_map()
+    name_map = await _email_to_name_map([doc.get("created_by"), doc.get("updated_by")])
     doc["created_by"] = name_map.get(doc.get("created_by", ""), doc.get("created_by"))
     doc["updated_by"] = name_map.get(doc.get("updated_by", ""), doc.get("updated_by"))
     return _to_out(doc)
@@ -1,4 +1,10 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from app.core.cpu_pool import CpuPool
+from app.jira.attachment import text_cache_stats
+from app.routers.admin import require_admin
+from app.routers.auth import principal_cache_stats
+from app.services.jira_service import search_cache_stats
 
 router = APIRouter()
 
@@ -6,3 +12,13 @@ router = APIRouter()
 @router.get("/", summary="Health check")
 async def health():
     return {"ok": True}
+
+
+@router.get("/metrics", summary="내부 캐시/큐 지표 (관리자)")
+async def metrics(_=Depends(require_admin)):
+    return {
+        "jira_search_cache": search_cache_stats(),
+        "attachment_text_cache": text_cache_stats(),
+        "auth_principal_cache": principal_cache_stats(),
+        "cpu_pool": CpuPool.stats(),
+    }
@@ -1,63 +1,105 @@
 from __future__ import annotations
 
-import os
-import tempfile
-
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
 
 from app.db.mongo import MongoClientManager
-from app.models.isms_vulnerability import ImportLogOut, ImportResultOut, RollbackResultOut
+from app.models.isms_vulnerability import ImportJobOut, ImportLogOut, RollbackResultOut
 from app.models.user import UserPublic
 from app.routers.isms_p.vulnerabilities import require_isms_p
-from app.services.isms_vuln_import import import_all, rollback_import
+from app.services.isms_import_jobs import get_job, submit_import, watch_job
+from app.services.isms_stats import refresh_summary_soon
+from app.services.isms_vuln_import import rollback_import
 from app.utils.mongo import fmt_dt, oid as parse_oid
 
 router = APIRouter()
 
+# 예전 이력 문서에는 롤백용 snapshots 배열이 통째로 들어 있어 요약 필드만 읽는다
+_LOG_SUMMARY_PROJECTION = {
+    "created_at": 1, "status": 1, "records_before": 1, "inserted": 1, "updated": 1, "records_after": 1,
+    "uploader_email": 1, "note": 1, "rolled_back": 1,
+}
+
 
 @router.get("/import-history", response_model=list[ImportLogOut])
 async def list_import_history(current_user: UserPublic = Depends(require_isms_p)):
     col = MongoClientManager.get_isms_import_logs_collection()
-    docs = await col.find({}).sort("_id", -1).to_list(None)
+    docs = await col.find({}, _LOG_SUMMARY_PROJECTION).sort("_id", -1).to_list(None)
     return [
         ImportLogOut(
             id=str(d["_id"]),
             created_at=fmt_dt(d.get("created_at")),
+            status=d.get("status", "done"),
             records_before=d.get("records_before", 0),
             inserted=d.get("inserted", 0),
             updated=d.get("updated", 0),
-            records_after=d.get("records_after", 0),
+            records_after=d.get("records_after") or 0,
             uploader_email=d.get("uploader_email"),
             note=d.get("note"),
             rolled_back=bool(d.get("rolled_back", False)),
-            can_rollback=not d.get("rolled_back", False),
+            can_rollback=not d.get("rolled_back", False) and d.get("status") != "running",
         )
         for d in docs
     ]
 
 
-@router.post("/import", response_model=ImportResultOut)
+def _job_out(d: dict) -> ImportJobOut:
+    return ImportJobOut(
+        id=str(d["_id"]),
+        status=d["status"],
+        filename=d.get("filename"),
+        log_id=str(d["log_id"]) if d.get("log_id") else None,
+        uploader_email=d.get("uploader_email"),
+        progress=d.get("progress") or {},
+        result=d.get("result"),
+        error=d.get("error"),
+        created_at=fmt_dt(d.get("created_at")),
+        started_at=fmt_dt(d.get("started_at")),
+        finished_at=fmt_dt(d.get("finished_at")),
+    )
+
+
+@router.post("/import", response_model=ImportJobOut, status_code=202)
 async def import_excel(
     file: UploadFile = File(...),
     current_user: UserPublic = Depends(require_isms_p),
 ):
+    """가져오기 작업을 등록하고 바로 돌려준다. 진행/결과는 /import-jobs/{id}로 확인."""
     filename = file.filename or ""
     if not filename.lower().endswith((".xlsx", ".xlsm")):
         raise HTTPException(status_code=400, detail="xlsx/xlsm 파일만 업로드할 수 있습니다.")
 
     content = await file.read()
-    fd, tmp_path = tempfile.mkstemp(suffix=".xlsx")
-    try:
-        with os.fdopen(fd, "wb") as f:
-            f.write(content)
-        result = await import_all(tmp_path, actor_email=current_user.email)
-    finally:
-        try:
-            os.remove(tmp_path)
-        except OSError:
-            pass
+    job = await submit_import(content, filename, actor_email=current_user.email)
+    return _job_out(job)
+
+
+@router.get("/import-jobs/{job_id}", response_model=ImportJobOut)
+async def get_import_job(job_id: str, current_user: UserPublic = Depends(require_isms_p)):
+    job = await get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="가져오기 작업을 찾을 수 없습니다.")
+    return _job_out(job)
+
+
+@router.get("/import-jobs/{job_id}/events")
+async def stream_import_job(job_id: str, current_user: UserPublic = Depends(require_isms_p)):
+    """작업 상태를 SSE로 보낸다. 상태가 바뀔 때마다 job 이벤트, 끝나면 연결을 닫는다."""
+    if not await get_job(job_id):
+        raise HTTPException(status_code=404, detail="가져오기 작업을 찾을 수 없습니다.")
+
+    async def events():
+        async for job in watch_job(job_id):
+            if job is None:
+                yield ": keepalive\n\n"
+            else:
+                yield f"event: job\ndata: {_job_out(job).model_dump_json()}\n\n"
 
-    return ImportResultOut(**result)
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.post("/rollback/{log_id}", response_model=RollbackResultOut)
@@ -68,4 +110,5 @@ async def rollback_import_log(log_id: str, current_user: UserPublic = Depends(re
     except ValueError as e:
         status = 404 if str(e) == "가져오기 이력을 찾을 수 없습니다." else 400
         raise HTTPException(status_code=status, detail=str(e))
+    refresh_summary_soon()
     return RollbackResultOut(**result)
@@ -1,122 +1,38 @@
 from __future__ import annotations
 
+import asyncio
 import io
 import os
 import zipfile
-from urllib.parse import quote
 
 from fastapi import APIRouter, Depends
-from fastapi.responses import StreamingResponse
 
 from app.db.mongo import MongoClientManager
 from app.routers.isms_p.vulnerabilities import require_isms_p, UPLOAD_DIR
 from app.models.user import UserPublic
+from app.services.isms_stats import get_summary
+from app.utils.xlsx_stream import (
+    ZIP_MEDIA_TYPE, batched, file_response, header_row, set_column_widths,
+)
 
 router = APIRouter()
 
 
 # ── 통계 ──────────────────────────────────────────────────────────────
+# 세 통계는 하나의 $facet 집계 결과(isms_vuln_summary)를 나눠서 응답한다
 @router.get("/stats")
 async def get_stats(current_user: UserPublic = Depends(require_isms_p)):
-    col = MongoClientManager.get_isms_vulnerabilities_collection()
-    docs = await col.find({}, {"control_status": 1, "risk_level": 1, "asset_type": 1}).to_list(None)
-
-    def _counts(field: str) -> dict:
-        result: dict = {}
-        for d in docs:
-            key = d.get(field) or "미분류"
-            result[key] = result.get(key, 0) + 1
-        return result
-
-    status_counts = _counts("control_status")
-    risk_counts = _counts("risk_level")
-    asset_counts_raw = _counts("asset_type")
-    asset_counts = dict(sorted(asset_counts_raw.items(), key=lambda kv: -kv[1]))
-
-    return {
-        "total": len(docs),
-        "status_counts": status_counts,
-        "asset_counts": asset_counts,
-        "risk_counts": risk_counts,
-    }
+    return (await get_summary())["stats"]
 
 
 @router.get("/assignee-stats")
 async def get_assignee_stats(current_user: UserPublic = Depends(require_isms_p)):
-    col = MongoClientManager.get_isms_vulnerabilities_collection()
-    docs = await col.find(
-        {"assignee": {"$nin": [None, ""]}, "control_status": {"$ne": "양호"}},
-        {"assignee": 1, "action_status": 1, "action_difficulty": 1, "risk_level": 1},
-    ).to_list(None)
-
-    by_assignee: dict[str, dict] = {}
-    for d in docs:
-        a = d.get("assignee")
-        if not a:
-            continue
-        s = by_assignee.setdefault(a, {
-            "total": 0, "completed": 0,
-            "hard_total": 0, "hard_completed": 0,
-            "highrisk_total": 0, "highrisk_completed": 0,
-        })
-        s["total"] += 1
-        is_done = "완료" in (d.get("action_status") or "")
-        if is_done:
-            s["completed"] += 1
-        if d.get("action_difficulty") == "상":
-            s["hard_total"] += 1
-            if is_done:
-                s["hard_completed"] += 1
-        if d.get("risk_level") == "상":
-            s["highrisk_total"] += 1
-            if is_done:
-                s["highrisk_completed"] += 1
-
-    result = []
-    for assignee, s in by_assignee.items():
-        todo = max(0, s["total"] - s["completed"])
-        completion_rate = round(s["completed"] / s["total"] * 100, 1) if s["total"] else 0.0
-        hard_rate = round(s["hard_completed"] / s["hard_total"] * 100, 1) if s["hard_total"] else 0.0
-        result.append({
-            "assignee": assignee,
-            "total": s["total"],
-            "completed": s["completed"],
-            "todo": todo,
-            "completion_rate": completion_rate,
-            "hard_total": s["hard_total"],
-            "hard_completed": s["hard_completed"],
-            "hard_rate": hard_rate,
-            "highrisk_total": s["highrisk_total"],
-            "highrisk_completed": s["highrisk_completed"],
-        })
-    return result
+    return (await get_summary())["assignee_stats"]
 
 
 @router.get("/action-progress")
 async def get_action_progress(current_user: UserPublic = Depends(require_isms_p)):
-    col = MongoClientManager.get_isms_vulnerabilities_collection()
-    docs = await col.find(
-        {"planned_date": {"$nin": [None, ""]}, "control_status": {"$ne": "양호"}},
-        {"planned_date": 1, "action_status": 1},
-    ).to_list(None)
-
-    by_month: dict[str, dict] = {}
-    for d in docs:
-        pd = d.get("planned_date") or ""
-        month = pd[:7]
-        if not month:
-            continue
-        m = by_month.setdefault(month, {"target": 0, "actual": 0})
-        m["target"] += 1
-        if d.get("action_status") == "완료":
-            m["actual"] += 1
-
-    labels = sorted(by_month.keys())
-    return {
-        "labels": labels,
-        "target": [by_month[m]["target"] for m in labels],
-        "actual": [by_month[m]["actual"] for m in labels],
-    }
+    return (await get_summary())["action_progress"]
 
 
 # ── Excel + 이미지 ZIP 내보내기 ──────────────────────────────────────
@@ -152,98 +68,104 @@ _CONTROL_COLORS = {"양호": "C8E6C9", "취약": "FFCCCC", "리뷰": "FFE0B2", "
 @router.get("/export")
 async def export_vulnerabilities(current_user: UserPublic = Depends(require_isms_p)):
     import openpyxl
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.drawing.image import Image as XLImage
     from openpyxl.styles import Alignment, Font, PatternFill
     from openpyxl.utils import get_column_letter
     from PIL import Image as PILImage
 
     col = MongoClientManager.get_isms_vulnerabilities_collection()
-    docs = await col.find({}).sort("_id", 1).to_list(None)
-
-    by_sheet: dict[str, list[dict]] = {}
-    for d in docs:
-        sheet = d.get("source_sheet") or "manual"
-        by_sheet.setdefault(sheet, []).append(d)
 
-    wb = openpyxl.Workbook()
-    wb.remove(wb.active)
+    # 시트는 source_sheet가 처음 나온 순서대로 만들고, 각 시트에 행을 바로 이어 쓴다
+    wb = openpyxl.Workbook(write_only=True)
+    sheets: dict[str, list] = {}  # source_sheet -> [ws, 다음 행 번호]
 
     header_fill = PatternFill("solid", fgColor="1E293B")
     header_font = Font(color="FFFFFF", bold=True)
-
-    for sheet_name, rows in by_sheet.items():
-        safe_title = sheet_name[:31] or "Sheet"
-        ws = wb.create_sheet(title=safe_title)
-
-        for ci, (_, label) in enumerate(_EXPORT_COLUMNS, start=1):
-            cell = ws.cell(row=1, column=ci, value=label)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-            ws.column_dimensions[get_column_letter(ci)].width = 14 if label != "ID" else 10
-
-        for ri, doc in enumerate(rows, start=2):
+    header_align = Alignment(horizontal="center", vertical="center")
+    body_align = Alignment(wrap_text=True, vertical="top")
+    risk_fills = {k: PatternFill("solid", fgColor=v) for k, v in _RISK_COLORS.items()}
+    control_fills = {k: PatternFill("solid", fgColor=v) for k, v in _CONTROL_COLORS.items()}
+
+    def _sheet(name: str) -> list:
+        entry = sheets.get(name)
+        if entry is None:
+            ws = wb.create_sheet(title=name[:31] or "Sheet")
+            set_column_widths(ws, [10 if label == "ID" else 14 for _, label in _EXPORT_COLUMNS])
+            ws.freeze_panes = "A2"
+            ws.auto_filter.ref = f"A1:{get_column_letter(len(_EXPORT_COLUMNS))}1"
+            ws.append(header_row(
+                ws, [label for _, label in _EXPORT_COLUMNS], header_fill, header_font, header_align,
+            ))
+            entry = sheets[name] = [ws, 2]
+        return entry
+
+    def _thumbnail(doc: dict, field: str):
+        files = doc.get("before_files" if field == "before_text" else "after_files") or []
+        if not files:
+            return None
+        file_type = "before" if field == "before_text" else "after"
+        img_path = os.path.join(UPLOAD_DIR, str(doc["_id"]), file_type, files[0]["name"])
+        if not os.path.isfile(img_path):
+            return None
+        try:
+            pil_img = PILImage.open(img_path)
+            w, h = pil_img.size
+            scale = min(200 / w, 150 / h, 1.0)
+            new_w, new_h = int(w * scale), int(h * scale)
+            buf = io.BytesIO()
+            pil_img.convert("RGB").resize((new_w, new_h)).save(buf, format="PNG")
+            buf.seek(0)
+            xl_img = XLImage(buf)
+            xl_img.width, xl_img.height = new_w, new_h
+            return xl_img
+        except Exception:  # noqa: BLE001
+            return None
+
+    def _write_batch(docs: list[dict]) -> None:
+        for doc in docs:
+            entry = _sheet(doc.get("source_sheet") or "manual")
+            ws, ri = entry
             row_height = 15
+            row = []
             for ci, (field, _label) in enumerate(_EXPORT_COLUMNS, start=1):
                 value = str(doc["_id"]) if field == "id" else (doc.get(field) or "")
-                cell = ws.cell(row=ri, column=ci, value=value)
-                cell.alignment = Alignment(wrap_text=True, vertical="top")
-
-                if field == "risk_level" and value in _RISK_COLORS:
-                    cell.fill = PatternFill("solid", fgColor=_RISK_COLORS[value])
-                elif field == "control_status" and value in _CONTROL_COLORS:
-                    cell.fill = PatternFill("solid", fgColor=_CONTROL_COLORS[value])
+                c = WriteOnlyCell(ws, value=value)
+                c.alignment = body_align
+                if field == "risk_level" and value in risk_fills:
+                    c.fill = risk_fills[value]
+                elif field == "control_status" and value in control_fills:
+                    c.fill = control_fills[value]
                 elif field in ("before_text", "after_text"):
-                    files_key = "before_files" if field == "before_text" else "after_files"
-                    files = doc.get(files_key) or []
-                    if files:
-                        vuln_id = str(doc["_id"])
-                        file_type = "before" if field == "before_text" else "after"
-                        img_path = os.path.join(UPLOAD_DIR, vuln_id, file_type, files[0]["name"])
-                        if os.path.isfile(img_path):
-                            try:
-                                pil_img = PILImage.open(img_path)
-                                w, h = pil_img.size
-                                scale = min(200 / w, 150 / h, 1.0)
-                                new_w, new_h = int(w * scale), int(h * scale)
-                                buf = io.BytesIO()
-                                pil_img.convert("RGB").resize((new_w, new_h)).save(buf, format="PNG")
-                                buf.seek(0)
-                                xl_img = XLImage(buf)
-                                xl_img.width, xl_img.height = new_w, new_h
-                                ws.add_image(xl_img, f"{get_column_letter(ci)}{ri}")
-                                row_height = max(row_height, new_h * 0.75)
-                            except Exception:  # noqa: BLE001
-                                pass
-
+                    xl_img = _thumbnail(doc, field)
+                    if xl_img is not None:
+                        ws.add_image(xl_img, f"{get_column_letter(ci)}{ri}")
+                        row_height = max(row_height, xl_img.height * 0.75)
+                row.append(c)
+            # write-only 시트는 행을 쓰는 시점의 row_dimensions를 반영한다
             ws.row_dimensions[ri].height = row_height
-
-        ws.freeze_panes = "A2"
-        ws.auto_filter.ref = f"A1:{get_column_letter(len(_EXPORT_COLUMNS))}1"
-
-    xlsx_buf = io.BytesIO()
-    wb.save(xlsx_buf)
-    xlsx_buf.seek(0)
-
-    zip_buf = io.BytesIO()
-    with zipfile.ZipFile(zip_buf, "w", zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr("취약점관리.xlsx", xlsx_buf.read())
-        if os.path.isdir(UPLOAD_DIR):
-            for vuln_dir in os.listdir(UPLOAD_DIR):
-                vuln_path = os.path.join(UPLOAD_DIR, vuln_dir)
-                if not os.path.isdir(vuln_path):
-                    continue
-                for file_type in ("before", "after"):
-                    type_path = os.path.join(vuln_path, file_type)
-                    if not os.path.isdir(type_path):
+            ws.append(row)
+            entry[1] = ri + 1
+
+    async for docs in batched(col.find({}).sort("_id", 1)):
+        await asyncio.to_thread(_write_batch, docs)
+    if not sheets:
+        _sheet("Sheet")
+
+    def _write_zip(fp) -> None:
+        with zipfile.ZipFile(fp, "w", zipfile.ZIP_DEFLATED) as zf:
+            with zf.open("취약점관리.xlsx", "w", force_zip64=True) as xf:
+                wb.save(xf)
+            if os.path.isdir(UPLOAD_DIR):
+                for vuln_dir in os.listdir(UPLOAD_DIR):
+                    vuln_path = os.path.join(UPLOAD_DIR, vuln_dir)
+                    if not os.path.isdir(vuln_path):
                         continue
-                    for fname in os.listdir(type_path):
-                        zf.write(os.path.join(type_path, fname), f"images/{vuln_dir}/{file_type}/{fname}")
-
-    zip_buf.seek(0)
-    filename = "취약점관리_export.zip"
-    return StreamingResponse(
-        zip_buf,
-        media_type="application/zip",
-        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"},
-    )
+                    for file_type in ("before", "after"):
+                        type_path = os.path.join(vuln_path, file_type)
+                        if not os.path.isdir(type_path):
+                            continue
+                        for fname in os.listdir(type_path):
+                            zf.write(os.path.join(type_path, fname), f"images/{vuln_dir}/{file_type}/{fname}")
+
+    return file_response(_write_zip, "취약점관리_export.zip", ZIP_MEDIA_TYPE)
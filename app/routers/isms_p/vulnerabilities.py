@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 from typing import Optional
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from pymongo.errors import DuplicateKeyError
 
 from app.db.mongo import MongoClientManager
 from app.models.isms_vulnerability import (
@@ -17,6 +18,8 @@ from app.models.isms_vulnerability import (
 )
 from app.models.user import UserPublic
 from app.routers.auth import get_current_user
+from app.services.isms_stats import refresh_summary_soon
+from app.services.isms_vuln_import import NATURAL_KEY_FIELD, natural_key
 from app.utils.mongo import fmt_dt, oid as parse_oid
 
 router = APIRouter()
@@ -163,8 +166,13 @@ async def create_vulnerability(
     doc["source_sheet"] = "manual"
     doc["created_at"] = datetime.now(timezone.utc)
     doc["updated_at"] = None
-    result = await col.insert_one(doc)
+    doc[NATURAL_KEY_FIELD] = natural_key(doc)
+    try:
+        result = await col.insert_one(doc)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="같은 점검코드·호스트명·점검일시의 취약점이 이미 있습니다.")
     doc["_id"] = result.inserted_id
+    refresh_summary_soon()
     return _to_out(doc)
 
 
@@ -219,6 +227,7 @@ async def patch_vulnerability(
             )
             cascade_count = result.modified_count
 
+    refresh_summary_soon()
     return _to_out(doc, cascade_count=cascade_count)
 
 
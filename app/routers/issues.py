@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Query, HTTPException, Depends
+import json
+
+from fastapi import APIRouter, Query, HTTPException, Depends, Request, Response
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 
 from app.models.issue import GroupedResponse
 from app.services.jira_service import JiraTaskService
+from app.services.jira_assignees import assignee_directory
 from app.core.consts import ALLOWED_STATUSES
 from app.jira.client import JiraClient
-from app.jira.attachment import extract_text_from_attachment
+from app.jira.attachment import iter_attachment_texts
 
 router = APIRouter()
 service = JiraTaskService()
@@ -102,38 +106,30 @@ async def today_tasks(
 
 
 @router.get("/assignees", summary="담당자 목록 조회")
-async def get_assignees():
+async def get_assignees(request: Request, response: Response):
     """
-    최근 90일 이슈에서 고유 담당자 목록을 반환합니다.
+    최근 90일 이슈의 고유 담당자 목록을 반환합니다.
+    담당자 디렉터리(jira_assignees)의 메모리 스냅샷에서 응답하며 ETag를 지원합니다.
     """
-    from datetime import timedelta
-    from app.utils.time import TimeUtil
-    import datetime as dt
-
-    end = dt.datetime.now(tz=dt.timezone.utc)
-    start = end - timedelta(days=90)
-    start_str = start.strftime("%Y-%m-%d")
-    end_str = end.strftime("%Y-%m-%d")
-
     try:
-        response = await service.fetch_grouped(
-            start=start_str,
-            end=end_str,
-            assignees=None,
-            date_field="updated",
-        )
-        names = sorted(
-            {g.assignee for g in response.groups if g.assignee and g.assignee != "Unassigned"}
-        )
-        return {"assignees": names}
+        names, etag = await assignee_directory.snapshot()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return {"assignees": names}
 
 
 @router.get("/{issue_key}/attachments", summary="이슈 첨부파일 텍스트 추출")
-async def get_issue_attachments(issue_key: str):
+async def get_issue_attachments(
+    issue_key: str,
+    stream: bool = Query(
+        False, description="true면 추출이 끝나는 순서대로 NDJSON 한 줄씩 스트리밍"
+    ),
+):
     """
-    Jira 이슈의 첨부파일을 다운로드하여 텍스트를 추출해 반환합니다.
+    Jira 이슈의 첨부파일을 동시에 다운로드하여 텍스트를 추출해 반환합니다.
     지원 형식: hwp, txt, md
     """
     try:
@@ -142,10 +138,24 @@ async def get_issue_attachments(issue_key: str):
         raise HTTPException(status_code=404, detail=str(e))
 
     attachments = (issue.get("fields") or {}).get("attachment") or []
-    results = []
-    for att in attachments:
-        text = await extract_text_from_attachment(att, jira_client.auth)
-        if text is not None:
-            results.append({"filename": att.get("filename", ""), "text": text})
+
+    if stream:
+        async def ndjson():
+            async for att, text in iter_attachment_texts(attachments, jira_client.auth):
+                if text is not None:
+                    line = {"filename": att.get("filename", ""), "text": text}
+                    yield json.dumps(line, ensure_ascii=False) + "\n"
+
+        return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+    texts = {}
+    async for att, text in iter_attachment_texts(attachments, jira_client.auth):
+        texts[id(att)] = text
+    # 비스트리밍 응답은 기존처럼 첨부파일 순서를 유지
+    results = [
+        {"filename": att.get("filename", ""), "text": texts[id(att)]}
+        for att in attachments
+        if texts.get(id(att)) is not None
+    ]
 
     return {"issue_key": issue_key, "attachments": results}
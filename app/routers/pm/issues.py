@@ -16,6 +16,7 @@ from app.models.pm.issue import (
 from app.routers.auth import get_current_user
 from app.services.pm.permission import get_issue_or_404, require_pm_member
 from app.services.pm.issue_service import next_issue_number, record_history, enrich_issue
+from app.services.pm.period_rollup import apply_issue_change
 from app.services.notification_service import create_notification
 from app.services.mention_service import resolve_mentions, notify_mentions
 from app.models.mention import MentionedUser
@@ -100,6 +101,7 @@ async def create_issue(
     }
     result = await col.insert_one(doc)
     created = await col.find_one({"_id": result.inserted_id})
+    await apply_issue_change(None, created)
     return await enrich_issue(created)
 
 
@@ -160,6 +162,7 @@ async def patch_issue(
         {"$set": update},
         return_document=True,
     )
+    await apply_issue_change(old, new_doc)
 
     # 모든 변경 필드 이력 기록
     uid = ObjectId(current_user.id)
@@ -251,11 +254,12 @@ async def delete_issue(
 ):
     await require_pm_member(current_user, project_id)
 
-    await get_issue_or_404(project_id, issue_id)
+    old = await get_issue_or_404(project_id, issue_id)
     iid = ObjectId(issue_id)
     await MongoClientManager.get_pm_issue_comments_collection().delete_many({"issue_id": iid})
     await MongoClientManager.get_pm_issue_history_collection().delete_many({"issue_id": iid})
     await MongoClientManager.get_pm_issues_collection().delete_one({"_id": iid})
+    await apply_issue_change(old, None)
 
 
 # ── 댓글 ──────────────────────────────────────────────────────────
@@ -16,6 +16,7 @@ from app.models.pm.reports import (
 )
 from app.routers.auth import get_current_user
 from app.routers.pm.report_agg import aggregate_period
+from app.utils.xlsx_stream import append_rows, header_row, set_column_widths
 from app.routers.pm.weekly_reports import (
     _require_pm, _history_entry, _user_name, _excel_response, _write_items_table,
     STATUS_KO, PRIORITY_KO, STATUS_ISSUE_KO,
@@ -131,35 +132,38 @@ async def export_monthly_list(
     q: dict = {"deleted_at": None}
     if year:  q["report_year"]  = year
     if month: q["report_month"] = month
-    docs = await col.find(q).sort([("report_year", -1), ("report_month", -1)]).to_list(None)
-
-    wb = openpyxl.Workbook()
-    ws = wb.active; ws.title = "월간보고 목록"
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("월간보고 목록")
     hf    = PatternFill("solid", fgColor="2F75B6")
     hfont = Font(color="FFFFFF", bold=True)
 
     headers = ["연도", "월", "부서", "제목", "총", "완료", "진행", "지연", "완료율", "작성자", "작성일"]
-    for ci, h in enumerate(headers, 1):
-        c = ws.cell(1, ci, h); c.fill = hf; c.font = hfont
-        c.alignment = Alignment(horizontal="center")
+    set_column_widths(ws, [16, 16, 16, 40, 16, 16, 16, 16, 16, 16, 16])
+    ws.append(header_row(ws, headers, hf, hfont, Alignment(horizontal="center")))
+
+    async def _with_author(cursor):
+        async for doc in cursor:
+            doc["_author"] = await _user_name(doc.get("created_by")) or ""
+            yield doc
 
-    for ri, doc in enumerate(docs, 2):
+    def _to_row(doc: dict) -> list:
         s = doc.get("stats", {})
-        ws.cell(ri, 1, doc["report_year"])
-        ws.cell(ri, 2, f"{doc['report_month']}월")
-        ws.cell(ri, 3, doc.get("department") or "")
-        ws.cell(ri, 4, doc["title"])
-        ws.cell(ri, 5, s.get("total", 0))
-        ws.cell(ri, 6, s.get("completed", 0))
-        ws.cell(ri, 7, s.get("in_progress", 0))
-        ws.cell(ri, 8, s.get("delayed", 0))
-        ws.cell(ri, 9, f"{s.get('completion_rate', 0)}%")
-        ws.cell(ri, 10, await _user_name(doc.get("created_by")) or "")
-        ws.cell(ri, 11, doc["created_at"].strftime("%Y-%m-%d"))
-
-    for ci in range(1, 12):
-        ws.column_dimensions[openpyxl.utils.get_column_letter(ci)].width = 16
-    ws.column_dimensions["D"].width = 40
+        return [
+            doc["report_year"],
+            f"{doc['report_month']}월",
+            doc.get("department") or "",
+            doc["title"],
+            s.get("total", 0),
+            s.get("completed", 0),
+            s.get("in_progress", 0),
+            s.get("delayed", 0),
+            f"{s.get('completion_rate', 0)}%",
+            doc["_author"],
+            doc["created_at"].strftime("%Y-%m-%d"),
+        ]
+
+    cursor = col.find(q).sort([("report_year", -1), ("report_month", -1)])
+    await append_rows(ws, _with_author(cursor), _to_row)
 
     return _excel_response(wb, f"월간보고목록_{year or '전체'}년.xlsx")
 
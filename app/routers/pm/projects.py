@@ -13,6 +13,7 @@ from app.models.pm.project import (
     ProjectMemberAdd, ProjectMemberOut, ProjectMemberRolePatch,
 )
 from app.routers.auth import get_current_user
+from app.services.pm.period_rollup import remove_project_rollup
 from app.services.pm.permission import require_pm_admin
 
 router = APIRouter()
@@ -156,6 +157,7 @@ async def delete_project(project_id: str, current_user: UserPublic = Depends(get
     await MongoClientManager.get_pm_sprints_collection().delete_many({"project_id": pid})
     await MongoClientManager.get_pm_labels_collection().delete_many({"project_id": pid})
     await MongoClientManager.get_pm_projects_collection().delete_one({"_id": pid})
+    await remove_project_rollup(pid)
 
     # 이 프로젝트를 참조하던 SR 연결 정보 초기화
     sr_col = MongoClientManager.get_db()[MongoClientManager.SERVICE_REQUESTS]
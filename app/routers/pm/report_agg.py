@@ -1,12 +1,15 @@
 """PM 보고서 자동 집계 - 이슈 데이터에서 프로젝트별/개인별 현황을 자동 생성."""
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from bson import ObjectId
 
 from app.db.mongo import MongoClientManager
+from app.services.pm.period_rollup import ISSUE_FIELDS, period_issue_docs
+from app.services.user_directory import user_directory
 from app.models.pm.reports import (
     PersonBreakdown, ProjectBreakdown, ReportStats, WorkItem,
 )
@@ -25,6 +28,69 @@ def _calc_stats(completed, in_progress, delayed=None) -> ReportStats:
     )
 
 
+async def _fetch_by_ids(col, ids: set, projection: Optional[dict] = None) -> dict:
+    if not ids:
+        return {}
+    return {d["_id"]: d async for d in col.find({"_id": {"$in": list(ids)}}, projection)}
+
+
+async def _enrichment_maps(docs: list[dict]) -> dict[str, dict]:
+    """이슈들이 참조하는 프로젝트/조직/스프린트/에픽을 컬렉션마다 $in 한 번으로 가져온다."""
+    issues_col   = MongoClientManager.get_pm_issues_collection()
+    projects_col = MongoClientManager.get_pm_projects_collection()
+    orgs_col     = MongoClientManager.get_pm_organizations_collection()
+    sprints_col  = MongoClientManager.get_pm_sprints_collection()
+
+    project_ids = {d["project_id"] for d in docs if d.get("project_id")}
+    sprint_ids  = {d["sprint_id"] for d in docs if d.get("sprint_id")}
+    epic_ids    = {d["epic_id"] for d in docs if d.get("epic_id")}
+
+    projects, sprints, epics, names = await asyncio.gather(
+        _fetch_by_ids(projects_col, project_ids, {"name": 1, "org_id": 1}),
+        _fetch_by_ids(sprints_col, sprint_ids, {"name": 1}),
+        _fetch_by_ids(issues_col, epic_ids, {"title": 1}),
+        user_directory.names_by_id(d.get("assignee_id") for d in docs),
+    )
+    org_ids = {p["org_id"] for p in projects.values() if p.get("org_id")}
+    orgs = await _fetch_by_ids(orgs_col, org_ids, {"name": 1})
+    return {"projects": projects, "orgs": orgs, "sprints": sprints, "epics": epics, "names": names}
+
+
+def _to_work_item(doc: dict, maps: dict[str, dict], now: datetime) -> Optional[WorkItem]:
+    proj = maps["projects"].get(doc["project_id"])
+    if not proj:
+        return None
+    org = maps["orgs"].get(proj["org_id"]) if proj.get("org_id") else None
+    sprint = maps["sprints"].get(doc["sprint_id"]) if doc.get("sprint_id") else None
+    epic = maps["epics"].get(doc["epic_id"]) if doc.get("epic_id") else None
+    assignee_id = doc.get("assignee_id")
+
+    due_date = doc.get("due_date")
+    status = doc.get("status", "BACKLOG")
+    is_delayed = bool(due_date and due_date.replace(tzinfo=timezone.utc) < now and status != "DONE")
+
+    return WorkItem(
+        issue_id=str(doc["_id"]),
+        issue_number=doc["number"],
+        title=doc["title"],
+        type=doc["type"],
+        project_id=str(proj["_id"]),
+        project_name=proj["name"],
+        org_name=org["name"] if org else None,
+        assignee_id=str(assignee_id) if assignee_id else None,
+        assignee_name=maps["names"].get(str(assignee_id)) if assignee_id else None,
+        status=status,
+        priority=doc.get("priority", "MEDIUM"),
+        epic_title=epic["title"] if epic else None,
+        sprint_name=sprint["name"] if sprint else None,
+        start_date=doc.get("start_date"),
+        due_date=due_date,
+        is_delayed=is_delayed,
+        story_points=doc.get("story_points"),
+        parent_id=str(doc["parent_issue_id"]) if doc.get("parent_issue_id") else None,
+    )
+
+
 async def aggregate_period(
     start_dt: datetime,
     end_dt: datetime,
@@ -38,89 +104,7 @@ async def aggregate_period(
     ReportStats,             # overall stats
 ]:
     now = datetime.now(timezone.utc)
-
-    issues_col   = MongoClientManager.get_pm_issues_collection()
-    projects_col = MongoClientManager.get_pm_projects_collection()
-    orgs_col     = MongoClientManager.get_pm_organizations_collection()
-    users_col    = MongoClientManager.get_users_collection()
-    sprints_col  = MongoClientManager.get_pm_sprints_collection()
-
-    # ── 캐시 ─────────────────────────────────────────────────────────
-    _proj_cache:   dict = {}
-    _org_cache:    dict = {}
-    _user_cache:   dict = {}
-    _sprint_cache: dict = {}
-    _epic_cache:   dict = {}
-
-    async def get_proj(pid):
-        k = str(pid)
-        if k not in _proj_cache:
-            _proj_cache[k] = await projects_col.find_one({"_id": pid})
-        return _proj_cache[k]
-
-    async def get_org(oid):
-        k = str(oid)
-        if k not in _org_cache:
-            _org_cache[k] = await orgs_col.find_one({"_id": oid})
-        return _org_cache[k]
-
-    async def get_user(uid):
-        if not uid:
-            return None
-        k = str(uid)
-        if k not in _user_cache:
-            _user_cache[k] = await users_col.find_one({"_id": uid}, {"full_name": 1, "email": 1})
-        return _user_cache[k]
-
-    async def get_sprint(sid):
-        if not sid:
-            return None
-        k = str(sid)
-        if k not in _sprint_cache:
-            _sprint_cache[k] = await sprints_col.find_one({"_id": sid})
-        return _sprint_cache[k]
-
-    async def get_epic(eid):
-        if not eid:
-            return None
-        k = str(eid)
-        if k not in _epic_cache:
-            _epic_cache[k] = await issues_col.find_one({"_id": eid}, {"title": 1})
-        return _epic_cache[k]
-
-    async def doc_to_item(doc) -> Optional[WorkItem]:
-        proj = await get_proj(doc["project_id"])
-        if not proj:
-            return None
-        org = await get_org(proj["org_id"]) if proj.get("org_id") else None
-        user = await get_user(doc.get("assignee_id"))
-        sprint = await get_sprint(doc.get("sprint_id"))
-        epic = await get_epic(doc.get("epic_id"))
-
-        due_date = doc.get("due_date")
-        status = doc.get("status", "BACKLOG")
-        is_delayed = bool(due_date and due_date.replace(tzinfo=timezone.utc) < now and status != "DONE")
-
-        return WorkItem(
-            issue_id=str(doc["_id"]),
-            issue_number=doc["number"],
-            title=doc["title"],
-            type=doc["type"],
-            project_id=str(proj["_id"]),
-            project_name=proj["name"],
-            org_name=org["name"] if org else None,
-            assignee_id=str(doc["assignee_id"]) if doc.get("assignee_id") else None,
-            assignee_name=(user.get("full_name") or user.get("email")) if user else None,
-            status=status,
-            priority=doc.get("priority", "MEDIUM"),
-            epic_title=epic["title"] if epic else None,
-            sprint_name=sprint["name"] if sprint else None,
-            start_date=doc.get("start_date"),
-            due_date=due_date,
-            is_delayed=is_delayed,
-            story_points=doc.get("story_points"),
-            parent_id=str(doc["parent_issue_id"]) if doc.get("parent_issue_id") else None,
-        )
+    issues_col = MongoClientManager.get_pm_issues_collection()
 
     # end_dt 를 해당일 23:59:59 로 확장 (날짜만 받아온 경우 당일 이슈 누락 방지)
     if end_dt.hour == 0 and end_dt.minute == 0 and end_dt.second == 0:
@@ -141,18 +125,11 @@ async def aggregate_period(
             {"status": "IN_PROGRESS"},
         ],
     }
-    docs = await issues_col.find(query).sort("number", 1).to_list(None)
-
-    all_items: list[WorkItem] = []
-    for doc in docs:
-        item = await doc_to_item(doc)
-        if item:
-            all_items.append(item)
 
     # ── 차주/차월 이슈 쿼리 ──────────────────────────────────────────
-    upcoming_items: list[WorkItem] = []
-    if next_start_dt and next_end_dt:
-        existing_ids = {i.issue_id for i in all_items}
+    async def _upcoming_docs() -> list[dict]:
+        if not (next_start_dt and next_end_dt):
+            return []
         uq = {
             "type": "TASK",
             "status": {"$in": ["TODO", "BACKLOG"]},
@@ -161,13 +138,33 @@ async def aggregate_period(
                 {"due_date":   {"$gte": next_start_dt, "$lte": next_end_dt}},
             ],
         }
-        udocs = await issues_col.find(uq).sort("number", 1).to_list(None)
-        for doc in udocs:
-            if str(doc["_id"]) in existing_ids:
-                continue
-            item = await doc_to_item(doc)
-            if item:
-                upcoming_items.append(item)
+        return await issues_col.find(uq, ISSUE_FIELDS).sort("number", 1).to_list(None)
+
+    # 기간 롤업이 준비돼 있으면 해당 주차 버킷만 읽어 합치고, 아니면 직접 조회
+    rolled = await period_issue_docs(start_dt, end_dt, next_start_dt, next_end_dt)
+    if rolled is not None:
+        docs, udocs = rolled
+    else:
+        docs, udocs = await asyncio.gather(
+            issues_col.find(query, ISSUE_FIELDS).sort("number", 1).to_list(None),
+            _upcoming_docs(),
+        )
+    maps = await _enrichment_maps(docs + udocs)
+
+    all_items: list[WorkItem] = []
+    for doc in docs:
+        item = _to_work_item(doc, maps, now)
+        if item:
+            all_items.append(item)
+
+    upcoming_items: list[WorkItem] = []
+    existing_ids = {i.issue_id for i in all_items}
+    for doc in udocs:
+        if str(doc["_id"]) in existing_ids:
+            continue
+        item = _to_work_item(doc, maps, now)
+        if item:
+            upcoming_items.append(item)
 
     # ── Subtask가 있는 Task 제거 (Gantt/섹션 중복 방지) ─────────────────
     # SUB_TASK의 parent_id 목록을 수집하여 해당 TASK는 표시에서 제외
@@ -224,7 +221,8 @@ async def aggregate_period(
         members_col = MongoClientManager.get_pm_project_members_collection()
         obj_ids = [ObjectId(pid) for pid in project_ids]
         member_docs = await members_col.find(
-            {"project_id": {"$in": obj_ids}}
+            {"project_id": {"$in": obj_ids}},
+            {"user_id": 1, "user_name": 1, "user_email": 1},
         ).to_list(None)
         for m in member_docs:
             uid = str(m["user_id"])
@@ -18,6 +18,8 @@ from app.models.pm.reports import (
 from app.models.sr.service_request import SR_STATUS_LABEL, REQUEST_TYPE_LABEL
 from app.routers.auth import get_current_user
 from app.routers.pm.report_agg import aggregate_period
+from app.services.user_directory import user_directory
+from app.utils.xlsx_stream import append_rows, header_row, set_column_widths, workbook_response
 
 router = APIRouter()
 
@@ -44,12 +46,7 @@ def _history_entry(user: UserPublic, action: str) -> dict:
 
 
 async def _user_name(uid) -> Optional[str]:
-    if not uid:
-        return None
-    u = await MongoClientManager.get_users_collection().find_one(
-        {"_id": ObjectId(str(uid))}, {"full_name": 1, "email": 1}
-    )
-    return (u.get("full_name") or u.get("email")) if u else None
+    return await user_directory.name_by_id(uid)
 
 
 def _parse_items(raw: list) -> list[WorkItem]:
@@ -267,16 +264,7 @@ async def _seed_attendance_from_prev(
 
 
 def _excel_response(wb, filename: str) -> StreamingResponse:
-    import io
-    from urllib.parse import quote
-    buf = io.BytesIO()
-    wb.save(buf)
-    buf.seek(0)
-    return StreamingResponse(
-        buf,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"},
-    )
+    return workbook_response(wb, filename)
 
 
 def _write_items_table(ws, items: list, start_row: int, hf, hfont, alt):
@@ -351,35 +339,31 @@ async def export_weekly_list(
     q: dict = {"deleted_at": None}
     if year: q["report_year"] = year
     if week: q["report_week"] = week
-    docs = await col.find(q).sort([("report_year", -1), ("report_week", -1)]).to_list(None)
-
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "주간보고 목록"
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("주간보고 목록")
     hf    = PatternFill("solid", fgColor="2F75B6")
     hfont = Font(color="FFFFFF", bold=True)
 
     headers = ["연도", "주차", "보고 기간", "부서", "제목", "총", "완료", "진행", "지연", "완료율"]
-    for ci, h in enumerate(headers, 1):
-        c = ws.cell(1, ci, h); c.fill = hf; c.font = hfont
-        c.alignment = Alignment(horizontal="center")
+    set_column_widths(ws, [16, 16, 16, 16, 40, 16, 16, 16, 16, 16])
+    ws.append(header_row(ws, headers, hf, hfont, Alignment(horizontal="center")))
 
-    for ri, doc in enumerate(docs, 2):
+    def _to_row(doc: dict) -> list:
         s = doc.get("stats", {})
-        ws.cell(ri, 1, doc["report_year"])
-        ws.cell(ri, 2, f"{doc['report_week']}주")
-        ws.cell(ri, 3, f"{doc['start_date'].strftime('%m/%d')}~{doc['end_date'].strftime('%m/%d')}")
-        ws.cell(ri, 4, doc.get("department") or "")
-        ws.cell(ri, 5, doc["title"])
-        ws.cell(ri, 6, s.get("total", 0))
-        ws.cell(ri, 7, s.get("completed", 0))
-        ws.cell(ri, 8, s.get("in_progress", 0))
-        ws.cell(ri, 9, s.get("delayed", 0))
-        ws.cell(ri, 10, f"{s.get('completion_rate', 0)}%")
-
-    for ci in range(1, 11):
-        ws.column_dimensions[openpyxl.utils.get_column_letter(ci)].width = 16
-    ws.column_dimensions["E"].width = 40
+        return [
+            doc["report_year"],
+            f"{doc['report_week']}주",
+            f"{doc['start_date'].strftime('%m/%d')}~{doc['end_date'].strftime('%m/%d')}",
+            doc.get("department") or "",
+            doc["title"],
+            s.get("total", 0),
+            s.get("completed", 0),
+            s.get("in_progress", 0),
+            s.get("delayed", 0),
+            f"{s.get('completion_rate', 0)}%",
+        ]
+
+    await append_rows(ws, col.find(q).sort([("report_year", -1), ("report_week", -1)]), _to_row)
 
     return _excel_response(wb, f"주간보고목록_{year or '전체'}년.xlsx")
 
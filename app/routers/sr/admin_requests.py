@@ -1,7 +1,6 @@
 """관리자/처리자용 SR API: 전체 목록, 검토, 배정, 상태 변경, Excel 다운로드, 통계."""
 from __future__ import annotations
 
-import io
 from datetime import datetime, timezone
 from typing import List, Optional
 
@@ -21,9 +20,14 @@ from app.services.sr.sr_service import (
     get_sr_or_404, record_sr_history, record_status_history,
     record_due_date_history, sr_to_out, require_sr_operator,
     require_sr_manager, require_sr_admin, compute_is_delayed,
-    is_sr_operator,
+    delayed_query, is_sr_operator,
 )
+from app.services.sr.sr_stats import compute_stats
 from app.services.notification_service import create_notification, notify_users
+from app.utils.search_tokens import (
+    SEARCH_EXCLUDE, SR_SEARCH_FIELDS, refresh_search_fields, search_conditions,
+)
+from app.utils.xlsx_stream import append_rows, header_row, set_column_widths, workbook_response
 
 router = APIRouter()
 
@@ -88,12 +92,14 @@ async def list_all_srs(
         q["status"] = {"$ne": "DRAFT"}
     if request_type:
         q["request_type"] = request_type
-    if requester_department:
-        q["requester_department"] = {"$regex": requester_department, "$options": "i"}
-    if requester_name:
-        q["requester_name"] = {"$regex": requester_name, "$options": "i"}
-    if related_system:
-        q["related_system"] = {"$regex": related_system, "$options": "i"}
+    # 부분 일치 검색은 search_tokens 인덱스로 후보를 좁힌다
+    text_conds = [
+        *search_conditions(SR_SEARCH_FIELDS, "requester_department", requester_department),
+        *search_conditions(SR_SEARCH_FIELDS, "requester_name", requester_name),
+        *search_conditions(SR_SEARCH_FIELDS, "related_system", related_system),
+    ]
+    if text_conds:
+        q["$and"] = text_conds
     if assignee_id:
         q["assignee_id"] = ObjectId(assignee_id)
     if priority:
@@ -120,16 +126,11 @@ async def list_all_srs(
             pf["$lte"] = _dt(planned_due_to)
         q["planned_due_date"] = pf
 
-    # is_delayed 필터는 Python 연산이므로 페이지네이션 전에 전체 조회 후 필터링
     if is_delayed is not None:
-        all_docs = await col.find(q).sort(sort_field, sort_dir).to_list(None)
-        outs = [sr_to_out(d) for d in all_docs]
-        outs = [o for o in outs if o["is_delayed"] == is_delayed]
-        page = outs[skip: skip + limit]
-        return SRListPage(items=[SRListItem(**o) for o in page], total=len(outs))
+        q = {"$and": [q, delayed_query(is_delayed)]}
 
     total = await col.count_documents(q)
-    docs = await col.find(q).sort(sort_field, sort_dir).skip(skip).limit(limit).to_list(None)
+    docs = await col.find(q, SEARCH_EXCLUDE).sort(sort_field, sort_dir).skip(skip).limit(limit).to_list(None)
     outs = [sr_to_out(d) for d in docs]
     return SRListPage(items=[SRListItem(**o) for o in outs], total=total)
 
@@ -199,6 +200,7 @@ async def update_sr_admin(
         if field in _admin_track_fields and str(old_val) != str(value):
             await record_sr_history(sr_id, f"FIELD_CHANGE:{field}", str(old_val), str(value), _user_label(current_user))
 
+    refresh_search_fields(doc, updates, SR_SEARCH_FIELDS)
     col = MongoClientManager.get_db()[MongoClientManager.SERVICE_REQUESTS]
     await col.update_one({"_id": ObjectId(sr_id)}, {"$set": updates})
     updated = await col.find_one({"_id": ObjectId(sr_id)})
@@ -564,7 +566,6 @@ async def get_stats(
     current_user: UserPublic = Depends(get_current_user),
 ):
     require_sr_operator(current_user)
-    col = MongoClientManager.get_db()[MongoClientManager.SERVICE_REQUESTS]
 
     q: dict = {"deleted_at": None}
     if date_from or date_to:
@@ -575,69 +576,7 @@ async def get_stats(
             df["$lte"] = datetime.fromisoformat(date_to).replace(tzinfo=timezone.utc)
         q["created_at"] = df
 
-    docs = await col.find(q).to_list(None)
-
-    stats = SRStats(
-        total=len(docs),
-        submitted=0, in_progress=0, completed=0,
-        rejected=0, on_hold=0, delayed=0, cancelled=0, urgent_count=0,
-    )
-    processing_times: list[float] = []
-
-    for d in docs:
-        s = d.get("status", "")
-        if s in ("SUBMITTED", "REVIEWING", "PENDING_INFO", "APPROVED", "ASSIGNED"):
-            stats.submitted += 1
-        if s in ("IN_PROGRESS", "COMPLETED", "CONFIRMING"):
-            stats.in_progress += 1
-        if s == "CLOSED":
-            stats.completed += 1
-        if s == "REJECTED":
-            stats.rejected += 1
-        if s == "ON_HOLD":
-            stats.on_hold += 1
-        if s == "CANCELLED":
-            stats.cancelled += 1
-        if d.get("is_urgent"):
-            stats.urgent_count += 1
-        if compute_is_delayed(d):
-            stats.delayed += 1
-
-        rt = d.get("request_type", "ETC")
-        stats.by_type[rt] = stats.by_type.get(rt, 0) + 1
-
-        dept = d.get("requester_department", "미지정")
-        stats.by_department[dept] = stats.by_department.get(dept, 0) + 1
-
-        sys_name = d.get("related_system") or "미지정"
-        stats.by_system[sys_name] = stats.by_system.get(sys_name, 0) + 1
-
-        assignee = d.get("assignee_name") or "미배정"
-        stats.by_assignee[assignee] = stats.by_assignee.get(assignee, 0) + 1
-
-        if d.get("actual_completed_at") and d.get("created_at"):
-            delta = (d["actual_completed_at"] - d["created_at"]).total_seconds() / 86400
-            processing_times.append(delta)
-
-    if processing_times:
-        stats.avg_processing_days = round(sum(processing_times) / len(processing_times), 1)
-
-    closed_docs = [d for d in docs if d.get("status") == "CLOSED"]
-    on_time = 0
-    for d in closed_docs:
-        completed_at = d.get("actual_completed_at")
-        planned_due = d.get("planned_due_date") or d.get("desired_due_date")
-        if completed_at and planned_due:
-            if completed_at.tzinfo is None:
-                completed_at = completed_at.replace(tzinfo=timezone.utc)
-            if planned_due.tzinfo is None:
-                planned_due = planned_due.replace(tzinfo=timezone.utc)
-            if completed_at <= planned_due:
-                on_time += 1
-    if closed_docs:
-        stats.on_time_rate = round(on_time / len(closed_docs) * 100, 1)
-
-    return stats
+    return await compute_stats(q)
 
 
 # ── Excel 다운로드 ────────────────────────────────────────────────────
@@ -669,16 +608,11 @@ async def export_excel(
         if date_to:
             df["$lte"] = datetime.fromisoformat(date_to).replace(tzinfo=timezone.utc)
         q["created_at"] = df
-
-    all_docs = await col.find(q).sort("created_at", -1).to_list(None)
     if is_delayed is not None:
-        docs = [d for d in all_docs if compute_is_delayed(d) == is_delayed]
-    else:
-        docs = all_docs
+        q = {"$and": [q, delayed_query(is_delayed)]}
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "SR목록"
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("SR목록")
 
     headers = [
         "SR번호", "요청제목", "요청부서", "요청자", "요청유형", "관련시스템",
@@ -688,11 +622,8 @@ async def export_excel(
     header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
     header_font = Font(color="FFFFFF", bold=True)
 
-    for col_idx, h in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_idx, value=h)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal="center")
+    set_column_widths(ws, [15] * len(headers))
+    ws.append(header_row(ws, headers, header_fill, header_font, Alignment(horizontal="center")))
 
     def _fmt_dt(dt):
         if not dt:
@@ -701,9 +632,9 @@ async def export_excel(
             return dt.strftime("%Y-%m-%d")
         return str(dt)[:10]
 
-    for row_idx, d in enumerate(docs, 2):
-        is_delayed = "Y" if compute_is_delayed(d) else "N"
-        ws.append([
+    def _to_row(d: dict):
+        delayed = compute_is_delayed(d)
+        return [
             d.get("sr_no", ""),
             d.get("title", ""),
             d.get("requester_department", ""),
@@ -717,26 +648,15 @@ async def export_excel(
             _fmt_dt(d.get("actual_completed_at")),
             d.get("assignee_name", ""),
             SR_STATUS_LABEL.get(d.get("status", ""), d.get("status", "")),
-            is_delayed,
+            "Y" if delayed else "N",
             _fmt_dt(d.get("created_at")),
             _fmt_dt(d.get("updated_at")),
-        ])
-
-    for col_idx in range(1, len(headers) + 1):
-        ws.column_dimensions[openpyxl.utils.get_column_letter(col_idx)].width = 15
+        ]
 
-    buf = io.BytesIO()
-    wb.save(buf)
-    buf.seek(0)
+    await append_rows(ws, col.find(q).sort("created_at", -1), _to_row)
 
     today = date.today().strftime("%Y-%m-%d")
-    filename = f"SR목록_{today}.xlsx"
-
-    return StreamingResponse(
-        buf,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    return workbook_response(wb, f"SR목록_{today}.xlsx")
 
 
 @router.get("/{sr_id}/export", response_class=StreamingResponse)
@@ -824,15 +744,5 @@ async def export_sr_detail(
             str(fh.get("changed_at", ""))[:19],
         ])
 
-    buf = io.BytesIO()
-    wb.save(buf)
-    buf.seek(0)
-
     sr_no = doc.get("sr_no", sr_id)
-    filename = f"SR상세_{sr_no}.xlsx"
-
-    return StreamingResponse(
-        buf,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    return workbook_response(wb, f"SR상세_{sr_no}.xlsx")
@@ -19,6 +19,9 @@ from app.services.sr.sr_service import (
 )
 from app.services.notification_service import create_notification, notify_users, get_sr_operator_ids
 from app.services.mention_service import resolve_mentions, notify_mentions
+from app.utils.search_tokens import (
+    SEARCH_EXCLUDE, SR_SEARCH_FIELDS, refresh_search_fields, search_conditions, search_fields,
+)
 
 router = APIRouter()
 
@@ -103,6 +106,7 @@ async def create_sr(
         "updated_by": _user_label(current_user),
         "deleted_at": None,
     }
+    doc.update(search_fields(doc, SR_SEARCH_FIELDS))
     result = await col.insert_one(doc)
     doc["_id"] = result.inserted_id
 
@@ -154,8 +158,9 @@ async def list_my_srs(
         q["status"] = status
     if request_type:
         q["request_type"] = request_type
-    if related_system:
-        q["related_system"] = {"$regex": related_system, "$options": "i"}
+    conds = search_conditions(SR_SEARCH_FIELDS, "related_system", related_system)
+    if conds:
+        q["$and"] = conds
     if priority:
         q["priority"] = priority
     if desired_due_date_from or desired_due_date_to:
@@ -166,7 +171,7 @@ async def list_my_srs(
             dfilter["$lte"] = datetime.fromisoformat(desired_due_date_to)
         q["desired_due_date"] = dfilter
 
-    docs = await col.find(q).sort("created_at", -1).to_list(None)
+    docs = await col.find(q, SEARCH_EXCLUDE).sort("created_at", -1).to_list(None)
     return [SRListItem(**sr_to_out(d)) for d in docs]
 
 
@@ -238,6 +243,7 @@ async def update_sr(
         from app.services.sr.sr_service import record_due_date_history
         await record_due_date_history(sr_id, doc.get("desired_due_date"), body.desired_due_date, None, _user_label(current_user))
 
+    refresh_search_fields(doc, updates, SR_SEARCH_FIELDS)
     col = MongoClientManager.get_db()[MongoClientManager.SERVICE_REQUESTS]
     await col.update_one({"_id": ObjectId(sr_id)}, {"$set": updates})
     updated = await col.find_one({"_id": ObjectId(sr_id)})
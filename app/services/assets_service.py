@@ -7,6 +7,7 @@ from bson import ObjectId
 
 from app.db.mongo import MongoClientManager
 from app.utils.mongo import to_out
+from app.utils.search_tokens import ASSET_SEARCH_FIELDS, refresh_search_fields, search_fields
 from app.utils.time import TimeUtil
 
 
@@ -150,6 +151,7 @@ class AssetsService:
             doc["asset_id"] = asset_id
         if asset_no:
             doc["asset_no"] = asset_no
+        doc.update(search_fields(doc, ASSET_SEARCH_FIELDS))
         res = await col.insert_one(doc)
         doc["_id"] = res.inserted_id
 
@@ -208,6 +210,7 @@ class AssetsService:
             new_doc["asset_no"] = asset_no
         else:
             unset_fields["asset_no"] = ""
+        new_doc.update(search_fields(new_doc, ASSET_SEARCH_FIELDS))
         mongo_op: Dict[str, Any] = {"$set": new_doc}
         if unset_fields:
             mongo_op["$unset"] = unset_fields
@@ -287,7 +290,10 @@ class AssetsService:
         update["updated_by"] = actor_email
         update["version"] = int(existing.get("version", 1)) + 1
 
-        mongo_update: Dict[str, Any] = {"$set": update}
+        # 검색 토큰은 저장만 하고 이력 patch에는 남기지 않는다
+        indexed = dict(update)
+        refresh_search_fields(existing, indexed, ASSET_SEARCH_FIELDS, unset)
+        mongo_update: Dict[str, Any] = {"$set": indexed}
         if unset:
             mongo_update["$unset"] = unset
         await col.update_one({"_id": _id}, mongo_update)
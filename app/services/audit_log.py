@@ -0,0 +1,177 @@
+"""감사 로그 — 이력 컬렉션들의 k-way 병합 + keyset(커서) 페이지네이션.
+
+컬렉션마다 (changed_at desc, _id desc) 인덱스 순서로 커서를 열고, 각 커서의 맨 앞 문서를
+힙에 넣어 전체 순서대로 한 건씩 꺼낸다. 페이지에 필요한 만큼만 읽으므로 응답 시간은
+이력 전체 건수가 아니라 페이지 크기에 비례한다.
+
+전체 순서: changed_at desc → 카테고리 순서(AUDIT_LOG_COLLECTIONS) → _id desc.
+다음 페이지 커서는 마지막 항목의 (changed_at, 카테고리 순서, _id)이고, 각 컬렉션은 그보다
+뒤에 오는 문서만 조회한다. changed_at이 없는 문서는 맨 뒤에 온다.
+"""
+from __future__ import annotations
+
+import asyncio
+import base64
+import functools
+import heapq
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Optional, Tuple
+
+from bson import ObjectId
+from fastapi import HTTPException
+
+from app.db.mongo import MongoClientManager
+from app.utils.search_tokens import normalize
+
+_SORT = [("changed_at", -1), ("_id", -1)]
+
+
+@functools.total_ordering
+class _Desc:
+    """힙(최소 힙)에서 큰 값이 먼저 나오도록 비교를 뒤집는다."""
+
+    __slots__ = ("v",)
+
+    def __init__(self, v: Any) -> None:
+        self.v = v
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Desc) and self.v == other.v
+
+    def __lt__(self, other: "_Desc") -> bool:
+        return self.v > other.v
+
+
+def _order_key(doc: dict, idx: int) -> tuple:
+    ts = doc.get("changed_at")
+    return (ts is None, _Desc(ts or datetime.min), idx, _Desc(doc["_id"]))
+
+
+# ── 커서 인코딩 ──────────────────────────────────────────────────────
+
+def encode_cursor(doc: dict, idx: int) -> str:
+    ts = doc.get("changed_at")
+    oid = doc["_id"]
+    raw = {
+        "t": ts.isoformat() if ts else None,
+        "c": idx,
+        "i": str(oid),
+        "o": isinstance(oid, ObjectId),
+    }
+    return base64.urlsafe_b64encode(json.dumps(raw).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int, Any]:
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        ts = datetime.fromisoformat(raw["t"]) if raw["t"] else None
+        oid = ObjectId(raw["i"]) if raw.get("o") else raw["i"]
+        return ts, int(raw["c"]), oid
+    except Exception:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+
+def _after(cursor: Tuple[Optional[datetime], int, Any], idx: int) -> Optional[dict]:
+    """idx번째 컬렉션에서 전체 순서상 cursor보다 뒤에 오는 문서 조건. None이면 남은 문서 없음."""
+    ts, c, oid = cursor
+    if ts is None:
+        # 커서가 이미 changed_at 없는 구간에 있음
+        if idx < c:
+            return None
+        if idx == c:
+            return {"changed_at": None, "_id": {"$lt": oid}}
+        return {"changed_at": None}
+    if idx < c:
+        same_ts: list = []
+    elif idx == c:
+        same_ts = [{"changed_at": ts, "_id": {"$lt": oid}}]
+    else:
+        same_ts = [{"changed_at": ts}]
+    return {"$or": [{"changed_at": {"$lt": ts}}, *same_ts, {"changed_at": None}]}
+
+
+# ── 조회 ────────────────────────────────────────────────────────────
+
+async def _next(cur: AsyncIterator[dict]) -> Optional[dict]:
+    try:
+        return await cur.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+async def merged_page(
+    categories: List[str],
+    query: dict,
+    *,
+    limit: int,
+    skip: int = 0,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Tuple[str, dict]], Optional[str]]:
+    """전체 순서로 skip건을 건너뛴 뒤 limit건의 (카테고리, 문서)와 다음 페이지 커서를 반환."""
+    order = list(MongoClientManager.AUDIT_LOG_COLLECTIONS)
+    db = MongoClientManager.get_db()
+    after = decode_cursor(cursor) if cursor else None
+    need = skip + limit
+
+    # 컬렉션마다 need+1건까지 읽는다 — 힙에 남은 문서가 있으면 다음 페이지가 있다는 뜻
+    iters: List[Tuple[int, str, Any]] = []
+    for cat in categories:
+        idx = order.index(cat)
+        q = query
+        if after is not None:
+            cond = _after(after, idx)
+            if cond is None:
+                continue
+            q = {"$and": [query, cond]} if query else cond
+        col = db[MongoClientManager.AUDIT_LOG_COLLECTIONS[cat]]
+        cur = col.find(q).sort(_SORT).limit(need + 1).batch_size(min(need + 1, 1000))
+        iters.append((idx, cat, cur))
+
+    out: List[Tuple[str, dict]] = []
+    last: Optional[Tuple[dict, int]] = None
+    heap: list = []
+    try:
+        firsts = await asyncio.gather(*(_next(cur) for _, _, cur in iters))
+        for n, doc in enumerate(firsts):
+            if doc is not None:
+                heapq.heappush(heap, (_order_key(doc, iters[n][0]), n, doc))
+
+        seen = 0
+        while heap and len(out) < limit:
+            _key, n, doc = heapq.heappop(heap)
+            idx, cat, cur = iters[n]
+            if seen >= skip:
+                out.append((cat, doc))
+                last = (doc, idx)
+            seen += 1
+            nxt = await _next(cur)
+            if nxt is not None:
+                heapq.heappush(heap, (_order_key(nxt, idx), n, nxt))
+    finally:
+        await asyncio.gather(*(cur.close() for _, _, cur in iters), return_exceptions=True)
+
+    next_cursor = encode_cursor(*last) if last and heap else None
+    return out, next_cursor
+
+
+async def count_total(categories: List[str], query: dict) -> int:
+    db = MongoClientManager.get_db()
+    cols = [db[MongoClientManager.AUDIT_LOG_COLLECTIONS[c]] for c in categories]
+    if query:
+        counts = await asyncio.gather(*(col.count_documents(query) for col in cols))
+    else:
+        counts = await asyncio.gather(*(col.estimated_document_count() for col in cols))
+    return sum(counts)
+
+
+async def matching_actors(categories: List[str], actor: str) -> List[str]:
+    """actor를 부분 문자열로 포함하는 changed_by 값 목록 (대소문자 무시).
+
+    changed_by 인덱스의 distinct로 사용자 수만큼만 읽고, 필터는 $in 으로 건다.
+    """
+    db = MongoClientManager.get_db()
+    cols = [db[MongoClientManager.AUDIT_LOG_COLLECTIONS[c]] for c in categories]
+    values = await asyncio.gather(*(col.distinct("changed_by") for col in cols))
+    needle = normalize(actor)
+    return sorted({v for vs in values for v in vs if isinstance(v, str) and needle in normalize(v)})
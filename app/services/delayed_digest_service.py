@@ -11,7 +11,7 @@ from collections import defaultdict
 from datetime import datetime, timezone
 
 from app.db.mongo import MongoClientManager
-from app.services.sr.sr_service import compute_is_delayed
+from app.services.sr.sr_service import delayed_query
 from app.utils.mail_notify import send_delayed_digest
 from app.utils.time import KST, next_9am_kst
 
@@ -98,14 +98,7 @@ class DelayedDigestService:
     async def _collect_delayed(self, now: datetime) -> tuple[dict, dict]:
         sr_col = MongoClientManager.get_db()[MongoClientManager.SERVICE_REQUESTS]
         sr_by_assignee: dict[str, list[dict]] = defaultdict(list)
-        async for doc in sr_col.find({
-            "$or": [
-                {"planned_due_date": {"$exists": True, "$ne": None}},
-                {"desired_due_date": {"$exists": True, "$ne": None}},
-            ]
-        }):
-            if not compute_is_delayed(doc):
-                continue
+        async for doc in sr_col.find(delayed_query(True, now)):
             assignee_id = doc.get("assignee_id")
             if not assignee_id:
                 continue
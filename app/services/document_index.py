@@ -0,0 +1,227 @@
+"""문서 본문 역색인 (document_text_chunks).
+
+추출한 본문(NFKC 정규화)을 _CHUNK자 단위 청크로 나눠 저장하고(다음 청크와 _OVERLAP자 겹침),
+청크마다 1-gram/2-gram 집합(grams)에 multikey 인덱스를 건다. 띄어쓰기가 없는 한국어도
+부분 일치로 찾는다. 토큰 규칙은 app/utils/search_tokens.py와 같다.
+
+검색어는 공백으로 나눈 단어와 "따옴표 구절"로 나뉘고, 모든 항을 포함한 문서만 남는다(AND).
+  1) 항마다 grams $all 로 후보 파일을 인덱스에서 고른다 (파일명 일치도 그 항을 만족한 것으로 본다)
+  2) 모든 항을 만족하는 후보 파일의 해당 청크만 읽어 실제 출현 위치를 찾는다
+     (구절 안의 공백은 줄바꿈 등 공백 변화를 허용)
+점수는 항별 idf × (log(1+출현 수) + 파일명 일치 가산)의 합이다.
+스니펫은 가장 드문 항의 첫 출현 위치에서 자르고, 하이라이트 구간(스니펫 기준 오프셋)과
+본문 기준 오프셋을 함께 돌려준다.
+
+document_files.text_content는 미리보기/편집용으로 남지만, 목록·검색은 그 필드를 읽지 않는다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import re
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+
+from app.db.mongo import MongoClientManager
+from app.utils.search_tokens import DOCUMENT_SEARCH_FIELDS, grams, normalize, query_grams, search_conditions
+
+logger = logging.getLogger(__name__)
+
+# 색인 규칙(청크 크기, 토큰)이 바뀌면 올린다 — 시작 시 버전이 다른 파일을 다시 색인한다
+TEXT_INDEX_VERSION = 1
+TEXT_INDEX_VERSION_FIELD = "text_index_v"
+
+_CHUNK = 2000
+_OVERLAP = 200          # 청크 경계에 걸친 구절도 한 청크 안에서 찾도록
+_INSERT_BATCH = 200
+_NAME_BOOST = 2.0
+_SNIPPET_CONTEXT = 120
+_TERM = re.compile(r'"([^"]+)"|(\S+)')
+
+
+def _files():
+    return MongoClientManager.get_db()["document_files"]
+
+
+def _chunks_col():
+    return MongoClientManager.get_db()[MongoClientManager.DOCUMENT_TEXT_CHUNKS]
+
+
+def _chunks(text: str) -> List[Tuple[int, str]]:
+    """(본문 기준 시작 오프셋, 청크 본문). 청크 i는 [start, start+_CHUNK)를 '소유'하고 _OVERLAP만큼 더 담는다."""
+    return [(start, text[start:start + _CHUNK + _OVERLAP]) for start in range(0, len(text), _CHUNK)]
+
+
+async def index_document(file_id: ObjectId, text: Optional[str]) -> None:
+    """파일 본문을 (다시) 색인한다. 업로드/교체/편집 저장 후 호출."""
+    col = _chunks_col()
+    text = unicodedata.normalize("NFKC", text or "")
+    docs = [
+        {"file_id": file_id, "seq": seq, "start": start, "text": chunk, "grams": sorted(grams(chunk))}
+        for seq, (start, chunk) in enumerate(_chunks(text))
+    ]
+    await col.delete_many({"file_id": file_id})
+    for i in range(0, len(docs), _INSERT_BATCH):
+        await col.insert_many(docs[i:i + _INSERT_BATCH], ordered=False)
+    await _files().update_one({"_id": file_id}, {"$set": {TEXT_INDEX_VERSION_FIELD: TEXT_INDEX_VERSION}})
+
+
+async def remove_document(file_id: ObjectId) -> None:
+    await _chunks_col().delete_many({"file_id": file_id})
+
+
+async def backfill_document_index() -> int:
+    """색인이 없거나 버전이 다른 파일을 색인한다. 멱등."""
+    q = {"is_deleted": {"$ne": True}, TEXT_INDEX_VERSION_FIELD: {"$ne": TEXT_INDEX_VERSION}}
+    n = 0
+    async for f in _files().find(q, {"text_content": 1}):
+        await index_document(f["_id"], f.get("text_content"))
+        n += 1
+    if n:
+        logger.info("문서 본문 색인: %d건", n)
+    return n
+
+
+_backfill_task: asyncio.Task | None = None
+
+
+def backfill_document_index_soon() -> None:
+    """시작 시 백그라운드로 색인을 채운다 (파일이 많으면 시작을 막지 않도록)."""
+    global _backfill_task
+    if _backfill_task is not None and not _backfill_task.done():
+        return
+
+    async def run() -> None:
+        try:
+            await backfill_document_index()
+        except Exception:
+            logger.exception("문서 본문 색인 실패")
+
+    _backfill_task = asyncio.create_task(run())
+
+
+# ── 검색 ──────────────────────────────────────────────────────────────────────
+
+def parse_query(q: str) -> List[str]:
+    """단어와 "따옴표 구절"로 나눈 정규화된 검색 항 (중복 제거, 입력 순서 유지)."""
+    terms: List[str] = []
+    for phrase, word in _TERM.findall(q):
+        term = normalize(phrase or word)
+        if term and term not in terms:
+            terms.append(term)
+    return terms
+
+
+def _term_pattern(term: str) -> re.Pattern:
+    return re.compile(r"\s+".join(re.escape(w) for w in term.split(" ")), re.IGNORECASE)
+
+
+def _chunk_filter(term: str) -> dict:
+    return {"grams": {"$all": query_grams(term)}}
+
+
+async def _term_candidates(term: str) -> Tuple[set, set]:
+    """(본문 후보 파일, 파일명 일치 파일). 본문 후보는 grams 인덱스로만 거른 값이라 확인이 필요하다."""
+    text_ids, name_docs = await asyncio.gather(
+        _chunks_col().distinct("file_id", _chunk_filter(term)),
+        _files().find(
+            {"is_deleted": {"$ne": True}, "$and": search_conditions(DOCUMENT_SEARCH_FIELDS, "name", term)},
+            {"_id": 1},
+        ).to_list(None),
+    )
+    return set(text_ids), {d["_id"] for d in name_docs}
+
+
+def _snippet(chunk: dict, offset: int, patterns: List[re.Pattern]) -> Tuple[str, List[List[int]]]:
+    """청크 안 offset 주변 스니펫과 하이라이트 구간 [시작, 끝) (스니펫 문자열 기준)."""
+    text = chunk["text"]
+    start = max(0, offset - _SNIPPET_CONTEXT)
+    end = min(len(text), offset + _SNIPPET_CONTEXT * 2)
+    body = text[start:end]
+    prefix = "…" if start > 0 or chunk["start"] > 0 else ""
+    more = end < len(text) or len(text) == _CHUNK + _OVERLAP
+    snippet = prefix + body + ("…" if more else "")
+    spans = sorted(
+        [m.start() + len(prefix), m.end() + len(prefix)]
+        for p in patterns for m in p.finditer(body)
+    )
+    return snippet, spans
+
+
+async def search(q: str, limit: int = 200) -> List[Dict[str, Any]]:
+    """검색 결과: [{file_id, score, snippet, highlights, offset}] (점수 내림차순)."""
+    terms = parse_query(q)
+    if not terms:
+        return []
+
+    candidates = await asyncio.gather(*(_term_candidates(t) for t in terms))
+    files = None
+    for text_ids, name_ids in candidates:
+        ids = text_ids | name_ids
+        files = ids if files is None else files & ids
+    if not files:
+        return []
+
+    total = max(await _files().estimated_document_count(), 1)
+    idf = [math.log(1 + total / max(len(t | n), 1)) for t, n in candidates]
+    patterns = [_term_pattern(t) for t in terms]
+
+    # 후보 파일 중 어떤 항의 grams를 모두 가진 청크만 읽는다
+    chunk_q = {"file_id": {"$in": list(files)}, "$or": [_chunk_filter(t) for t in terms]}
+    tf: Dict[Any, List[int]] = {fid: [0] * len(terms) for fid in files}
+    first: Dict[Any, Dict[int, Tuple[int, dict]]] = {fid: {} for fid in files}
+    async for chunk in _chunks_col().find(chunk_q, {"file_id": 1, "start": 1, "text": 1}):
+        fid = chunk["file_id"]
+        for i, p in enumerate(patterns):
+            for m in p.finditer(chunk["text"]):
+                if m.start() >= _CHUNK:     # 겹친 구간은 다음 청크가 센다
+                    break
+                tf[fid][i] += 1
+                pos = chunk["start"] + m.start()
+                if i not in first[fid] or pos < first[fid][i][0]:
+                    first[fid][i] = (pos, chunk)
+
+    scored: List[Tuple[float, Any]] = []
+    for fid in files:
+        name_hit = [fid in candidates[i][1] for i in range(len(terms))]
+        if not all(tf[fid][i] or name_hit[i] for i in range(len(terms))):
+            continue
+        score = sum(
+            idf[i] * (math.log1p(tf[fid][i]) + (_NAME_BOOST if name_hit[i] else 0.0))
+            for i in range(len(terms))
+        )
+        scored.append((score, fid))
+    scored.sort(key=lambda x: (-x[0], str(x[1])))
+    scored = scored[:limit]
+
+    # 본문 일치가 없는(파일명만 일치) 파일은 첫 청크로 스니펫을 만든다
+    head_ids = [fid for _, fid in scored if not first[fid]]
+    heads = {}
+    if head_ids:
+        async for c in _chunks_col().find({"file_id": {"$in": head_ids}, "seq": 0}, {"file_id": 1, "text": 1}):
+            heads[c["file_id"]] = c["text"]
+
+    results: List[Dict[str, Any]] = []
+    for score, fid in scored:
+        hits = first[fid]
+        if hits:
+            # 가장 드문(idf가 큰) 항의 첫 위치
+            i = max(hits, key=lambda k: idf[k])
+            pos, chunk = hits[i]
+            snippet, spans = _snippet(chunk, pos - chunk["start"], patterns)
+        else:
+            pos = None
+            text = heads.get(fid, "")
+            snippet = text[:_SNIPPET_CONTEXT * 2]
+            spans = []
+        results.append({
+            "file_id": fid,
+            "score": round(score, 4),
+            "snippet": snippet,
+            "highlights": spans,
+            "offset": pos,
+        })
+    return results
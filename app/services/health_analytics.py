@@ -0,0 +1,123 @@
+"""서버 점검 전체 분석 — 위험 서버, 전월 대비 증감, 디스크 가득 참 예측, 이상치.
+
+health_metrics의 시계열 배열(지표 × 호스트 × 보고일) 전체를 한 번에 벡터 연산으로 계산한다.
+  - 분포: 최신 보고서 기준 지표별 p50/p90/p95/max
+  - 전월 대비: 최신 보고서와 직전 보고서의 차이(%p)
+  - 디스크 예측: 호스트별 (보고일, disk_pct) 최소제곱 직선으로 100%에 닿는 날까지 남은 일수
+    (측정 _MIN_POINTS개 이상, 기울기가 양수일 때만)
+  - 이상치: 최신 보고서에서 지표별 수정 z-score(중앙값/MAD)가 _OUTLIER_Z를 넘고
+    중앙값과 _OUTLIER_MIN_GAP %p 이상 차이 나는 호스트
+결과는 보고서 업로드/삭제 전까지 캐시한다 (health_metrics.data_stamp 기준).
+"""
+from __future__ import annotations
+
+import warnings
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.services.health_metrics import METRICS, MetricsFrame, data_stamp, get_frame
+from app.utils.ttl_cache import AsyncTtlCache
+
+DANGER_PCT = 80.0
+_MIN_POINTS = 3
+_OUTLIER_Z = 3.5
+_OUTLIER_MIN_GAP = 10.0     # %p
+_DAYS_PER_MONTH = 30.4
+
+_analytics_cache = AsyncTtlCache(ttl=3600, max_bytes=16 * 1024 * 1024)
+
+
+def _num(v: Any, digits: int = 1) -> Optional[float]:
+    return None if v is None or not np.isfinite(v) else round(float(v), digits)
+
+
+def _disk_forecast(disk: np.ndarray, days: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """호스트별 최소제곱 기울기(%/일)와 마지막 보고일 기준 100%까지 남은 일수. 계산 불가면 NaN."""
+    mask = ~np.isnan(disk)
+    n = mask.sum(axis=1)
+    x = np.where(mask, days, 0.0)
+    y = np.where(mask, disk, 0.0)
+    sx, sy = x.sum(axis=1), y.sum(axis=1)
+    sxx, sxy = (x * x).sum(axis=1), (x * y).sum(axis=1)
+    denom = n * sxx - sx * sx
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where((n >= _MIN_POINTS) & (denom > 0), (n * sxy - sx * sy) / denom, np.nan)
+        intercept = (sy - slope * sx) / n
+        full_at = (100.0 - intercept) / slope
+    remaining = np.where(slope > 0, np.maximum(full_at - days[-1], 0.0), np.nan)
+    return slope, remaining
+
+
+def _robust_z(latest: np.ndarray) -> np.ndarray:
+    """지표별(행) 수정 z-score. MAD가 0이면 평균 절대편차로 대신한다 (Iglewicz-Hoaglin)."""
+    with warnings.catch_warnings(), np.errstate(divide="ignore", invalid="ignore"):
+        warnings.simplefilter("ignore", RuntimeWarning)     # 값이 하나도 없는 지표 (All-NaN slice)
+        med = np.nanmedian(latest, axis=1, keepdims=True)
+        dev = np.abs(latest - med)
+        mad = np.nanmedian(dev, axis=1, keepdims=True) * 1.4826
+        mean_ad = np.nanmean(dev, axis=1, keepdims=True) * 1.2533
+        scale = np.where(mad > 0, mad, mean_ad)
+        z = dev / scale
+    # 분포가 좁을 때 몇 %p 차이로 이상치가 되지 않도록
+    return np.where(dev >= _OUTLIER_MIN_GAP, z, 0.0)
+
+
+def analyze(frame: MetricsFrame) -> Dict[str, Any]:
+    if not frame.dates:
+        return {"report_date": None, "previous_date": None, "distribution": {}, "servers": []}
+
+    values = frame.values                                    # (지표, 호스트, 보고일)
+    latest = values[:, :, -1]
+    prev = values[:, :, -2] if len(frame.dates) > 1 else np.full_like(latest, np.nan)
+    mom = latest - prev
+
+    days = np.array(frame.dates, dtype="datetime64[D]").astype(float)
+    slope, remaining = _disk_forecast(frame.metric("disk_pct"), days)
+
+    present = ~np.isnan(latest).all(axis=0)                  # 최신 보고서에 있는 호스트
+    z = _robust_z(latest)
+    outlier = (z > _OUTLIER_Z) & present
+    danger = (np.nan_to_num(latest, nan=0.0) >= DANGER_PCT).any(axis=0) & present
+
+    distribution: Dict[str, Dict[str, Optional[float]]] = {}
+    for i, m in enumerate(METRICS):
+        col = latest[i][~np.isnan(latest[i])]
+        if col.size:
+            p50, p90, p95 = np.percentile(col, [50, 90, 95])
+            distribution[m] = {"p50": _num(p50), "p90": _num(p90), "p95": _num(p95), "max": _num(col.max())}
+        else:
+            distribution[m] = {"p50": None, "p90": None, "p95": None, "max": None}
+
+    servers: List[Dict[str, Any]] = []
+    for h in np.flatnonzero(present):
+        servers.append({
+            "host_name": frame.host_names[h],
+            "ip": frame.ips[h],
+            **{m: _num(latest[i, h]) for i, m in enumerate(METRICS)},
+            **{f"{m}_mom": _num(mom[i, h]) for i, m in enumerate(METRICS)},
+            "disk_growth_per_month": _num(slope[h] * _DAYS_PER_MONTH, 2),
+            "days_until_disk_full": None if np.isnan(remaining[h]) else int(remaining[h]),
+            "outliers": [m for i, m in enumerate(METRICS) if outlier[i, h]],
+            "danger": bool(danger[h]),
+        })
+
+    # 위험 → 디스크 가득 참 임박 → 최대 사용률 순
+    servers.sort(key=lambda s: (
+        not s["danger"],
+        s["days_until_disk_full"] if s["days_until_disk_full"] is not None else float("inf"),
+        -max((s[m] or 0.0) for m in METRICS),
+    ))
+    return {
+        "report_date": frame.dates[-1],
+        "previous_date": frame.dates[-2] if len(frame.dates) > 1 else None,
+        "distribution": distribution,
+        "servers": servers,
+    }
+
+
+async def fleet_analytics() -> Dict[str, Any]:
+    async def load() -> Dict[str, Any]:
+        return analyze(await get_frame())
+
+    return await _analytics_cache.get_or_load(await data_stamp(), load)
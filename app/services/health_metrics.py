@@ -0,0 +1,184 @@
+"""서버 점검 보고서 호스트별 사용률 시계열 (health_report_metrics).
+
+업로드 시 요약(summary) 행을 (host, report_date, cpu_pct, ram_pct, disk_pct) 문서로 한 번 풀어 저장한다.
+호스트 추이는 (host, report_date) 인덱스 조회 한 번이고, 보고서 전체를 읽어 행을 훑지 않는다.
+
+전체 추이/분석용으로 시계열 전체를 NumPy 배열(지표 × 호스트 × 보고일)로 메모리에 캐시한다.
+캐시 키는 보고서 수와 마지막 시계열 기록 시각이라 업로드/삭제 후 첫 조회에서 다시 만든다
+(워커가 여럿이어도 각자 같은 기준으로 갱신된다).
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from pymongo import UpdateOne
+
+from app.db.mongo import MongoClientManager
+from app.utils.ttl_cache import AsyncTtlCache
+
+logger = logging.getLogger(__name__)
+
+METRICS = ("cpu_pct", "ram_pct", "disk_pct")
+# 요약 행 → 지표 필드
+_SOURCE = {"cpu_pct": "cpu", "ram_pct": "ram", "disk_pct": "disk_max"}
+
+# 시계열 규칙이 바뀌면 올린다 — 시작 시 버전이 다른 보고서를 다시 풀어 쓴다
+METRICS_VERSION = 1
+METRICS_VERSION_FIELD = "metrics_v"
+
+
+def parse_pct(val: Any) -> Optional[float]:
+    """'85%', '85', 85 → 85.0. 비었거나 숫자가 아니면 None."""
+    try:
+        return float(str(val).replace("%", "").strip())
+    except (ValueError, TypeError):
+        return None
+
+
+def host_key(host_name: Any) -> str:
+    return str(host_name or "").strip().lower()
+
+
+def _metrics_col():
+    return MongoClientManager.get_db()[MongoClientManager.HEALTH_METRICS]
+
+
+def _reports_col():
+    return MongoClientManager.get_db()[MongoClientManager.HEALTH_REPORTS]
+
+
+def metric_docs(report_id: Any, report_date: str, summary: List[dict]) -> List[dict]:
+    """요약 행 → 시계열 문서. 같은 보고서에 호스트가 중복되면 첫 행만 쓴다."""
+    docs: Dict[str, dict] = {}
+    for row in summary:
+        host = host_key(row.get("host_name"))
+        if not host or host in docs:
+            continue
+        docs[host] = {
+            "host": host,
+            "host_name": str(row.get("host_name", "")).strip(),
+            "ip": row.get("ip", ""),
+            "report_date": report_date,
+            "report_id": report_id,
+            **{m: parse_pct(row.get(src)) for m, src in _SOURCE.items()},
+        }
+    return list(docs.values())
+
+
+async def write_report_metrics(report_id: Any, report_date: str, summary: List[dict]) -> None:
+    """보고서 하나의 시계열을 통째로 교체한다 (재업로드 시 빠진 호스트도 지운다)."""
+    col = _metrics_col()
+    docs = metric_docs(report_id, report_date, summary)
+    await col.delete_many({"report_date": report_date, "host": {"$nin": [d["host"] for d in docs]}})
+    if docs:
+        await col.bulk_write(
+            [UpdateOne({"host": d["host"], "report_date": report_date}, {"$set": d}, upsert=True) for d in docs],
+            ordered=False,
+        )
+    # metrics_at은 시계열을 다 쓴 뒤에 바꾼다 — 캐시 키가 먼저 바뀌어 옛 시계열이 새 키로 캐시되지 않도록
+    await _reports_col().update_one(
+        {"_id": report_id},
+        {"$set": {METRICS_VERSION_FIELD: METRICS_VERSION, "metrics_at": datetime.now(timezone.utc)}},
+    )
+
+
+async def delete_report_metrics(report_date: str) -> None:
+    await _metrics_col().delete_many({"report_date": report_date})
+
+
+async def backfill_metrics() -> int:
+    """시계열이 없거나 버전이 다른 보고서를 풀어 쓴다. 멱등."""
+    n = 0
+    async for doc in _reports_col().find(
+        {METRICS_VERSION_FIELD: {"$ne": METRICS_VERSION}}, {"summary": 1, "report_date": 1},
+    ):
+        await write_report_metrics(doc["_id"], doc.get("report_date", ""), doc.get("summary") or [])
+        n += 1
+    if n:
+        logger.info("서버 점검 시계열 채움: 보고서 %d건", n)
+    return n
+
+
+async def host_history(host_name: str) -> List[dict]:
+    """호스트 한 대의 보고일별 사용률 (오래된 순). (host, report_date) 인덱스 조회."""
+    return await _metrics_col().find(
+        {"host": host_key(host_name)},
+        {"_id": 0, "report_date": 1, **{m: 1 for m in METRICS}},
+    ).sort("report_date", 1).to_list(None)
+
+
+# ── NumPy 시계열 캐시 ─────────────────────────────────────────────────────────
+
+@dataclass
+class MetricsFrame:
+    """values[지표, 호스트, 보고일] — 값이 없으면 NaN. dates는 오래된 순."""
+    dates: List[str]
+    hosts: List[str]
+    host_names: List[str]
+    ips: List[str]
+    values: np.ndarray
+
+    def metric(self, name: str) -> np.ndarray:
+        return self.values[METRICS.index(name)]
+
+
+_frame_cache = AsyncTtlCache(ttl=3600, max_bytes=256 * 1024 * 1024, sizeof=lambda f: f.values.nbytes)
+
+
+async def data_stamp() -> tuple:
+    """보고서 수와 마지막 시계열 기록 시각 — 업로드/삭제가 있으면 바뀐다 (캐시 키)."""
+    docs = await _reports_col().find({}, {"_id": 0, "metrics_at": 1}).to_list(None)
+    return len(docs), max((d["metrics_at"] for d in docs if d.get("metrics_at")), default=None)
+
+
+async def _build_frame() -> MetricsFrame:
+    docs = await _metrics_col().find(
+        {}, {"_id": 0, "host": 1, "host_name": 1, "ip": 1, "report_date": 1, **{m: 1 for m in METRICS}},
+    ).sort("report_date", 1).to_list(None)
+    dates = sorted({d["report_date"] for d in docs})
+    hosts = sorted({d["host"] for d in docs})
+    d_idx = {d: i for i, d in enumerate(dates)}
+    h_idx = {h: i for i, h in enumerate(hosts)}
+    values = np.full((len(METRICS), len(hosts), len(dates)), np.nan)
+    host_names = [""] * len(hosts)
+    ips = [""] * len(hosts)
+    for d in docs:
+        h, t = h_idx[d["host"]], d_idx[d["report_date"]]
+        values[:, h, t] = [np.nan if d.get(m) is None else d[m] for m in METRICS]
+        # 최신 보고서의 표시 이름/IP (오래된 순으로 덮어쓴다)
+        host_names[h] = d.get("host_name") or d["host"]
+        ips[h] = d.get("ip") or ""
+    return MetricsFrame(dates=dates, hosts=hosts, host_names=host_names, ips=ips, values=values)
+
+
+async def get_frame() -> MetricsFrame:
+    return await _frame_cache.get_or_load(await data_stamp(), _build_frame)
+
+
+def _nan_stat(fn, arr: np.ndarray) -> List[Optional[float]]:
+    has = ~np.all(np.isnan(arr), axis=0)
+    out = np.full(arr.shape[1], np.nan)
+    if has.any():
+        out[has] = fn(arr[:, has], axis=0)
+    return [None if np.isnan(v) else round(float(v), 1) for v in out]
+
+
+async def fleet_trend() -> Dict[str, Any]:
+    """보고일별 전체 서버 평균/최대/p90 사용률과 호스트 수."""
+    frame = await get_frame()
+    out: Dict[str, Any] = {
+        "dates": frame.dates,
+        "host_count": [int(n) for n in (~np.isnan(frame.values).all(axis=0)).sum(axis=0)],
+    }
+    for m in METRICS:
+        arr = frame.metric(m)
+        out[m] = {
+            "avg": _nan_stat(np.nanmean, arr),
+            "max": _nan_stat(np.nanmax, arr),
+            "p90": _nan_stat(lambda a, axis: np.nanpercentile(a, 90, axis=axis), arr),
+        }
+    return out
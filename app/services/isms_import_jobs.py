@@ -0,0 +1,184 @@
+"""ISMS-P 취약점 Excel 가져오기 작업 (isms_import_jobs).
+
+업로드 요청은 파일을 임시 경로에 쓰고 작업 문서만 만든 뒤 바로 돌아간다.
+실제 가져오기(import_all)는 백그라운드 태스크에서 돌고, 진행 상황을 작업 문서에 기록한다.
+  - 상태: queued → running → succeeded | failed
+  - 진행: progress {phase, done, total} (phase: read/write/images)
+  - 결과: result {inserted, updated, total, log_id} — log_id로 기존 롤백(rollback_import)을 그대로 쓴다
+  - 가져오기 이력(log_id)은 첫 쓰기 전에 만들어지므로, 실패/중단된 작업도 반영된 만큼 롤백할 수 있다
+가져오기는 프로세스 안에서 한 번에 하나만 돈다 (같은 자연키를 동시에 upsert하지 않도록).
+작업 상태는 Mongo에 있으므로 어느 워커에서든 조회/구독(watch_job)할 수 있다.
+서버가 재시작되면 실행 중이던 작업은 이어서 돌 수 없으므로 시작 시 failed로 바꾼다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from app.core.cpu_pool import CpuPoolUnavailable
+from app.db.mongo import MongoClientManager
+from app.services.isms_stats import refresh_summary_soon
+from app.services.isms_vuln_import import fail_interrupted_imports, import_all
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+FINISHED = (SUCCEEDED, FAILED)
+
+_PROGRESS_INTERVAL = 0.5    # 초 — 같은 단계 안의 진행 기록 간격
+_WATCH_INTERVAL = 0.5
+_WATCH_KEEPALIVE = 15.0
+
+_ROLLBACK_HINT = "이미 반영된 내용은 가져오기 이력에서 롤백할 수 있습니다."
+
+_lock = asyncio.Lock()
+_tasks: set[asyncio.Task] = set()
+
+
+def _jobs_col():
+    return MongoClientManager.get_isms_import_jobs_collection()
+
+
+async def submit_import(content: bytes, filename: str, actor_email: str | None) -> dict:
+    """업로드 내용을 임시 파일로 쓰고 작업을 등록한다. 반환: 작업 문서."""
+    fd, tmp_path = tempfile.mkstemp(suffix=".xlsx")
+    with os.fdopen(fd, "wb") as f:
+        f.write(content)
+
+    now = datetime.now(timezone.utc)
+    job = {
+        "status": QUEUED,
+        "filename": filename,
+        "uploader_email": actor_email,
+        "log_id": ObjectId(),
+        "progress": {"phase": None, "done": 0, "total": 0},
+        "result": None,
+        "error": None,
+        "created_at": now,
+        "started_at": None,
+        "finished_at": None,
+        "updated_at": now,
+    }
+    try:
+        job["_id"] = (await _jobs_col().insert_one(job)).inserted_id
+    except Exception:
+        _remove(tmp_path)
+        raise
+
+    task = asyncio.create_task(_run(job["_id"], job["log_id"], tmp_path, actor_email))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return job
+
+
+async def _set(job_id: ObjectId, fields: dict) -> None:
+    await _jobs_col().update_one(
+        {"_id": job_id}, {"$set": {**fields, "updated_at": datetime.now(timezone.utc)}},
+    )
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+async def _failed(job_id: ObjectId, log_id: ObjectId, error: str) -> None:
+    # 이력이 생긴 뒤(쓰기 시작 후) 실패했으면 롤백 안내를 붙이고, 아니면 log_id를 지운다
+    logged = await MongoClientManager.get_isms_import_logs_collection().find_one({"_id": log_id}, {"_id": 1})
+    fields = {"status": FAILED, "finished_at": datetime.now(timezone.utc)}
+    if logged:
+        fields["error"] = f"{error} {_ROLLBACK_HINT}"
+        refresh_summary_soon()
+    else:
+        fields.update(error=error, log_id=None)
+    await _set(job_id, fields)
+
+
+async def _run(job_id: ObjectId, log_id: ObjectId, path: str, actor_email: str | None) -> None:
+    last = {"phase": None, "at": 0.0}
+
+    async def progress(phase: str, done: int, total: int) -> None:
+        # 단계가 바뀌거나 끝났을 때는 바로, 그 외에는 _PROGRESS_INTERVAL마다 기록
+        now = time.monotonic()
+        if phase == last["phase"] and done < total and now - last["at"] < _PROGRESS_INTERVAL:
+            return
+        last.update(phase=phase, at=now)
+        await _set(job_id, {"progress": {"phase": phase, "done": done, "total": total}})
+
+    try:
+        async with _lock:
+            await _set(job_id, {"status": RUNNING, "started_at": datetime.now(timezone.utc)})
+            result = await import_all(path, actor_email=actor_email, progress=progress, log_id=log_id)
+        await _set(job_id, {
+            "status": SUCCEEDED,
+            "result": {"success": True, **result},
+            "finished_at": datetime.now(timezone.utc),
+        })
+        refresh_summary_soon()
+    except CpuPoolUnavailable as e:
+        await _failed(job_id, log_id, str(e))
+    except Exception as e:
+        logger.exception("ISMS-P 가져오기 작업 %s 실패", job_id)
+        await _failed(job_id, log_id, f"가져오기에 실패했습니다: {e}")
+    finally:
+        _remove(path)
+
+
+async def get_job(job_id: str) -> Optional[dict]:
+    try:
+        return await _jobs_col().find_one({"_id": ObjectId(job_id)})
+    except InvalidId:
+        return None
+
+
+async def watch_job(job_id: str) -> AsyncIterator[Optional[dict]]:
+    """작업 문서가 바뀔 때마다 내보내고, 끝난 상태를 내보낸 뒤 멈춘다.
+
+    변화가 없을 때는 _WATCH_KEEPALIVE초마다 None을 내보낸다 (SSE 연결 유지용).
+    """
+    seen = None
+    quiet_since = time.monotonic()
+    while True:
+        job = await get_job(job_id)
+        if job is None:
+            return
+        if job["updated_at"] != seen:
+            seen = job["updated_at"]
+            quiet_since = time.monotonic()
+            yield job
+            if job["status"] in FINISHED:
+                return
+        elif time.monotonic() - quiet_since >= _WATCH_KEEPALIVE:
+            quiet_since = time.monotonic()
+            yield None
+        await asyncio.sleep(_WATCH_INTERVAL)
+
+
+async def fail_interrupted_jobs() -> int:
+    """시작 시 호출 — 이전 프로세스에서 끝나지 않은 작업과 그 가져오기 이력을 failed로 바꾼다."""
+    await fail_interrupted_imports()
+    res = await _jobs_col().update_many(
+        {"status": {"$in": [QUEUED, RUNNING]}},
+        {"$set": {
+            "status": FAILED,
+            "error": f"서버가 재시작되어 가져오기가 중단되었습니다. {_ROLLBACK_HINT} 확인 후 다시 업로드해주세요.",
+            "finished_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc),
+        }},
+    )
+    if res.modified_count:
+        logger.info("중단된 ISMS-P 가져오기 작업 %d건을 실패 처리", res.modified_count)
+    return res.modified_count
@@ -0,0 +1,162 @@
+"""ISMS-P 취약점 대시보드 통계.
+
+/stats, /assignee-stats, /action-progress 세 가지 집계를 $facet 파이프라인 한 번으로
+Mongo 안에서 계산한다. 결과는 isms_vuln_summary 컬렉션에 저장(materialize)해 두고,
+가져오기/롤백/등록/수정 후 refresh_summary_soon()으로 백그라운드 재계산한다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any
+
+from app.core.config import settings
+from app.db.mongo import MongoClientManager
+
+logger = logging.getLogger(__name__)
+
+_SUMMARY_ID = "dashboard"
+
+
+def _bucket(field: str) -> dict:
+    """None/빈 문자열/필드 없음은 '미분류'로 묶는다."""
+    value = {"$ifNull": [f"${field}", None]}
+    return {"$cond": [{"$in": [value, [None, ""]]}, "미분류", value]}
+
+
+def _count_by(field: str) -> list[dict]:
+    return [{"$group": {"_id": _bucket(field), "n": {"$sum": 1}}}]
+
+
+_IS_DONE = {"$regexMatch": {"input": {"$ifNull": ["$action_status", ""]}, "regex": "완료"}}
+
+
+def _done_sum(cond: Any = True) -> dict:
+    return {"$sum": {"$cond": [{"$and": [_IS_DONE, cond]}, 1, 0]}}
+
+
+_PIPELINE: list[dict] = [
+    {"$project": {
+        "control_status": 1, "risk_level": 1, "asset_type": 1, "assignee": 1,
+        "action_status": 1, "action_difficulty": 1, "planned_date": 1,
+    }},
+    {"$facet": {
+        "total": [{"$count": "n"}],
+        "status": _count_by("control_status"),
+        "risk": _count_by("risk_level"),
+        "asset": _count_by("asset_type"),
+        "assignee": [
+            {"$match": {"assignee": {"$nin": [None, ""]}, "control_status": {"$ne": "양호"}}},
+            {"$group": {
+                "_id": "$assignee",
+                "total": {"$sum": 1},
+                "completed": _done_sum(),
+                "hard_total": {"$sum": {"$cond": [{"$eq": ["$action_difficulty", "상"]}, 1, 0]}},
+                "hard_completed": _done_sum({"$eq": ["$action_difficulty", "상"]}),
+                "highrisk_total": {"$sum": {"$cond": [{"$eq": ["$risk_level", "상"]}, 1, 0]}},
+                "highrisk_completed": _done_sum({"$eq": ["$risk_level", "상"]}),
+            }},
+            {"$sort": {"_id": 1}},
+        ],
+        "progress": [
+            {"$match": {"planned_date": {"$nin": [None, ""]}, "control_status": {"$ne": "양호"}}},
+            {"$group": {
+                "_id": {"$substrCP": ["$planned_date", 0, 7]},
+                "target": {"$sum": 1},
+                "actual": {"$sum": {"$cond": [{"$eq": ["$action_status", "완료"]}, 1, 0]}},
+            }},
+            {"$sort": {"_id": 1}},
+        ],
+    }},
+]
+
+
+def _shape(facet: dict) -> dict:
+    def counts(rows: list[dict]) -> dict:
+        return {r["_id"]: r["n"] for r in sorted(rows, key=lambda r: -r["n"])}
+
+    assignee_stats = []
+    for r in facet["assignee"]:
+        total, completed = r["total"], r["completed"]
+        assignee_stats.append({
+            "assignee": r["_id"],
+            "total": total,
+            "completed": completed,
+            "todo": max(0, total - completed),
+            "completion_rate": round(completed / total * 100, 1) if total else 0.0,
+            "hard_total": r["hard_total"],
+            "hard_completed": r["hard_completed"],
+            "hard_rate": round(r["hard_completed"] / r["hard_total"] * 100, 1) if r["hard_total"] else 0.0,
+            "highrisk_total": r["highrisk_total"],
+            "highrisk_completed": r["highrisk_completed"],
+        })
+
+    progress = [r for r in facet["progress"] if r["_id"]]
+    return {
+        "stats": {
+            "total": facet["total"][0]["n"] if facet["total"] else 0,
+            "status_counts": counts(facet["status"]),
+            "asset_counts": counts(facet["asset"]),
+            "risk_counts": counts(facet["risk"]),
+        },
+        "assignee_stats": assignee_stats,
+        "action_progress": {
+            "labels": [r["_id"] for r in progress],
+            "target": [r["target"] for r in progress],
+            "actual": [r["actual"] for r in progress],
+        },
+    }
+
+
+async def compute_summary() -> dict:
+    col = MongoClientManager.get_isms_vulnerabilities_collection()
+    rows = await col.aggregate(_PIPELINE, allowDiskUse=True).to_list(1)
+    return _shape(rows[0])
+
+
+async def refresh_summary() -> dict:
+    summary = await compute_summary()
+    await MongoClientManager.get_isms_vuln_summary_collection().replace_one(
+        {"_id": _SUMMARY_ID},
+        {**summary, "computed_at": datetime.now(timezone.utc)},
+        upsert=True,
+    )
+    return summary
+
+
+async def get_summary() -> dict:
+    """저장된 요약이 있으면 그대로, 없으면 계산 후 저장."""
+    if not settings.ISMS_STATS_MATERIALIZED:
+        return await compute_summary()
+    doc = await MongoClientManager.get_isms_vuln_summary_collection().find_one({"_id": _SUMMARY_ID})
+    if doc:
+        return doc
+    return await refresh_summary()
+
+
+# ── 변경 후 백그라운드 재계산 (연속 수정은 한 번으로 합침) ──────────────────
+_refresh_task: asyncio.Task | None = None
+_refresh_pending = False
+
+
+def refresh_summary_soon() -> None:
+    global _refresh_task, _refresh_pending
+    if not settings.ISMS_STATS_MATERIALIZED:
+        return
+    if _refresh_task is not None and not _refresh_task.done():
+        _refresh_pending = True
+        return
+
+    async def run() -> None:
+        global _refresh_pending
+        while True:
+            _refresh_pending = False
+            try:
+                await refresh_summary()
+            except Exception:
+                logger.exception("ISMS-P 요약 통계 갱신 실패")
+            if not _refresh_pending:
+                break
+
+    _refresh_task = asyncio.create_task(run())
@@ -4,26 +4,48 @@
 - 기본 정보(BASE_FIELDS)는 매 임포트마다 Excel 값으로 무조건 덮어씀
 - 조치 정보(ACTION_FIELDS)는 Excel 셀 값이 있을 때만 덮어씀 (비어있으면 기존 사람이 입력한 값 보존)
 - 동일 (점검코드, 호스트명|자산명, 점검일시) 키의 레코드는 update, 없으면 insert
-- 롤백을 위해 이번 임포트에서 변경된 레코드의 "임포트 전" 스냅샷과, 새로 삽입된 레코드의 id 목록을
-  import_logs 문서에 함께 저장한다 (원본의 SQLite 파일 전체 백업 방식 대신, 배치 단위 스냅샷 방식).
+  키는 natural_key 필드에 저장되고 unique 인덱스가 걸려 있다. 기존 레코드는 시트 청크마다
+  $in 한 번으로 찾으므로 메모리/시간이 DB 전체가 아니라 파일 크기에 비례한다
+- 롤백을 위해 이번 임포트에서 변경된 레코드의 필드 단위 역패치(임포트 전 값)와 새로 삽입된 레코드 id를
+  isms_import_patches에 쓰기 청크마다 저장한다 (원본의 SQLite 파일 전체 백업 방식 대신).
+  import_logs 문서에는 진행 상태(status)와 건수 요약만 남는다.
 """
 from __future__ import annotations
 
+import logging
 import os
 import zipfile
 import xml.etree.ElementTree as ET
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 import openpyxl
 from bson import ObjectId
 from bson.errors import InvalidId
+from pymongo import DeleteOne, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
+from app.core.cpu_pool import CpuPool
 from app.db.mongo import MongoClientManager
 from app.models.isms_vulnerability import BASE_FIELDS, ACTION_FIELDS
 
+logger = logging.getLogger(__name__)
+
 UPLOAD_DIR = "/app/uploads/isms-p"
 
+NATURAL_KEY_FIELD = 'natural_key'
+_KEY_SEP = '\x1f'
+_CHUNK = 500        # 시트 청크 — 기존 레코드 $in 조회와 bulk_write 단위, 역패치 청크 크기
+_CHANGED = object()  # 이미지로 바뀐 필드 — 새 값과 비교하지 않고 항상 되돌린다
+
+# import_logs.status
+IMPORT_RUNNING = 'running'
+IMPORT_DONE = 'done'
+IMPORT_FAILED = 'failed'
+
+# progress(단계, 처리 건수, 전체 건수)
+ProgressFn = Callable[[str, int, int], Awaitable[None]]
+
 # ── 상태값 정규화 (원본 시트마다 표기가 제각각인 것을 통일) ─────────────────
 ACTION_STATUS_MAP = {
     'O': '완료', 'o': '완료', '완료': '완료', '조치완료': '완료',
@@ -116,70 +138,58 @@ def _normalize_header(v: Any) -> str:
     return str(v).strip().replace(' ', '').replace('\n', '').lower()
 
 
-def _make_key(data: dict) -> tuple:
-    return (
+def natural_key(data: dict) -> str:
+    """(점검코드, 호스트명|자산명, 점검일시) → natural_key 필드 값."""
+    return _KEY_SEP.join((
         data.get('check_code') or '',
         data.get('hostname') or data.get('asset_name') or '',
         data.get('check_date') or '',
-    )
+    ))
 
 
-async def import_all(excel_path: str, actor_email: str | None = None) -> dict:
-    """Excel(export 포맷)을 읽어 upsert. 반환: {inserted, updated, total, log_id}."""
-    col = MongoClientManager.get_isms_vulnerabilities_collection()
-    log_col = MongoClientManager.get_isms_import_logs_collection()
-
-    records_before = await col.count_documents({})
-
-    existing: dict[tuple, dict] = {}
-    async for doc in col.find({}):
-        key = (doc.get('check_code') or '', doc.get('hostname') or doc.get('asset_name') or '', doc.get('check_date') or '')
-        if key not in existing:
-            existing[key] = doc
+async def backfill_natural_keys() -> int:
+    """natural_key가 없는 레코드에 채운다. 멱등.
 
+    키가 겹치는 레코드는 먼저 만들어진(_id가 작은) 것만 키를 갖는다 — 예전 임포트도 그 레코드만 갱신했다.
+    """
+    col = MongoClientManager.get_isms_vulnerabilities_collection()
+    projection = {'check_code': 1, 'hostname': 1, 'asset_name': 1, 'check_date': 1}
+    ops: list[UpdateOne] = []
+    filled = skipped = 0
+
+    async def flush() -> None:
+        nonlocal filled, skipped
+        pending = ops[:]
+        ops.clear()
+        while pending:
+            try:
+                res = await col.bulk_write(pending, ordered=True)
+                filled += res.modified_count
+                return
+            except BulkWriteError as e:
+                # ordered라 첫 중복에서 멈춘다 — 그 레코드만 건너뛰고 나머지를 다시 쓴다
+                err = e.details['writeErrors'][0]
+                if err.get('code') != 11000:
+                    raise
+                filled += e.details.get('nModified', 0)
+                skipped += 1
+                pending = pending[err['index'] + 1:]
+
+    async for doc in col.find({NATURAL_KEY_FIELD: {'$exists': False}}, projection).sort('_id', 1):
+        ops.append(UpdateOne({'_id': doc['_id']}, {'$set': {NATURAL_KEY_FIELD: natural_key(doc)}}))
+        if len(ops) >= _CHUNK:
+            await flush()
+    if ops:
+        await flush()
+    if filled or skipped:
+        logger.info('ISMS-P 자연키 채움: %d건 (중복으로 제외 %d건)', filled, skipped)
+    return filled
+
+
+def read_import_rows(excel_path: str) -> list[tuple[dict, str]]:
+    """통합문서 → [(필드 dict, 시트명)]. CpuPool(별도 프로세스)에서 실행된다."""
     wb = openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
-
-    inserted = 0
-    updated = 0
-    new_docs: list[dict] = []
-    snapshots_by_id: dict[str, dict] = {}
-
-    def upsert(data: dict, source_sheet: str) -> None:
-        nonlocal inserted, updated
-        check_code = data.get('check_code')
-        if not check_code and not data.get('check_item'):
-            return
-
-        key = _make_key(data)
-
-        if key in existing:
-            doc = existing[key]
-            if '_id' in doc:
-                doc_id_str = str(doc['_id'])
-                if doc_id_str not in snapshots_by_id:
-                    snapshots_by_id[doc_id_str] = dict(doc)
-            doc['source_sheet'] = source_sheet
-            for f in BASE_FIELDS:
-                if f in data:
-                    doc[f] = data[f]
-            for f in ACTION_FIELDS:
-                if f in data and data[f] is not None:
-                    doc[f] = data[f]
-            doc['updated_at'] = datetime.now(timezone.utc)
-            updated += 1
-        else:
-            new_doc = {
-                'source_sheet': source_sheet,
-                'before_files': [],
-                'after_files': [],
-                'created_at': datetime.now(timezone.utc),
-                'updated_at': None,
-                **data,
-            }
-            new_docs.append(new_doc)
-            existing[key] = new_doc
-            inserted += 1
-
+    out: list[tuple[dict, str]] = []
     for sheet_name in wb.sheetnames:
         if sheet_name in SKIP_SHEETS:
             continue
@@ -212,7 +222,7 @@ async def import_all(excel_path: str, actor_email: str | None = None) -> dict:
                         'asset_type': '웹취약점',
                         'asset_category': 'Web',
                     }
-                    upsert(data, sheet_name)
+                    out.append((data, sheet_name))
                 continue
 
         header_row_idx = None
@@ -242,70 +252,265 @@ async def import_all(excel_path: str, actor_email: str | None = None) -> dict:
                 db_field, fn = mapping
                 data[db_field] = fn(padded[col_idx])
 
-            upsert(data, sheet_name)
+            out.append((data, sheet_name))
+    wb.close()
+    return out
+
+
+def _chunks(rows: list[tuple[dict, str]]):
+    """같은 시트의 연속된 행을 _CHUNK개씩 묶는다."""
+    chunk: list[tuple[dict, str]] = []
+    for row in rows:
+        if chunk and (len(chunk) >= _CHUNK or chunk[-1][1] != row[1]):
+            yield chunk
+            chunk = []
+        chunk.append(row)
+    if chunk:
+        yield chunk
+
+
+async def import_all(
+    excel_path: str,
+    actor_email: str | None = None,
+    progress: Optional[ProgressFn] = None,
+    log_id: Optional[ObjectId] = None,
+) -> dict:
+    """Excel(export 포맷)을 읽어 upsert. 반환: {inserted, updated, total, log_id}.
+
+    progress(phase, done, total)는 단계(read/write/images)마다, 쓰기는 청크마다 불린다.
+    이력 문서(status=running)를 첫 쓰기 전에 만들고, 청크마다 역패치를 쓰기보다 먼저 저장한다.
+    중간에 실패하거나 서버가 내려가도 이미 반영된 청크는 그 이력으로 롤백할 수 있다.
+    """
+    col = MongoClientManager.get_isms_vulnerabilities_collection()
+    log_col = MongoClientManager.get_isms_import_logs_collection()
+    patch_col = MongoClientManager.get_isms_import_patches_collection()
+    log_id = log_id or ObjectId()
 
-    inserted_ids: list[ObjectId] = []
-    if new_docs:
-        result = await col.insert_many(new_docs)
-        inserted_ids = list(result.inserted_ids)
+    async def report(phase: str, done: int, total: int) -> None:
+        if progress is not None:
+            await progress(phase, done, total)
 
-    # 실제 update 반영: existing 딕셔너리에 남아있는, _id가 있던(=이미 DB에 있던) 문서들 중
-    # snapshots_by_id 에 기록된(=이번 런에서 실제로 수정된) 것만 replace
-    by_id_str = {str(doc['_id']): doc for doc in existing.values() if doc.get('_id') is not None}
-    for doc_id_str in snapshots_by_id:
-        doc = by_id_str.get(doc_id_str)
-        if doc is None:
-            continue
-        to_set = {k: v for k, v in doc.items() if k != '_id'}
-        await col.replace_one({'_id': doc['_id']}, to_set)
+    await report('read', 0, 0)
+    records_before = await col.count_documents({})
+    rows = await CpuPool.run('isms_import.read_rows', read_import_rows, excel_path)
+    rows = [(data, sheet) for data, sheet in rows if data.get('check_code') or data.get('check_item')]
+
+    inserted = 0
+    updated = 0
+    patch_count = 0
+    seq = 0
+    # 이번 파일에서 이미 DB에 있는 것으로 확인됐거나 새로 넣은 키
+    known: set[str] = set()
+    # 원래 있던 레코드: 키 → _id, _id → 임포트 전 문서 / 역패치에 임포트 전 값을 이미 담은 필드
+    existing_ids: dict[str, ObjectId] = {}
+    before: dict[ObjectId, dict] = {}
+    covered: dict[ObjectId, set[str]] = {}
+
+    def reverse_patch(vuln_id: ObjectId, fields: dict) -> Optional[dict]:
+        """아직 역패치에 없는 필드 중 값이 바뀌는 것의 임포트 전 값."""
+        doc, done = before[vuln_id], covered[vuln_id]
+        changed = [f for f, v in fields.items() if f not in done and (f not in doc or doc[f] != v)]
+        if not changed:
+            return None
+        done.update(changed)
+        patch: dict[str, Any] = {'id': vuln_id}
+        to_set = {f: doc[f] for f in changed if f in doc}
+        to_unset = [f for f in changed if f not in doc]
+        if to_set:
+            patch['set'] = to_set
+        if to_unset:
+            patch['unset'] = to_unset
+        return patch
+
+    async def save_patches(patches: list[dict]) -> None:
+        nonlocal seq, patch_count
+        if not patches:
+            return
+        await patch_col.insert_one({'log_id': log_id, 'seq': seq, 'patches': patches})
+        seq += 1
+        patch_count += len(patches)
 
-    await _import_images(col, excel_path)
+    async def save_log(fields: dict) -> None:
+        await log_col.update_one({'_id': log_id}, {'$set': {
+            'inserted': inserted, 'updated': updated, 'patch_count': patch_count, **fields,
+        }})
 
-    records_after = await col.count_documents({})
-    log_doc = {
+    await log_col.insert_one({
+        '_id': log_id,
         'created_at': datetime.now(timezone.utc),
+        'status': IMPORT_RUNNING,
         'records_before': records_before,
-        'inserted': inserted,
-        'updated': updated,
-        'records_after': records_after,
+        'inserted': 0,
+        'updated': 0,
+        'records_after': None,
         'uploader_email': actor_email,
         'note': None,
         'rolled_back': False,
-        'snapshots': list(snapshots_by_id.values()),
-        'inserted_ids': [str(i) for i in inserted_ids],
-    }
-    log_result = await log_col.insert_one(log_doc)
+        'patch_count': 0,
+    })
+    try:
+        written = 0
+        await report('write', written, len(rows))
+        for chunk in _chunks(rows):
+            keys = [natural_key(data) for data, _ in chunk]
+            lookup = list({k for k in keys if k not in known})
+            if lookup:
+                async for doc in col.find({NATURAL_KEY_FIELD: {'$in': lookup}}):
+                    known.add(doc[NATURAL_KEY_FIELD])
+                    existing_ids[doc[NATURAL_KEY_FIELD]] = doc['_id']
+                    before[doc['_id']] = doc
+                    covered[doc['_id']] = set()
+
+            now = datetime.now(timezone.utc)
+            ops: list[UpdateOne] = []
+            patches: list[dict] = []
+            for key, (data, source_sheet) in zip(keys, chunk):
+                if key in known:
+                    to_set = {'source_sheet': source_sheet, 'updated_at': now}
+                    to_set.update({f: data[f] for f in BASE_FIELDS if f in data})
+                    to_set.update({f: data[f] for f in ACTION_FIELDS if data.get(f) is not None})
+                    ops.append(UpdateOne({NATURAL_KEY_FIELD: key}, {'$set': to_set}, upsert=True))
+                    if key in existing_ids:
+                        patch = reverse_patch(existing_ids[key], to_set)
+                        if patch:
+                            patches.append(patch)
+                    updated += 1
+                else:
+                    # _id를 미리 정해 삭제 역패치를 쓰기 전에 남긴다
+                    new_id = ObjectId()
+                    ops.append(UpdateOne(
+                        {NATURAL_KEY_FIELD: key},
+                        {
+                            '$set': {'source_sheet': source_sheet, 'updated_at': None, **data},
+                            '$setOnInsert': {
+                                '_id': new_id, 'before_files': [], 'after_files': [], 'created_at': now,
+                            },
+                        },
+                        upsert=True,
+                    ))
+                    patches.append({'id': new_id, 'delete': True})
+                    known.add(key)
+                    inserted += 1
+
+            await save_patches(patches)
+            # ordered — 같은 키가 청크 안에 두 번 나오면 앞 행이 넣은 레코드를 뒤 행이 갱신한다
+            await col.bulk_write(ops, ordered=True)
+            await save_log({})
+            written += len(chunk)
+            await report('write', written, len(rows))
+
+        await report('images', 0, 0)
+        image_patches: list[dict] = []
+        for vuln_id, files_attr in await _import_images(col, excel_path):
+            if vuln_id in before:
+                patch = reverse_patch(vuln_id, {files_attr: _CHANGED})
+                if patch:
+                    image_patches.append(patch)
+        await save_patches(image_patches)
+
+        records_after = await col.count_documents({})
+        await save_log({'status': IMPORT_DONE, 'records_after': records_after})
+    except BaseException:
+        try:
+            await save_log({'status': IMPORT_FAILED, 'records_after': await col.count_documents({})})
+        except Exception:
+            logger.exception('ISMS-P 가져오기 이력 %s 실패 기록 불가', log_id)
+        raise
 
     return {
         'inserted': inserted,
         'updated': updated,
         'total': records_after,
-        'log_id': str(log_result.inserted_id),
+        'log_id': str(log_id),
     }
 
 
+async def fail_interrupted_imports() -> int:
+    """시작 시 호출 — 이전 프로세스에서 끝나지 못한 이력을 failed로 바꾼다 (롤백은 가능)."""
+    res = await MongoClientManager.get_isms_import_logs_collection().update_many(
+        {'status': IMPORT_RUNNING}, {'$set': {'status': IMPORT_FAILED}},
+    )
+    return res.modified_count
+
+
+# ── 롤백용 역패치 (isms_import_patches) ──────────────────────────────────────
+# 가져오기 이력 하나당 {log_id, seq, patches: [...]} 청크 여러 개 (import_all의 쓰기 청크마다 하나).
+#   새로 넣은 레코드: {id, delete: True}
+#   수정한 레코드:   {id, set: {필드: 임포트 전 값}, unset: [임포트 전에 없던 필드]}
+# 같은 레코드가 여러 청크에 나오면 새로 바뀌는 필드만 뒤 청크에 더 담긴다.
+# 바뀐 필드만 담으므로 임포트 뒤 사람이 고친 다른 필드는 롤백해도 그대로 남는다.
+
+
 async def rollback_import(log_id: str) -> dict:
-    """배치 스냅샷 기반 롤백: 이번 임포트로 새로 생긴 레코드는 삭제하고,
-    수정된 레코드는 임포트 전 스냅샷으로 되돌린다."""
+    """역패치 기반 롤백: 이번 임포트로 새로 생긴 레코드는 삭제하고,
+    수정된 레코드는 바뀐 필드만 임포트 전 값으로 되돌린다. 청크마다 bulk_write 한 번."""
     log_col = MongoClientManager.get_isms_import_logs_collection()
+    patch_col = MongoClientManager.get_isms_import_patches_collection()
     col = MongoClientManager.get_isms_vulnerabilities_collection()
 
     try:
-        log_doc = await log_col.find_one({'_id': ObjectId(log_id)})
+        log_doc = await log_col.find_one(
+            {'_id': ObjectId(log_id)}, {'rolled_back': 1, 'patch_count': 1, 'status': 1},
+        )
     except InvalidId:
         log_doc = None
     if not log_doc:
         raise ValueError('가져오기 이력을 찾을 수 없습니다.')
     if log_doc.get('rolled_back'):
         raise ValueError('이미 롤백되었습니다.')
+    if log_doc.get('status') == IMPORT_RUNNING:
+        raise ValueError('가져오기가 아직 진행 중입니다.')
+
+    if 'patch_count' not in log_doc:
+        result = await _rollback_snapshots(col, log_doc['_id'])
+    else:
+        deleted = 0
+        restored: set[ObjectId] = set()     # 한 레코드의 역패치가 여러 청크에 나뉠 수 있다
+        async for chunk in patch_col.find({'log_id': log_doc['_id']}).sort('seq', 1):
+            ops: list = []
+            for p in chunk['patches']:
+                if p.get('delete'):
+                    ops.append(DeleteOne({'_id': p['id']}))
+                    continue
+                update: dict[str, Any] = {}
+                if p.get('set'):
+                    update['$set'] = p['set']
+                if p.get('unset'):
+                    update['$unset'] = {f: '' for f in p['unset']}
+                ops.append(UpdateOne({'_id': p['id']}, update))
+            patched = [p['id'] for p in chunk['patches'] if not p.get('delete')]
+            if patched:
+                restored.update(await col.distinct('_id', {'_id': {'$in': patched}}))
+            if ops:
+                res = await col.bulk_write(ops, ordered=False)
+                deleted += res.deleted_count
+        result = {'restored': len(restored), 'deleted': deleted}
+
+    await log_col.update_one({'_id': log_doc['_id']}, {'$set': {'rolled_back': True}})
+    await patch_col.delete_many({'log_id': log_doc['_id']})
+
+    return result
+
+
+async def _rollback_snapshots(col, log_id: ObjectId) -> dict:
+    """역패치 도입 전 이력: 문서 안 snapshots(임포트 전 전체 문서)/inserted_ids로 되돌린다."""
+    log_doc = await MongoClientManager.get_isms_import_logs_collection().find_one({'_id': log_id})
 
     restored = 0
     for snapshot in log_doc.get('snapshots', []):
         _id = snapshot.get('_id')
         if _id is None:
             continue
+        # 예전 스냅샷에는 natural_key가 없다 — 통째로 되돌리면 키가 빠져 다음 임포트가 중복을 만든다
         to_set = {k: v for k, v in snapshot.items() if k != '_id'}
-        res = await col.replace_one({'_id': _id}, to_set)
+        to_set[NATURAL_KEY_FIELD] = natural_key(snapshot)
+        try:
+            res = await col.replace_one({'_id': _id}, to_set)
+        except DuplicateKeyError:
+            # 그 사이 같은 키의 다른 레코드가 생겼다 — backfill_natural_keys의 중복과 같이 키 없이 둔다
+            logger.warning('ISMS-P 롤백: %s 의 자연키가 다른 레코드와 겹쳐 키 없이 복원', _id)
+            del to_set[NATURAL_KEY_FIELD]
+            res = await col.replace_one({'_id': _id}, to_set)
         if res.matched_count:
             restored += 1
 
@@ -317,188 +522,202 @@ async def rollback_import(log_id: str) -> dict:
             continue
         deleted += res.deleted_count
 
-    await log_col.update_one({'_id': log_doc['_id']}, {'$set': {'rolled_back': True}})
-
     return {'restored': restored, 'deleted': deleted}
 
 
 # ── 임포트 시 Excel 셀에 삽입된 수정전/후 이미지 자동 추출 ──────────────────
 
-async def _import_images(col, xlsx_path: str) -> int:
+def extract_cell_images(xlsx_path: str) -> list[dict]:
+    """수정전/후설명 셀에 앵커된 이미지와 그 행의 식별 정보. CpuPool(별도 프로세스)에서 실행된다.
+
+    반환: [{raw_id, check_code, hostname, check_date, sheet, row_idx, file_type, files_attr, data, ext}]
+    """
     R = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
     S = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
     XDR = 'http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing'
     A = 'http://schemas.openxmlformats.org/drawingml/2006/main'
 
-    saved = 0
-    try:
-        with zipfile.ZipFile(xlsx_path) as zf:
-            names = set(zf.namelist())
-
-            wb_xml = ET.fromstring(zf.read('xl/workbook.xml'))
-            wb_rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
-            rId_to_target = {rel.get('Id'): rel.get('Target') for rel in wb_rels}
-
-            sheets = []
-            for s in wb_xml.iter(f'{{{S}}}sheet'):
-                rId = s.get(f'{{{R}}}id')
-                if rId in rId_to_target:
-                    t = rId_to_target[rId].lstrip('/')
-                    path = t if t.startswith('xl/') else f'xl/{t}'
-                    sheets.append((s.get('name'), path))
-
-            for sheet_name, sheet_path in sheets:
-                if sheet_path not in names:
-                    continue
-                sheet_dir, sheet_file = sheet_path.rsplit('/', 1)
-                rels_path = f'{sheet_dir}/_rels/{sheet_file}.rels'
-                if rels_path not in names:
-                    continue
+    found: list[dict] = []
+    with zipfile.ZipFile(xlsx_path) as zf:
+        names = set(zf.namelist())
 
-                sheet_rels = ET.fromstring(zf.read(rels_path))
-                drawing_target = None
-                for rel in sheet_rels:
-                    if 'drawing' in rel.get('Type', '').lower():
-                        drawing_target = rel.get('Target').lstrip('/')
-                        break
-                if not drawing_target:
-                    continue
+        wb_xml = ET.fromstring(zf.read('xl/workbook.xml'))
+        wb_rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+        rId_to_target = {rel.get('Id'): rel.get('Target') for rel in wb_rels}
 
-                drawing_path = os.path.normpath(f'{sheet_dir}/{drawing_target}').replace('\\', '/')
-                if drawing_path not in names:
-                    drawing_path = drawing_target
-                if drawing_path not in names:
-                    continue
+        sheets = []
+        for s in wb_xml.iter(f'{{{S}}}sheet'):
+            rId = s.get(f'{{{R}}}id')
+            if rId in rId_to_target:
+                t = rId_to_target[rId].lstrip('/')
+                path = t if t.startswith('xl/') else f'xl/{t}'
+                sheets.append((s.get('name'), path))
 
-                drawing_dir, drawing_file = drawing_path.rsplit('/', 1)
-                drw_rels_path = f'{drawing_dir}/_rels/{drawing_file}.rels'
-                if drw_rels_path not in names:
-                    continue
+        for sheet_name, sheet_path in sheets:
+            if sheet_path not in names:
+                continue
+            sheet_dir, sheet_file = sheet_path.rsplit('/', 1)
+            rels_path = f'{sheet_dir}/_rels/{sheet_file}.rels'
+            if rels_path not in names:
+                continue
 
-                drw_rels = ET.fromstring(zf.read(drw_rels_path))
-                rId_to_img: dict[str, tuple[str, str]] = {}
-                for rel in drw_rels:
-                    if 'image' in rel.get('Type', '').lower():
-                        t = rel.get('Target').lstrip('/')
-                        img_path = os.path.normpath(f'{drawing_dir}/{t}').replace('\\', '/')
-                        if img_path not in names:
-                            img_path = t
-                        if img_path in names:
-                            ext = img_path.rsplit('.', 1)[-1].lower() if '.' in img_path else 'png'
-                            rId_to_img[rel.get('Id')] = (img_path, ext)
-
-                if not rId_to_img:
-                    continue
+            sheet_rels = ET.fromstring(zf.read(rels_path))
+            drawing_target = None
+            for rel in sheet_rels:
+                if 'drawing' in rel.get('Type', '').lower():
+                    drawing_target = rel.get('Target').lstrip('/')
+                    break
+            if not drawing_target:
+                continue
 
-                cell_to_img: dict[tuple[int, int], tuple[bytes, str]] = {}
-                drawing_xml = ET.fromstring(zf.read(drawing_path))
-                for anchor in drawing_xml:
-                    tag = anchor.tag.split('}')[-1]
-                    if tag not in ('oneCellAnchor', 'twoCellAnchor'):
-                        continue
-                    from_elem = anchor.find(f'{{{XDR}}}from')
-                    if from_elem is None:
-                        continue
-                    col_e = from_elem.find(f'{{{XDR}}}col')
-                    row_e = from_elem.find(f'{{{XDR}}}row')
-                    if col_e is None or row_e is None:
-                        continue
-                    c = int(col_e.text) + 1
-                    r = int(row_e.text) + 1
-                    blip = anchor.find(f'.//{{{A}}}blip')
-                    if blip is None:
-                        continue
-                    rId = blip.get(f'{{{R}}}embed')
-                    if rId in rId_to_img:
-                        img_file, ext = rId_to_img[rId]
-                        cell_to_img[(c, r)] = (zf.read(img_file), ext)
+            drawing_path = os.path.normpath(f'{sheet_dir}/{drawing_target}').replace('\\', '/')
+            if drawing_path not in names:
+                drawing_path = drawing_target
+            if drawing_path not in names:
+                continue
 
-                if not cell_to_img:
-                    continue
+            drawing_dir, drawing_file = drawing_path.rsplit('/', 1)
+            drw_rels_path = f'{drawing_dir}/_rels/{drawing_file}.rels'
+            if drw_rels_path not in names:
+                continue
+
+            drw_rels = ET.fromstring(zf.read(drw_rels_path))
+            rId_to_img: dict[str, tuple[str, str]] = {}
+            for rel in drw_rels:
+                if 'image' in rel.get('Type', '').lower():
+                    t = rel.get('Target').lstrip('/')
+                    img_path = os.path.normpath(f'{drawing_dir}/{t}').replace('\\', '/')
+                    if img_path not in names:
+                        img_path = t
+                    if img_path in names:
+                        ext = img_path.rsplit('.', 1)[-1].lower() if '.' in img_path else 'png'
+                        rId_to_img[rel.get('Id')] = (img_path, ext)
+
+            if not rId_to_img:
+                continue
 
-                wb2 = openpyxl.load_workbook(xlsx_path, read_only=True, data_only=True)
-                ws2 = wb2[sheet_name]
-                rows = list(ws2.iter_rows(values_only=True))
-                wb2.close()
-
-                id_col = before_col = after_col = check_code_col = hostname_col = check_date_col = header_row_idx = None
-                for i, raw in enumerate(rows):
-                    norm = [_normalize_header(c) for c in raw]
-                    if '점검코드' in norm:
-                        header_row_idx = i
-                        for j, h in enumerate(norm):
-                            if h == 'id':
-                                id_col = j
-                            elif h == '점검코드':
-                                check_code_col = j
-                            elif h == '호스트명':
-                                hostname_col = j
-                            elif h == '점검일시':
-                                check_date_col = j
-                            elif h == '수정전설명':
-                                before_col = j
-                            elif h == '수정후설명':
-                                after_col = j
-                        break
-
-                if header_row_idx is None or check_code_col is None:
+            cell_to_img: dict[tuple[int, int], tuple[bytes, str]] = {}
+            drawing_xml = ET.fromstring(zf.read(drawing_path))
+            for anchor in drawing_xml:
+                tag = anchor.tag.split('}')[-1]
+                if tag not in ('oneCellAnchor', 'twoCellAnchor'):
+                    continue
+                from_elem = anchor.find(f'{{{XDR}}}from')
+                if from_elem is None:
+                    continue
+                col_e = from_elem.find(f'{{{XDR}}}col')
+                row_e = from_elem.find(f'{{{XDR}}}row')
+                if col_e is None or row_e is None:
                     continue
+                c = int(col_e.text) + 1
+                r = int(row_e.text) + 1
+                blip = anchor.find(f'.//{{{A}}}blip')
+                if blip is None:
+                    continue
+                rId = blip.get(f'{{{R}}}embed')
+                if rId in rId_to_img:
+                    img_file, ext = rId_to_img[rId]
+                    cell_to_img[(c, r)] = (zf.read(img_file), ext)
 
-                ts = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
-                for di, raw in enumerate(rows[header_row_idx + 1:]):
-                    if not any(raw):
+            if not cell_to_img:
+                continue
+
+            wb2 = openpyxl.load_workbook(xlsx_path, read_only=True, data_only=True)
+            ws2 = wb2[sheet_name]
+            rows = list(ws2.iter_rows(values_only=True))
+            wb2.close()
+
+            id_col = before_col = after_col = check_code_col = hostname_col = check_date_col = header_row_idx = None
+            for i, raw in enumerate(rows):
+                norm = [_normalize_header(c) for c in raw]
+                if '점검코드' in norm:
+                    header_row_idx = i
+                    for j, h in enumerate(norm):
+                        if h == 'id':
+                            id_col = j
+                        elif h == '점검코드':
+                            check_code_col = j
+                        elif h == '호스트명':
+                            hostname_col = j
+                        elif h == '점검일시':
+                            check_date_col = j
+                        elif h == '수정전설명':
+                            before_col = j
+                        elif h == '수정후설명':
+                            after_col = j
+                    break
+
+            if header_row_idx is None or check_code_col is None:
+                continue
+
+            for di, raw in enumerate(rows[header_row_idx + 1:]):
+                if not any(raw):
+                    continue
+                padded = list(raw) + [None] * 5
+                ws_row = header_row_idx + 2 + di
+                ident = {
+                    'raw_id': safe_str(padded[id_col]) if id_col is not None else None,
+                    'check_code': safe_str(padded[check_code_col]),
+                    'hostname': safe_str(padded[hostname_col]) if hostname_col is not None else None,
+                    'check_date': safe_str(padded[check_date_col]) if check_date_col is not None else None,
+                    'sheet': sheet_name,
+                    'row_idx': di,
+                }
+                for file_type, col_idx, files_attr in [
+                    ('before', before_col, 'before_files'),
+                    ('after', after_col, 'after_files'),
+                ]:
+                    if col_idx is None:
                         continue
-                    padded = list(raw) + [None] * 5
-                    ws_row = header_row_idx + 2 + di
-
-                    vuln = None
-                    if id_col is not None:
-                        raw_id = safe_str(padded[id_col])
-                        if raw_id:
-                            try:
-                                vuln = await col.find_one({'_id': ObjectId(raw_id)})
-                            except InvalidId:
-                                vuln = None
-                    if vuln is None:
-                        check_code = safe_str(padded[check_code_col]) if check_code_col is not None else None
-                        hostname = safe_str(padded[hostname_col]) if hostname_col is not None else None
-                        check_date = safe_str(padded[check_date_col]) if check_date_col is not None else None
-                        if check_code:
-                            q: dict[str, Any] = {'check_code': check_code}
-                            if hostname:
-                                q['hostname'] = hostname
-                            if check_date:
-                                q2 = dict(q, check_date=check_date)
-                                vuln = await col.find_one(q2)
-                            if vuln is None:
-                                vuln = await col.find_one(q)
-                    if not vuln:
+                    img_data = cell_to_img.get((col_idx + 1, ws_row))
+                    if not img_data:
                         continue
+                    img_bytes, ext = img_data
+                    found.append({**ident, 'file_type': file_type, 'files_attr': files_attr,
+                                  'data': img_bytes, 'ext': ext})
+    return found
+
 
-                    vuln_id_str = str(vuln['_id'])
-                    for file_type, col_idx, files_attr in [
-                        ('before', before_col, 'before_files'),
-                        ('after', after_col, 'after_files'),
-                    ]:
-                        if col_idx is None:
-                            continue
-                        ws_col = col_idx + 1
-                        img_data = cell_to_img.get((ws_col, ws_row))
-                        if not img_data:
-                            continue
-                        img_bytes, ext = img_data
-                        fname = f'imported_{ts}_{di}.{ext}'
-                        dest_dir = os.path.join(UPLOAD_DIR, vuln_id_str, file_type)
-                        os.makedirs(dest_dir, exist_ok=True)
-                        with open(os.path.join(dest_dir, fname), 'wb') as f:
-                            f.write(img_bytes)
-                        await col.update_one(
-                            {'_id': vuln['_id']},
-                            {'$set': {files_attr: [{'name': fname, 'original': fname}]}},
-                        )
-                        saved += 1
+async def _find_image_target(col, img: dict) -> Optional[dict]:
+    vuln = None
+    if img['raw_id']:
+        try:
+            vuln = await col.find_one({'_id': ObjectId(img['raw_id'])})
+        except InvalidId:
+            vuln = None
+    if vuln is None and img['check_code']:
+        q: dict[str, Any] = {'check_code': img['check_code']}
+        if img['hostname']:
+            q['hostname'] = img['hostname']
+        if img['check_date']:
+            vuln = await col.find_one(dict(q, check_date=img['check_date']))
+        if vuln is None:
+            vuln = await col.find_one(q)
+    return vuln
+
+
+async def _import_images(col, xlsx_path: str) -> list[tuple[ObjectId, str]]:
+    """셀 이미지를 저장하고 파일 목록을 바꾼 (레코드 _id, 필드) 목록을 돌려준다."""
+    saved: list[tuple[ObjectId, str]] = []
+    try:
+        images = await CpuPool.run('isms_import.extract_images', extract_cell_images, xlsx_path)
+        ts_by_sheet: dict[str, str] = {}
+        for img in images:
+            vuln = await _find_image_target(col, img)
+            if not vuln:
+                continue
+            ts = ts_by_sheet.setdefault(img['sheet'], datetime.now().strftime('%Y%m%d_%H%M%S_%f'))
+            fname = f"imported_{ts}_{img['row_idx']}.{img['ext']}"
+            dest_dir = os.path.join(UPLOAD_DIR, str(vuln['_id']), img['file_type'])
+            os.makedirs(dest_dir, exist_ok=True)
+            with open(os.path.join(dest_dir, fname), 'wb') as f:
+                f.write(img['data'])
+            await col.update_one(
+                {'_id': vuln['_id']},
+                {'$set': {img['files_attr']: [{'name': fname, 'original': fname}]}},
+            )
+            saved.append((vuln['_id'], img['files_attr']))
     except Exception as e:  # noqa: BLE001 — 이미지 추출 실패는 임포트 전체를 막지 않음
-        import logging
-        logging.getLogger(__name__).warning('isms-p image extraction failed: %s', e)
+        logger.warning('isms-p image extraction failed: %s', e)
 
     return saved
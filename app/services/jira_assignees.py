@@ -0,0 +1,113 @@
+"""최근 90일 Jira 담당자 디렉터리 (jira_assignees).
+
+/issues/assignees가 매번 90일치 이슈를 모두 받아 이름만 뽑던 것을 대체한다.
+
+- 담당자별 last_seen(마지막으로 본 이슈 updated)을 Mongo에 유지
+- 미러 동기화(JiraIssueSyncService) 델타가 record()로 바로 반영하고,
+  미러를 쓰지 않으면 마지막 갱신 이후 `updated >=` 델타만 assignee 필드로 받아 반영
+- 조회는 메모리 스냅샷(이름 목록 + ETag)에서 바로 응답
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from dateutil import parser as dtparser
+from pymongo import UpdateOne
+
+from app.core.config import settings
+from app.db.mongo import MongoClientManager
+from app.jira.client import JiraClient
+from app.jira.jql_builder import JqlBuilder
+
+logger = logging.getLogger(__name__)
+
+_STATE_ID = "assignees"
+_WINDOW = timedelta(days=90)
+_DELTA_OVERLAP = timedelta(minutes=2)
+
+
+class AssigneeDirectory:
+    def __init__(self, client: JiraClient | None = None) -> None:
+        self.client = client or JiraClient()
+        self.ttl = settings.ASSIGNEE_DIRECTORY_TTL
+        self._names: List[str] = []
+        self._etag: str = ""
+        self._loaded_at: float = 0.0
+        self._lock = asyncio.Lock()
+
+    async def snapshot(self) -> Tuple[List[str], str]:
+        """(정렬된 담당자 이름 목록, ETag)."""
+        if self._etag and time.monotonic() - self._loaded_at < self.ttl:
+            return self._names, self._etag
+        async with self._lock:
+            # 락을 기다리는 동안 다른 요청이 갱신했을 수 있음
+            if self._etag and time.monotonic() - self._loaded_at < self.ttl:
+                return self._names, self._etag
+            await self._refresh_from_jira()
+            await self._load()
+        return self._names, self._etag
+
+    async def record(self, issues: List[Dict[str, Any]]) -> None:
+        """Jira 이슈 목록(델타)에서 담당자의 last_seen을 갱신."""
+        latest: Dict[str, datetime] = {}
+        for raw in issues:
+            f = raw.get("fields") or {}
+            assignee = f.get("assignee") if isinstance(f.get("assignee"), dict) else {}
+            name = assignee.get("displayName")
+            if not name or not f.get("updated"):
+                continue
+            seen = dtparser.isoparse(f["updated"]).astimezone(timezone.utc)
+            if name not in latest or seen > latest[name]:
+                latest[name] = seen
+        if not latest:
+            return
+        col = MongoClientManager.get_jira_assignees_collection()
+        await col.bulk_write(
+            [
+                UpdateOne({"_id": name}, {"$max": {"last_seen": seen}}, upsert=True)
+                for name, seen in latest.items()
+            ],
+            ordered=False,
+        )
+        # 다음 조회 때 Mongo에서 다시 읽도록
+        self._loaded_at = 0.0
+
+    async def _refresh_from_jira(self) -> None:
+        """미러를 쓰지 않을 때, 마지막 갱신 이후 바뀐 이슈의 담당자만 받아온다."""
+        state_col = MongoClientManager.get_jira_sync_state_collection()
+        state = await state_col.find_one({"_id": _STATE_ID}) or {}
+        last_refresh: Optional[datetime] = state.get("last_refresh")
+        if last_refresh and last_refresh.tzinfo is None:
+            last_refresh = last_refresh.replace(tzinfo=timezone.utc)
+        if last_refresh and settings.JIRA_MIRROR_ENABLED:
+            # JiraIssueSyncService가 record()로 이미 반영 중
+            return
+
+        now = datetime.now(timezone.utc)
+        start = (last_refresh - _DELTA_OVERLAP) if last_refresh else now - _WINDOW
+        slices = JqlBuilder().with_field("updated").between(start, now).split(
+            timedelta(days=settings.JIRA_SEARCH_SLICE_DAYS)
+        )
+        issues = await self.client.search_many(
+            [b.build() for b in slices], fields=["assignee", "updated"]
+        )
+        await self.record(issues)
+        await state_col.update_one({"_id": _STATE_ID}, {"$set": {"last_refresh": now}}, upsert=True)
+        logger.info("Assignee directory refreshed from %d issues", len(issues))
+
+    async def _load(self) -> None:
+        col = MongoClientManager.get_jira_assignees_collection()
+        since = datetime.now(timezone.utc) - _WINDOW
+        docs = await col.find({"last_seen": {"$gte": since}}, {"_id": 1}).to_list(None)
+        names = sorted(d["_id"] for d in docs if d["_id"] != "Unassigned")
+        self._names = names
+        self._etag = '"' + hashlib.sha1("\n".join(names).encode("utf-8")).hexdigest() + '"'
+        self._loaded_at = time.monotonic()
+
+
+assignee_directory = AssigneeDirectory()
@@ -0,0 +1,211 @@
+"""Jira 이슈 로컬 미러(jira_issues) — 델타 동기화 + Mongo 조회.
+
+app/services/jira_poller.py의 백그라운드 루프 구조(asyncio.create_task + start/stop)를
+그대로 따른다.
+
+- 델타: `updated >= last_sync` 로 바뀐 이슈만 받아 upsert
+- 재조정(reconcile): JIRA_MIRROR_RECONCILE_HOURS 마다 보관 구간 전체를 다시 받아
+  upsert 하고, 이번 실행에서 보이지 않은(삭제/권한 변경된) 이슈를 제거
+- JiraTaskService.fetch_grouped는 미러가 최신이고 요청 구간을 덮고 있으면
+  Jira 대신 JiraIssueMirror.find()로 응답한다
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from dateutil import parser as dtparser
+from pymongo import UpdateOne
+
+from app.core.config import settings
+from app.db.mongo import MongoClientManager
+from app.jira.client import JiraClient
+from app.services.jira_assignees import assignee_directory
+
+logger = logging.getLogger(__name__)
+
+MIRROR_FIELDS = [
+    "summary",
+    "status",
+    "assignee",
+    "created",
+    "updated",
+    "duedate",
+    "customfield_10015",
+]
+
+_STATE_ID = "state"
+_BULK_CHUNK = 500
+# JQL 날짜 비교는 분 단위라 경계에서 놓치지 않도록 겹쳐서 가져온다
+_DELTA_OVERLAP = timedelta(minutes=2)
+
+
+def _parse_dt(val: Optional[str]) -> Optional[datetime]:
+    if not val:
+        return None
+    return dtparser.isoparse(val).astimezone(timezone.utc)
+
+
+def _to_mirror_doc(raw: Dict[str, Any], run_id: str, now: datetime) -> Dict[str, Any]:
+    f = raw.get("fields") or {}
+    assignee = f.get("assignee") if isinstance(f.get("assignee"), dict) else {}
+    return {
+        "key": raw.get("key"),
+        "fields": {k: f.get(k) for k in MIRROR_FIELDS},
+        # 조회용 정규화 필드
+        "created_at": _parse_dt(f.get("created")),
+        "updated_at": _parse_dt(f.get("updated")),
+        "due_day": f.get("duedate"),
+        "assignee_name": assignee.get("displayName"),
+        "assignee_account_id": assignee.get("accountId"),
+        "synced_at": now,
+        "run_id": run_id,
+    }
+
+
+class JiraIssueMirror:
+    """jira_issues 컬렉션 조회 전용."""
+
+    def __init__(self, interval: int | None = None) -> None:
+        self.interval = interval or settings.JIRA_MIRROR_SYNC_INTERVAL
+
+    async def covers(self, date_field: str, start: datetime) -> bool:
+        """미러가 최근에 동기화되었고 start 이후 구간을 모두 담고 있는지."""
+        state = await MongoClientManager.get_jira_sync_state_collection().find_one({"_id": _STATE_ID})
+        if not state or not state.get("last_sync") or not state.get("covered_since"):
+            return False
+        last_sync = state["last_sync"]
+        covered_since = state["covered_since"]
+        if last_sync.tzinfo is None:
+            last_sync = last_sync.replace(tzinfo=timezone.utc)
+        if covered_since.tzinfo is None:
+            covered_since = covered_since.replace(tzinfo=timezone.utc)
+        now = datetime.now(timezone.utc)
+        if now - last_sync > timedelta(seconds=self.interval * 3):
+            return False
+        return start >= covered_since
+
+    async def find(
+        self,
+        date_field: str,
+        start: datetime,
+        end: datetime,
+        assignees: Optional[List[str]],
+    ) -> List[Dict[str, Any]]:
+        """JqlBuilder.build()와 같은 조건(양 끝 포함, 분/일 단위)으로 미러를 조회."""
+        query: Dict[str, Any] = {}
+        if date_field == "due":
+            query["due_day"] = {"$gte": start.strftime("%Y-%m-%d"), "$lte": end.strftime("%Y-%m-%d")}
+        else:
+            col_field = "created_at" if date_field == "created" else "updated_at"
+            lo = start.replace(second=0, microsecond=0)
+            hi = end.replace(second=0, microsecond=0) + timedelta(minutes=1)
+            query[col_field] = {"$gte": lo, "$lt": hi}
+        if assignees:
+            query["$or"] = [
+                {"assignee_name": {"$in": assignees}},
+                {"assignee_account_id": {"$in": assignees}},
+            ]
+        col = MongoClientManager.get_jira_issues_collection()
+        return await col.find(query, {"_id": 0, "key": 1, "fields": 1}).to_list(None)
+
+
+class JiraIssueSyncService:
+    def __init__(self):
+        self.interval = settings.JIRA_MIRROR_SYNC_INTERVAL
+        self.backfill = timedelta(days=settings.JIRA_MIRROR_BACKFILL_DAYS)
+        self.reconcile_every = timedelta(hours=settings.JIRA_MIRROR_RECONCILE_HOURS)
+        self.jira = JiraClient()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._sync_loop())
+        logger.info(
+            "JiraIssueSyncService started (interval=%ds, backfill=%s)",
+            self.interval,
+            self.backfill,
+        )
+
+    def stop(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+            logger.info("JiraIssueSyncService stopped")
+
+    async def _sync_loop(self) -> None:
+        while True:
+            try:
+                await self._sync_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Jira mirror sync failed")
+            await asyncio.sleep(self.interval)
+
+    async def _sync_once(self) -> None:
+        state_col = MongoClientManager.get_jira_sync_state_collection()
+        state = await state_col.find_one({"_id": _STATE_ID}) or {}
+        now = datetime.now(timezone.utc)
+
+        last_sync = state.get("last_sync")
+        last_reconcile = state.get("last_reconcile")
+        if last_sync and last_sync.tzinfo is None:
+            last_sync = last_sync.replace(tzinfo=timezone.utc)
+        if last_reconcile and last_reconcile.tzinfo is None:
+            last_reconcile = last_reconcile.replace(tzinfo=timezone.utc)
+
+        if not last_sync or not last_reconcile or now - last_reconcile >= self.reconcile_every:
+            await self.reconcile(now)
+            return
+
+        since = last_sync - _DELTA_OVERLAP
+        jql = f'updated >= "{since.strftime("%Y-%m-%d %H:%M")}" ORDER BY updated ASC'
+        issues = await self.jira.search(jql, fields=MIRROR_FIELDS)
+        await self._upsert(issues, run_id=state.get("run_id") or "", now=now)
+        await state_col.update_one({"_id": _STATE_ID}, {"$set": {"last_sync": now}}, upsert=True)
+        logger.info("Jira mirror delta sync: %d issues", len(issues))
+
+    async def reconcile(self, now: datetime | None = None) -> int:
+        """보관 구간 전체를 다시 받아 미러를 Jira와 맞춘다."""
+        now = now or datetime.now(timezone.utc)
+        covered_since = now - self.backfill
+        run_id = uuid.uuid4().hex
+        since_min = covered_since.strftime("%Y-%m-%d %H:%M")
+        since_day = covered_since.strftime("%Y-%m-%d")
+        jql = f'updated >= "{since_min}" OR due >= "{since_day}" ORDER BY updated ASC'
+        issues = await self.jira.search(jql, fields=MIRROR_FIELDS)
+        await self._upsert(issues, run_id=run_id, now=now)
+
+        # 이번 재조정에서 보이지 않은 이슈 = 삭제되었거나 보관 구간 밖으로 밀려난 이슈
+        col = MongoClientManager.get_jira_issues_collection()
+        removed = await col.delete_many({"run_id": {"$ne": run_id}, "synced_at": {"$lt": now}})
+
+        await MongoClientManager.get_jira_sync_state_collection().update_one(
+            {"_id": _STATE_ID},
+            {"$set": {
+                "last_sync": now,
+                "last_reconcile": now,
+                "covered_since": covered_since,
+                "run_id": run_id,
+            }},
+            upsert=True,
+        )
+        logger.info(
+            "Jira mirror reconcile: %d issues, %d removed",
+            len(issues),
+            removed.deleted_count,
+        )
+        return len(issues)
+
+    async def _upsert(self, issues: List[Dict[str, Any]], *, run_id: str, now: datetime) -> None:
+        col = MongoClientManager.get_jira_issues_collection()
+        ops = [
+            UpdateOne({"_id": raw["key"]}, {"$set": _to_mirror_doc(raw, run_id, now)}, upsert=True)
+            for raw in issues
+            if raw.get("key")
+        ]
+        for i in range(0, len(ops), _BULK_CHUNK):
+            await col.bulk_write(ops[i:i + _BULK_CHUNK], ordered=False)
+        await assignee_directory.record(issues)
@@ -4,9 +4,10 @@ import asyncio
 import logging
 from datetime import datetime, timezone
 
-import httpx
+from pymongo import UpdateOne
 
 from app.core.config import settings
+from app.core.http_client import HttpClientManager
 from app.db.mongo import MongoClientManager
 from app.jira.attachment import extract_text_from_attachment
 from app.jira.client import JiraClient
@@ -64,15 +65,33 @@ class JiraPollerService:
         )
         print(f"[Poller] Found {len(issues)} issues")
 
+        # 이미 Pilot에 전달된 이슈는 건너뛰기
+        processed = await self._processed_keys(col, [issue["key"] for issue in issues])
+        todo = []
         for issue in issues:
-            issue_key = issue["key"]
-            # 이미 Pilot에 전달된 이슈는 건너뛰기
-            if await self._is_processed(col, issue_key):
-                print(f"[Poller] Skipping {issue_key} (already processed)")
-                continue
-            enriched = await self._enrich_with_attachments(issue)
-            await self._forward_to_pilot(enriched)
-            await self._mark_pending(col, issue_key, issue)
+            if issue["key"] in processed:
+                print(f"[Poller] Skipping {issue['key']} (already processed)")
+            else:
+                todo.append(issue)
+
+        sem = asyncio.Semaphore(max(settings.PILOT_POLL_WORKERS, 1))
+
+        async def handle(issue: dict) -> dict:
+            async with sem:
+                enriched = await self._enrich_with_attachments(issue)
+                await self._forward_to_pilot(enriched)
+                return issue
+
+        results = await asyncio.gather(*(handle(i) for i in todo), return_exceptions=True)
+        forwarded = [r for r in results if isinstance(r, dict)]
+        failed = [(i["key"], r) for i, r in zip(todo, results) if isinstance(r, BaseException)]
+        await self._mark_pending_many(col, forwarded)
+
+        if failed:
+            for key, err in failed:
+                logger.error("Pilot 전달 실패 %s: %s", key, err)
+            # 실패한 이슈가 다음 폴링에서 다시 잡히도록 last_checked를 올리지 않는다
+            raise RuntimeError(f"{len(failed)}건 Pilot 전달 실패")
 
         await self._set_last_checked(col, now)
 
@@ -117,9 +136,9 @@ class JiraPollerService:
             "issue": issue,
         }
         url = f"{self.gateway_url}/webhooks/jira"
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.post(url, json=payload)
-            resp.raise_for_status()
+        client = HttpClientManager.get_client()
+        resp = await client.post(url, json=payload, timeout=30.0)
+        resp.raise_for_status()
         logger.info("Forwarded %s to Pilot", issue["key"])
 
     # --- state helpers ---
@@ -137,24 +156,34 @@ class JiraPollerService:
             upsert=True,
         )
 
-    async def _is_processed(self, col, issue_key: str) -> bool:
-        """이슈가 이미 Pilot에 전달되었는지 확인 (pending 또는 completed)"""
-        doc = await col.find_one({"_id": f"processed:{issue_key}"})
-        return doc is not None
-
-    async def _mark_pending(self, col, issue_key: str, issue: dict) -> None:
-        """이슈를 pending으로 마킹 (Pilot에 전달됨, 완료 대기 중)"""
-        fields = issue.get("fields", {})
+    async def _processed_keys(self, col, issue_keys: list[str]) -> set[str]:
+        """이미 Pilot에 전달된(pending 또는 completed) 이슈 key 집합 — $in 한 번으로 조회"""
+        if not issue_keys:
+            return set()
+        ids = [f"processed:{k}" for k in issue_keys]
+        docs = await col.find({"_id": {"$in": ids}}, {"_id": 1}).to_list(None)
+        return {d["_id"].split(":", 1)[1] for d in docs}
+
+    async def _mark_pending_many(self, col, issues: list[dict]) -> None:
+        """이슈들을 pending으로 마킹 (Pilot에 전달됨, 완료 대기 중) — bulk_write 한 번"""
+        if not issues:
+            return
         jira_base = settings.JIRA_BASE_URL.rstrip("/")
-        await col.update_one(
-            {"_id": f"processed:{issue_key}"},
-            {"$set": {
-                "status": "pending",
-                "sent_at": datetime.now(timezone.utc),
-                "summary": fields.get("summary", ""),
-                "project_key": fields.get("project", {}).get("key", ""),
-                "issue_url": f"{jira_base}/browse/{issue_key}",
-            }},
-            upsert=True,
-        )
-        print(f"[Poller] Marked {issue_key} as pending (waiting for Pilot callback)")
+        sent_at = datetime.now(timezone.utc)
+        ops = []
+        for issue in issues:
+            issue_key = issue["key"]
+            fields = issue.get("fields", {})
+            ops.append(UpdateOne(
+                {"_id": f"processed:{issue_key}"},
+                {"$set": {
+                    "status": "pending",
+                    "sent_at": sent_at,
+                    "summary": fields.get("summary", ""),
+                    "project_key": fields.get("project", {}).get("key", ""),
+                    "issue_url": f"{jira_base}/browse/{issue_key}",
+                }},
+                upsert=True,
+            ))
+        await col.bulk_write(ops, ordered=False)
+        print(f"[Poller] Marked {len(ops)} issues as pending (waiting for Pilot callback)")
@@ -1,22 +1,46 @@
 from __future__ import annotations
+import json
 from typing import List, Optional, Dict, Any
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
+from app.core.config import settings
 from app.utils.time import TimeUtil, TimeProvider, KST
+from app.utils.ttl_cache import AsyncTtlCache
 from app.jira.jql_builder import JqlBuilder
 from app.jira.client import JiraClient
+from app.services.jira_mirror import JiraIssueMirror
 from app.models.issue import Issue, AssigneeGroup, GroupedResponse
 from dateutil import parser as dtparser
 
 
+# 대시보드 사용자 여럿이 같은 주간을 조회해도 Jira 검색은 한 번만 나가도록
+# 모든 JiraTaskService 인스턴스가 공유하는 검색 결과 캐시
+_search_cache = AsyncTtlCache(
+    ttl=settings.JIRA_CACHE_TTL,
+    stale_ttl=settings.JIRA_CACHE_STALE_TTL,
+    max_bytes=settings.JIRA_CACHE_MAX_BYTES,
+    sizeof=lambda raw: len(json.dumps(raw, default=str)),
+)
+
+
+def search_cache_stats() -> Dict[str, Any]:
+    return _search_cache.stats()
+
+
 class JiraTaskService:
     def __init__(
         self,
         client: JiraClient | None = None,
         time_provider: TimeProvider | None = None,
         default_fields: Optional[List[str]] = None,
+        cache: AsyncTtlCache | None = None,
+        mirror: JiraIssueMirror | None = None,
     ) -> None:
         self.client = client or JiraClient()
+        self.cache = cache or _search_cache
+        if mirror is None and settings.JIRA_MIRROR_ENABLED:
+            mirror = JiraIssueMirror()
+        self.mirror = mirror
         self.time = time_provider or TimeProvider()
         self.default_fields = default_fields or [
             "summary",
@@ -75,6 +99,36 @@ class JiraTaskService:
         groups.sort(key=lambda g: (g.assignee.lower() if g.assignee else "zzz"))
         return groups
 
+    @staticmethod
+    def _with_extra_filters(jql: str, extra_filters: Optional[List[str]]) -> str:
+        if not extra_filters:
+            return jql
+        order_idx = jql.rfind(" ORDER BY ")
+        if order_idx == -1:
+            return jql + " AND (" + ") AND (".join(extra_filters) + ")"
+        core = jql[:order_idx]
+        order = jql[order_idx:]
+        return core + " AND (" + ") AND (".join(extra_filters) + ")" + order
+
+    @staticmethod
+    def _cache_key(jqls: List[str], fields: List[str]) -> tuple:
+        normalized = tuple(" ".join(j.split()) for j in jqls)
+        return normalized, tuple(sorted(fields))
+
+    async def _search_cached(self, jqls: List[str], end_utc: datetime) -> List[Dict[str, Any]]:
+        if not settings.JIRA_CACHE_ENABLED:
+            return await self.client.search_many(jqls, self.default_fields)
+        # 이미 지난 기간은 거의 바뀌지 않으므로 더 오래 보관한다
+        if end_utc < TimeUtil.now_utc() - timedelta(days=1):
+            ttl = settings.JIRA_CACHE_HISTORIC_TTL
+        else:
+            ttl = settings.JIRA_CACHE_TTL
+        return await self.cache.get_or_load(
+            self._cache_key(jqls, self.default_fields),
+            lambda: self.client.search_many(jqls, self.default_fields),
+            ttl=ttl,
+        )
+
     async def fetch_grouped(
         self,
         start: str,
@@ -97,18 +151,18 @@ class JiraTaskService:
             .order_by("ASC")
         )
 
-        jql = builder.build()
-
-        if extra_filters:
-            order_idx = jql.rfind(" ORDER BY ")
-            if order_idx == -1:
-                jql = jql + " AND (" + ") AND (".join(extra_filters) + ")"
-            else:
-                core = jql[:order_idx]
-                order = jql[order_idx:]
-                jql = core + " AND (" + ") AND (".join(extra_filters) + ")" + order
-
-        raw = await self.client.search(jql, self.default_fields)
+        # 미러는 임의 JQL(extra_filters)을 해석할 수 없으므로 기본 조건일 때만 사용
+        if (
+            self.mirror is not None
+            and not extra_filters
+            and await self.mirror.covers(builder.field, s_utc)
+        ):
+            raw = await self.mirror.find(builder.field, s_utc, e_utc, assignees)
+        else:
+            # 긴 기간은 날짜 하위 구간으로 나눠 동시에 조회한다 (client.search_many가 key로 병합)
+            slices = builder.split(timedelta(days=settings.JIRA_SEARCH_SLICE_DAYS))
+            jqls = [self._with_extra_filters(b.build(), extra_filters) for b in slices]
+            raw = await self._search_cached(jqls, e_utc)
         issues = [self._to_issue_model(r) for r in raw]
         groups = self._group_by_assignee(issues)
 
@@ -0,0 +1,374 @@
+"""PM 기간 롤업 — (ISO 주차, 프로젝트, 담당자) 단위로 이슈 참조와 건수를 미리 모아 둔다.
+
+주간/월간 보고서 생성과 새로고침(aggregate_period)이 pm_issues를 매번 조건 조회하는 대신
+해당 주차의 버킷만 읽어 합친다.
+
+- 버킷 _id: "<주차>:<project_id>:<assignee_id 또는 ->", 주차는 "2025-W23" 형식
+- TASK/SUB_TASK 이슈는 시작일 주차와 마감일 주차 버킷에 들어가고, 진행 중이면 날짜와 무관하게
+  ACTIVE 버킷에도 들어간다 (보고서 조회 조건과 같은 기준)
+- items: {이슈 id: 보고서에 필요한 필드}, counts: completed / in_progress / delayed / upcoming
+  (delayed = 완료되지 않았고 마감일이 그 주차 이전, ACTIVE 버킷은 세지 않음)
+- 이슈 생성/수정/삭제 시 apply_issue_change()로 바뀐 버킷만 증분 갱신한다
+- rebuild_rollup()은 임시 컬렉션에 전체를 다시 만들어 rename으로 교체한다
+  (scripts/rebuild_pm_rollup.py). 그 사이에 바뀐 이슈는 교체 후 다시 반영한다.
+  재구축은 앱과 다른 프로세스에서 돌 수 있으므로, 수정은 pm_issues.updated_at으로,
+  삭제(이슈/프로젝트)는 pm_rollup_tombstones에 남긴 기록으로 찾는다.
+- 메타 문서가 없으면(최초 배포, 증분 갱신 실패) 보고서는 pm_issues를 직접 조회하고
+  백그라운드에서 재구축한다
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from app.core.config import settings
+from app.db.mongo import MongoClientManager
+
+logger = logging.getLogger(__name__)
+
+# 보고서 WorkItem을 만드는 데 필요한 이슈 필드 (롤업 참조에도 이 필드만 저장)
+ISSUE_FIELDS = {
+    "number": 1, "title": 1, "type": 1, "project_id": 1, "assignee_id": 1,
+    "status": 1, "priority": 1, "epic_id": 1, "sprint_id": 1,
+    "start_date": 1, "due_date": 1, "story_points": 1, "parent_issue_id": 1,
+}
+
+REPORT_TYPES = ["TASK", "SUB_TASK"]
+ACTIVE = "ACTIVE"
+_META_ID = "__meta__"
+_COUNTS = ("completed", "in_progress", "delayed", "upcoming")
+_INSERT_BATCH = 500
+
+
+# ── 주차 계산 ────────────────────────────────────────────────────────
+
+def _utc(dt: datetime) -> datetime:
+    """Mongo에서 읽은 naive datetime은 UTC로 간주."""
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+
+
+def _week_of(d: date) -> str:
+    year, week, _ = d.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def iso_week(dt: datetime) -> str:
+    return _week_of(_utc(dt).date())
+
+
+def weeks_between(start: datetime, end: datetime) -> List[str]:
+    """[start, end] 기간과 겹치는 ISO 주차 목록."""
+    first, last = _utc(start).date(), _utc(end).date()
+    monday = first - timedelta(days=first.weekday())
+    weeks = []
+    while monday <= last:
+        weeks.append(_week_of(monday))
+        monday += timedelta(days=7)
+    return weeks
+
+
+# ── 버킷 배치 / 건수 ─────────────────────────────────────────────────
+
+def _ref(doc: dict) -> dict:
+    # 프로젝션과 같게 없는 필드는 빼 둔다 (doc.get(k, 기본값)이 그대로 동작하도록)
+    ref = {k: doc[k] for k in ISSUE_FIELDS if k in doc}
+    ref["_id"] = doc["_id"]
+    return ref
+
+
+def _bucket_id(week: str, ref: dict) -> str:
+    return f"{week}:{ref.get('project_id')}:{ref.get('assignee_id') or '-'}"
+
+
+def _placements(ref: dict) -> Dict[str, str]:
+    """이슈가 들어갈 버킷 {bucket_id: 주차}."""
+    if ref.get("type") not in REPORT_TYPES or not ref.get("project_id"):
+        return {}
+    weeks = {iso_week(ref[f]) for f in ("start_date", "due_date") if ref.get(f)}
+    if ref.get("status") == "IN_PROGRESS":
+        weeks.add(ACTIVE)
+    return {_bucket_id(w, ref): w for w in weeks}
+
+
+def _contribution(ref: dict, week: str) -> Dict[str, int]:
+    status = ref.get("status") or "BACKLOG"
+    done = status == "DONE"
+    due = ref.get("due_date")
+    return {
+        "completed": int(done),
+        "in_progress": int(not done),
+        "delayed": int(not done and week != ACTIVE and due is not None and iso_week(due) <= week),
+        "upcoming": int(ref.get("type") == "TASK" and status in ("TODO", "BACKLOG")),
+    }
+
+
+# ── 증분 갱신 ────────────────────────────────────────────────────────
+
+_rebuilding = False
+_dirty: Set[ObjectId] = set()
+
+
+async def _write(key: str, old: Dict[str, Tuple[dict, str]], new_doc: Optional[dict]) -> None:
+    """old({bucket_id: (이전 참조, 주차)})에서 new_doc 기준 배치로 옮긴다."""
+    col = MongoClientManager.get_pm_period_rollup_collection()
+    now = datetime.now(timezone.utc)
+    new_ref = _ref(new_doc) if new_doc else None
+    new = _placements(new_ref) if new_ref else {}
+
+    ops = []
+    removed = []
+    for bid, (ref, week) in old.items():
+        if bid in new:
+            continue
+        dec = _contribution(ref, week)
+        ops.append(UpdateOne({"_id": bid}, {
+            "$unset": {f"items.{key}": ""},
+            "$inc": {f"counts.{k}": -dec[k] for k in _COUNTS},
+        }))
+        removed.append(bid)
+    for bid, week in new.items():
+        inc = _contribution(new_ref, week)
+        if bid in old:
+            prev = _contribution(*old[bid])
+            inc = {k: inc[k] - prev[k] for k in _COUNTS}
+        ops.append(UpdateOne({"_id": bid}, {
+            "$set": {f"items.{key}": new_ref, "updated_at": now},
+            "$inc": {f"counts.{k}": inc[k] for k in _COUNTS},
+            "$setOnInsert": {
+                "week": week,
+                "project_id": new_ref["project_id"],
+                "assignee_id": new_ref.get("assignee_id"),
+            },
+        }, upsert=True))
+    if not ops:
+        return
+    await col.bulk_write(ops, ordered=False)
+    if removed:
+        await col.delete_many({"_id": {"$in": removed}, "items": {}})
+
+
+async def _record_delete(**target: ObjectId) -> None:
+    """삭제 기록 — 다른 프로세스에서 진행 중인 재구축이 교체 후 이 삭제를 다시 반영한다."""
+    await MongoClientManager.get_pm_rollup_tombstones_collection().insert_one(
+        {**target, "deleted_at": datetime.now(timezone.utc)}
+    )
+
+
+async def apply_issue_change(old_doc: Optional[dict], new_doc: Optional[dict]) -> None:
+    """이슈 생성(old=None) / 수정 / 삭제(new=None) 후 호출. 실패해도 요청은 계속 진행한다."""
+    if not settings.PM_ROLLUP_ENABLED:
+        return
+    iid = (new_doc or old_doc)["_id"]
+    if _rebuilding:
+        _dirty.add(iid)
+    old: Dict[str, Tuple[dict, str]] = {}
+    if old_doc:
+        ref = _ref(old_doc)
+        old = {bid: (ref, week) for bid, week in _placements(ref).items()}
+    try:
+        if new_doc is None:
+            await _record_delete(issue_id=iid)
+        await _write(str(iid), old, new_doc)
+    except Exception:
+        logger.exception("PM 기간 롤업 증분 갱신 실패 — 재구축 예약")
+        await _mark_stale()
+
+
+async def remove_project_rollup(project_id: ObjectId) -> None:
+    if not settings.PM_ROLLUP_ENABLED:
+        return
+    try:
+        await _record_delete(project_id=project_id)
+        await MongoClientManager.get_pm_period_rollup_collection().delete_many({"project_id": project_id})
+    except Exception:
+        logger.exception("PM 기간 롤업 프로젝트 삭제 반영 실패 — 재구축 예약")
+        await _mark_stale()
+
+
+async def _mark_stale() -> None:
+    try:
+        await MongoClientManager.get_pm_period_rollup_collection().delete_one({"_id": _META_ID})
+    except Exception:
+        logger.exception("PM 기간 롤업 메타 삭제 실패")
+    rebuild_rollup_soon()
+
+
+async def _resync(iids: Iterable[ObjectId]) -> None:
+    """롤업에 들어 있는 참조를 현재 이슈 문서 기준으로 다시 맞춘다 (재구축 중 변경분)."""
+    col = MongoClientManager.get_pm_period_rollup_collection()
+    issues_col = MongoClientManager.get_pm_issues_collection()
+    for iid in iids:
+        key = str(iid)
+        # items.<id>에는 인덱스가 없어 롤업 전체를 훑는다 — 재구축 직후 소수 건에만 사용
+        old = {
+            b["_id"]: (b["items"][key], b["week"])
+            async for b in col.find({f"items.{key}": {"$exists": True}}, {f"items.{key}": 1, "week": 1})
+        }
+        new_doc = await issues_col.find_one({"_id": iid}, ISSUE_FIELDS)
+        await _write(key, old, new_doc)
+
+
+# ── 재구축 ──────────────────────────────────────────────────────────
+
+async def rebuild_rollup() -> dict:
+    """pm_issues 전체로 롤업을 다시 만든다."""
+    global _rebuilding
+    db = MongoClientManager.get_db()
+    name = MongoClientManager.PM_PERIOD_ROLLUP
+    # 여러 워커가 동시에 재구축해도 서로의 임시 컬렉션을 건드리지 않도록 이름을 구분
+    tmp = db[f"{name}_build_{ObjectId()}"]
+    issues_col = MongoClientManager.get_pm_issues_collection()
+    started = datetime.now(timezone.utc)
+
+    _rebuilding = True
+    _dirty.clear()
+    try:
+        buckets: Dict[str, dict] = {}
+        issues = 0
+        async for doc in issues_col.find({"type": {"$in": REPORT_TYPES}}, ISSUE_FIELDS):
+            ref = _ref(doc)
+            key = str(doc["_id"])
+            for bid, week in _placements(ref).items():
+                b = buckets.get(bid)
+                if b is None:
+                    b = buckets[bid] = {
+                        "_id": bid,
+                        "week": week,
+                        "project_id": ref["project_id"],
+                        "assignee_id": ref.get("assignee_id"),
+                        "items": {},
+                        "counts": {k: 0 for k in _COUNTS},
+                        "updated_at": started,
+                    }
+                b["items"][key] = ref
+                for k, v in _contribution(ref, week).items():
+                    b["counts"][k] += v
+            issues += 1
+
+        docs = list(buckets.values())
+        for i in range(0, len(docs), _INSERT_BATCH):
+            await tmp.insert_many(docs[i:i + _INSERT_BATCH], ordered=False)
+        await tmp.insert_one({
+            "_id": _META_ID,
+            "built_at": datetime.now(timezone.utc),
+            "issues": issues,
+            "buckets": len(docs),
+        })
+        await tmp.create_index("week")
+        await tmp.rename(name, dropTarget=True)
+
+        # 재구축 중 바뀐 이슈: 같은 프로세스의 변경 + 수정 시각 + 삭제 기록 (다른 프로세스 변경분)
+        dirty = set(_dirty)
+        async for d in issues_col.find({"updated_at": {"$gte": started}}, {"_id": 1}):
+            dirty.add(d["_id"])
+        deleted_projects = set()
+        tombstones = MongoClientManager.get_pm_rollup_tombstones_collection()
+        async for t in tombstones.find({"deleted_at": {"$gte": started}}):
+            if t.get("issue_id"):
+                dirty.add(t["issue_id"])
+            if t.get("project_id"):
+                deleted_projects.add(t["project_id"])
+    except Exception:
+        await tmp.drop()
+        raise
+    finally:
+        _rebuilding = False
+        _dirty.clear()
+
+    await _resync(dirty)
+    if deleted_projects:
+        await MongoClientManager.get_pm_period_rollup_collection().delete_many(
+            {"project_id": {"$in": list(deleted_projects)}}
+        )
+    logger.info("PM 기간 롤업 재구축 완료: 이슈 %d건, 버킷 %d개, 재반영 %d건", issues, len(docs), len(dirty))
+    return {"issues": issues, "buckets": len(docs), "resynced": len(dirty)}
+
+
+_rebuild_task: asyncio.Task | None = None
+
+
+def rebuild_rollup_soon() -> None:
+    global _rebuild_task
+    if not settings.PM_ROLLUP_ENABLED:
+        return
+    if _rebuild_task is not None and not _rebuild_task.done():
+        return
+
+    async def run() -> None:
+        try:
+            await rebuild_rollup()
+        except Exception:
+            logger.exception("PM 기간 롤업 재구축 실패")
+
+    _rebuild_task = asyncio.create_task(run())
+
+
+async def _ready() -> bool:
+    col = MongoClientManager.get_pm_period_rollup_collection()
+    return await col.find_one({"_id": _META_ID}, {"_id": 1}) is not None
+
+
+async def ensure_rollup() -> None:
+    """앱 시작 시 호출 — 롤업이 없으면 백그라운드에서 만든다."""
+    if settings.PM_ROLLUP_ENABLED and not await _ready():
+        rebuild_rollup_soon()
+
+
+# ── 조회 ────────────────────────────────────────────────────────────
+
+def _in(v: Optional[datetime], start: datetime, end: datetime) -> bool:
+    return v is not None and start <= _utc(v) <= end
+
+
+async def period_issue_docs(
+    start_dt: datetime,
+    end_dt: datetime,
+    next_start_dt: Optional[datetime] = None,
+    next_end_dt: Optional[datetime] = None,
+) -> Optional[Tuple[List[dict], List[dict]]]:
+    """(현재 기간 이슈, 차기 기간 예정 이슈) — 롤업을 쓸 수 없으면 None.
+
+    aggregate_period의 pm_issues 조회 조건과 같은 결과를 number 순으로 돌려준다.
+    """
+    if not settings.PM_ROLLUP_ENABLED:
+        return None
+    if not await _ready():
+        rebuild_rollup_soon()
+        return None
+
+    has_next = bool(next_start_dt and next_end_dt)
+    weeks = {ACTIVE, *weeks_between(start_dt, end_dt)}
+    if has_next:
+        weeks.update(weeks_between(next_start_dt, next_end_dt))
+
+    refs: Dict[str, dict] = {}
+    col = MongoClientManager.get_pm_period_rollup_collection()
+    async for b in col.find({"week": {"$in": list(weeks)}}, {"items": 1}):
+        refs.update(b.get("items") or {})
+
+    s, e = _utc(start_dt), _utc(end_dt)
+    docs = [
+        r for r in refs.values()
+        if r["type"] in REPORT_TYPES and (
+            _in(r.get("start_date"), s, e)
+            or _in(r.get("due_date"), s, e)
+            or r.get("status") == "IN_PROGRESS"
+        )
+    ]
+    udocs: List[dict] = []
+    if has_next:
+        ns, ne = _utc(next_start_dt), _utc(next_end_dt)
+        udocs = [
+            r for r in refs.values()
+            if r["type"] == "TASK" and r.get("status") in ("TODO", "BACKLOG") and (
+                _in(r.get("start_date"), ns, ne) or _in(r.get("due_date"), ns, ne)
+            )
+        ]
+    docs.sort(key=lambda r: r["number"])
+    udocs.sort(key=lambda r: r["number"])
+    return docs, udocs
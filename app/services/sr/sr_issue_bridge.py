@@ -7,6 +7,7 @@ from bson import ObjectId
 
 from app.db.mongo import MongoClientManager
 from app.services.pm.issue_service import next_issue_number
+from app.services.pm.period_rollup import apply_issue_change
 
 _REQUEST_TYPE_LABEL: dict[str, str] = {
     "IMPROVEMENT": "기능 개선",
@@ -78,7 +79,7 @@ async def auto_create_pm_issue(
     now = datetime.now(timezone.utc)
     issues_col = MongoClientManager.get_pm_issues_collection()
 
-    result = await issues_col.insert_one({
+    doc = {
         "project_id": project_id,
         "number": number,
         "title": f"[{sr_no}] {sr.get('title', '')}",
@@ -100,7 +101,9 @@ async def auto_create_pm_issue(
         "linked_sr_id": str(sr["_id"]),
         "created_at": now,
         "updated_at": now,
-    })
+    }
+    result = await issues_col.insert_one(doc)
+    await apply_issue_change(None, doc)
 
     return str(result.inserted_id), str(project_id)
 
@@ -108,10 +111,10 @@ async def auto_create_pm_issue(
 async def update_pm_issue_assignee(issue_id: str, assignee_id: str) -> None:
     """재배정 시 기존 PM 이슈 담당자만 업데이트."""
     issues_col = MongoClientManager.get_pm_issues_collection()
-    await issues_col.update_one(
-        {"_id": ObjectId(issue_id)},
-        {"$set": {
-            "assignee_id": ObjectId(assignee_id) if assignee_id else None,
-            "updated_at": datetime.now(timezone.utc),
-        }},
-    )
+    changes = {
+        "assignee_id": ObjectId(assignee_id) if assignee_id else None,
+        "updated_at": datetime.now(timezone.utc),
+    }
+    old = await issues_col.find_one_and_update({"_id": ObjectId(issue_id)}, {"$set": changes})
+    if old:
+        await apply_issue_change(old, {**old, **changes})
@@ -9,6 +9,7 @@ from fastapi import HTTPException
 
 from app.db.mongo import MongoClientManager
 from app.models.user import UserPublic
+from app.utils.search_tokens import SEARCH_FIELD, SEARCH_VERSION_FIELD
 
 # ── SR 역할 상수 ──────────────────────────────────────────────────────
 
@@ -151,9 +152,11 @@ async def record_due_date_history(
 
 # ── 지연 여부 계산 ────────────────────────────────────────────────────
 
+_NON_DELAYED_STATUSES = ["DRAFT", "COMPLETED", "CONFIRMING", "CLOSED", "CANCELLED", "REJECTED"]
+
+
 def compute_is_delayed(doc: dict) -> bool:
-    non_delayed = {"DRAFT", "COMPLETED", "CONFIRMING", "CLOSED", "CANCELLED", "REJECTED"}
-    if doc.get("status") in non_delayed:
+    if doc.get("status") in _NON_DELAYED_STATUSES:
         return False
     # 완료목표일(planned_due_date) 우선, 없으면 희망완료일(desired_due_date) 기준.
     check_date = doc.get("planned_due_date") or doc.get("desired_due_date")
@@ -165,12 +168,29 @@ def compute_is_delayed(doc: dict) -> bool:
     return now > check_date
 
 
+def delayed_query(is_delayed: bool = True, now: Optional[datetime] = None) -> dict:
+    """compute_is_delayed와 같은 기준의 Mongo 조건 (True: 지연, False: 지연 아님).
+
+    planned_due_date/desired_due_date 단일 인덱스로 $or 양쪽을 각각 범위 조회한다.
+    """
+    now = now or datetime.now(timezone.utc)
+    past_due = [
+        {"planned_due_date": {"$lt": now}},
+        {"planned_due_date": None, "desired_due_date": {"$lt": now}},
+    ]
+    if is_delayed:
+        return {"status": {"$nin": _NON_DELAYED_STATUSES}, "$or": past_due}
+    return {"$or": [{"status": {"$in": _NON_DELAYED_STATUSES}}, {"$nor": past_due}]}
+
+
 # ── SR 문서 → 출력 변환 ───────────────────────────────────────────────
 
 def sr_to_out(doc: dict, hide_internal: bool = False) -> dict:
     """MongoDB 문서를 API 출력 dict로 변환."""
     d = dict(doc)
     d["id"] = str(d.pop("_id"))
+    d.pop(SEARCH_FIELD, None)
+    d.pop(SEARCH_VERSION_FIELD, None)
     d["is_delayed"] = compute_is_delayed(doc)
     # ObjectId 필드 문자열 변환
     for field in ("requester_id", "assignee_id", "reviewer_id",
@@ -0,0 +1,108 @@
+"""SR 통계(/stats/summary).
+
+상태/유형/우선순위/부서/시스템/담당자별 건수, 긴급·지연 건수, 평균 처리일, 기한 내 완료율을
+$facet 파이프라인 한 번으로 Mongo 안에서 계산한다. 문서를 앱으로 가져오지 않는다.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.db.mongo import MongoClientManager
+from app.models.sr.service_request import SRStats
+from app.services.sr.sr_service import delayed_query
+
+_SUBMITTED = {"SUBMITTED", "REVIEWING", "PENDING_INFO", "APPROVED", "ASSIGNED"}
+_IN_PROGRESS = {"IN_PROGRESS", "COMPLETED", "CONFIRMING"}
+
+_DAY_MS = 86_400_000
+
+
+def _or_default(field: str, default: str) -> dict:
+    """None/빈 문자열/필드 없음은 default로 묶는다."""
+    value = {"$ifNull": [f"${field}", None]}
+    return {"$cond": [{"$in": [value, [None, ""]]}, default, value]}
+
+
+def _count_by(key: dict | str) -> list[dict]:
+    return [{"$group": {"_id": key, "n": {"$sum": 1}}}]
+
+
+def _pipeline(q: dict, now: datetime) -> list[dict]:
+    due = {"$ifNull": ["$planned_due_date", "$desired_due_date"]}
+    return [
+        {"$match": q},
+        {"$project": {
+            "status": 1, "is_urgent": 1, "request_type": 1, "priority": 1, "requester_department": 1,
+            "related_system": 1, "assignee_name": 1, "created_at": 1,
+            "actual_completed_at": 1, "planned_due_date": 1, "desired_due_date": 1,
+        }},
+        {"$facet": {
+            "total": [{"$count": "n"}],
+            "status": _count_by("$status"),
+            "urgent": [{"$match": {"is_urgent": True}}, {"$count": "n"}],
+            "delayed": [{"$match": delayed_query(True, now)}, {"$count": "n"}],
+            "type": _count_by({"$ifNull": ["$request_type", "ETC"]}),
+            "priority": _count_by(_or_default("priority", "MEDIUM")),
+            "department": _count_by({"$ifNull": ["$requester_department", "미지정"]}),
+            "system": _count_by(_or_default("related_system", "미지정")),
+            "assignee": _count_by(_or_default("assignee_name", "미배정")),
+            "processing": [
+                {"$match": {"actual_completed_at": {"$ne": None}, "created_at": {"$ne": None}}},
+                {"$group": {
+                    "_id": None,
+                    "avg_ms": {"$avg": {"$subtract": ["$actual_completed_at", "$created_at"]}},
+                }},
+            ],
+            "on_time": [
+                {"$match": {"status": "CLOSED"}},
+                {"$group": {
+                    "_id": None,
+                    "closed": {"$sum": 1},
+                    "on_time": {"$sum": {"$cond": [
+                        {"$and": [
+                            {"$ne": [{"$ifNull": ["$actual_completed_at", None]}, None]},
+                            {"$ne": [due, None]},
+                            {"$lte": ["$actual_completed_at", due]},
+                        ]},
+                        1, 0,
+                    ]}},
+                }},
+            ],
+        }},
+    ]
+
+
+def _first(rows: list[dict], key: str = "n") -> int:
+    return rows[0][key] if rows else 0
+
+
+async def compute_stats(q: dict, now: Optional[datetime] = None) -> SRStats:
+    col = MongoClientManager.get_db()[MongoClientManager.SERVICE_REQUESTS]
+    now = now or datetime.now(timezone.utc)
+    rows = await col.aggregate(_pipeline(q, now), allowDiskUse=True).to_list(1)
+    f = rows[0]
+
+    by_status = {r["_id"]: r["n"] for r in f["status"]}
+    stats = SRStats(
+        total=_first(f["total"]),
+        submitted=sum(n for s, n in by_status.items() if s in _SUBMITTED),
+        in_progress=sum(n for s, n in by_status.items() if s in _IN_PROGRESS),
+        completed=by_status.get("CLOSED", 0),
+        rejected=by_status.get("REJECTED", 0),
+        on_hold=by_status.get("ON_HOLD", 0),
+        delayed=_first(f["delayed"]),
+        cancelled=by_status.get("CANCELLED", 0),
+        urgent_count=_first(f["urgent"]),
+        by_type={r["_id"]: r["n"] for r in f["type"]},
+        by_priority={r["_id"]: r["n"] for r in f["priority"]},
+        by_department={r["_id"]: r["n"] for r in f["department"]},
+        by_system={r["_id"]: r["n"] for r in f["system"]},
+        by_assignee={r["_id"]: r["n"] for r in f["assignee"]},
+    )
+    if f["processing"] and f["processing"][0]["avg_ms"] is not None:
+        stats.avg_processing_days = round(f["processing"][0]["avg_ms"] / _DAY_MS, 1)
+    closed = _first(f["on_time"], "closed")
+    if closed:
+        stats.on_time_rate = round(f["on_time"][0]["on_time"] / closed * 100, 1)
+    return stats
@@ -0,0 +1,128 @@
+"""사용자 표시 이름 디렉터리 (id / email → full_name 또는 email).
+
+감사 로그, 양식 항목, PM 보고서가 각자 users를 전체 스캔하거나 사용자마다 find_one 하던 것을
+하나의 프로세스 내 스냅샷으로 대체한다.
+
+- 스냅샷은 users 전체(email, full_name만)를 한 번에 읽어 만든다
+- 사용자 쓰기(가입 승인, 관리자 수정)는 invalidate()로 버전을 올리고, 다음 조회에서 다시 읽는다.
+  읽는 도중 버전이 바뀌면 그 결과는 최신으로 취급하지 않는다.
+- 다른 워커 프로세스의 변경은 USER_DIRECTORY_TTL 이내, 또는 USER_DIRECTORY_CHANGE_STREAM을
+  켠 경우(레플리카셋 필요) change stream으로 바로 반영된다
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.db.mongo import MongoClientManager
+
+logger = logging.getLogger(__name__)
+
+# 표시 이름에 영향을 주는 변경만 감시
+_WATCH_PIPELINE = [
+    {"$match": {"$or": [
+        {"operationType": {"$in": ["insert", "delete", "replace"]}},
+        {"updateDescription.updatedFields.full_name": {"$exists": True}},
+        {"updateDescription.updatedFields.email": {"$exists": True}},
+    ]}},
+]
+
+
+class UserDirectory:
+    def __init__(self) -> None:
+        self.ttl = settings.USER_DIRECTORY_TTL
+        self._by_id: Dict[str, str] = {}
+        self._by_email: Dict[str, str] = {}
+        self._version = 0
+        self._loaded_version = -1
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    def invalidate(self) -> None:
+        self._version += 1
+
+    def _fresh(self) -> bool:
+        return (
+            self._loaded_version == self._version
+            and time.monotonic() - self._loaded_at < self.ttl
+        )
+
+    async def _ensure(self) -> None:
+        if self._fresh():
+            return
+        async with self._lock:
+            if self._fresh():
+                return
+            version = self._version
+            by_id: Dict[str, str] = {}
+            by_email: Dict[str, str] = {}
+            col = MongoClientManager.get_users_collection()
+            async for doc in col.find({}, {"email": 1, "full_name": 1}):
+                email = doc.get("email") or ""
+                name = doc.get("full_name") or email
+                by_id[str(doc["_id"])] = name
+                if email:
+                    by_email[email] = name
+            self._by_id, self._by_email = by_id, by_email
+            self._loaded_version = version
+            self._loaded_at = time.monotonic()
+
+    # ── 조회 ────────────────────────────────────────────────────
+
+    async def name_by_id(self, uid) -> Optional[str]:
+        if not uid:
+            return None
+        await self._ensure()
+        return self._by_id.get(str(uid))
+
+    async def name_by_email(self, email: Optional[str]) -> Optional[str]:
+        if not email:
+            return None
+        await self._ensure()
+        return self._by_email.get(email)
+
+    async def names_by_id(self, uids: Iterable) -> Dict[str, str]:
+        await self._ensure()
+        return {str(u): self._by_id[str(u)] for u in uids if u and str(u) in self._by_id}
+
+    async def names_by_email(self, emails: Iterable[Optional[str]]) -> Dict[str, str]:
+        await self._ensure()
+        return {e: self._by_email[e] for e in emails if e and e in self._by_email}
+
+    async def all_by_email(self) -> List[Tuple[str, str]]:
+        """(email, 이름) 전체 목록."""
+        await self._ensure()
+        return list(self._by_email.items())
+
+    # ── change stream (선택) ────────────────────────────────────
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._watch_loop())
+        logger.info("UserDirectory change stream started")
+
+    def stop(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+            logger.info("UserDirectory change stream stopped")
+
+    async def _watch_loop(self) -> None:
+        col = MongoClientManager.get_users_collection()
+        while True:
+            try:
+                async with col.watch(_WATCH_PIPELINE) as stream:
+                    # 감시를 시작하기 전 변경분을 놓치지 않도록 한 번 무효화
+                    self.invalidate()
+                    async for _change in stream:
+                        self.invalidate()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("UserDirectory change stream failed — TTL 갱신으로 대체, 60초 후 재시도")
+            await asyncio.sleep(60)
+
+
+user_directory = UserDirectory()
@@ -8,6 +8,8 @@ from bson import ObjectId
 from bson.errors import InvalidId
 from fastapi import HTTPException
 
+from app.utils.search_tokens import SEARCH_FIELD, SEARCH_VERSION_FIELD
+
 
 def oid(s: str, detail: str = "잘못된 ID입니다.") -> ObjectId:
     """ObjectId 변환. 실패 시 HTTP 400."""
@@ -29,5 +31,7 @@ def fmt_dt(dt: Optional[datetime]) -> Optional[str]:
 def to_out(doc: Dict[str, Any]) -> Dict[str, Any]:
     d = dict(doc)
     d["id"] = str(d.pop("_id"))
+    d.pop(SEARCH_FIELD, None)
+    d.pop(SEARCH_VERSION_FIELD, None)
     d.setdefault("fields", {})
     return d
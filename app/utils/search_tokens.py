@@ -0,0 +1,86 @@
+"""검색 필터용 정규화 값과 n-gram 토큰.
+
+대소문자 무시 부분 일치($regex, 앵커 없음)는 인덱스를 쓰지 못해 컬렉션 전체를 훑는다.
+대신 문서마다 검색 대상 필드의 정규화 값(NFKC, 소문자, 연속 공백 하나로)에서 뽑은
+1-gram / 2-gram을 "<접두어>:<gram>" 형태로 search_tokens 배열에 저장하고 multikey 인덱스를 건다.
+
+검색 시에는 검색어의 2-gram(한 글자면 1-gram)을 모두 가진 문서를 인덱스로 고르고,
+원래 필드에 대한 부분 일치로 한 번 더 확인한다. 띄어쓰기가 없는 한국어 값
+("정보보안팀"에서 "보안")도 그대로 찾는다.
+
+mcp-server/server.py에 같은 토큰 규칙이 복사돼 있다 — 바꿀 때 함께 바꾸고 SEARCH_VERSION을 올린다.
+"""
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Any, Dict, List, Mapping, Optional
+
+SEARCH_FIELD = "search_tokens"
+SEARCH_VERSION_FIELD = "search_v"
+# 토큰 규칙이나 대상 필드가 바뀌면 올린다 — 시작 시 버전이 다른 문서를 다시 채운다
+SEARCH_VERSION = 1
+
+# 응답으로 내보낼 필요가 없는 필드 (find 프로젝션용)
+SEARCH_EXCLUDE = {SEARCH_FIELD: 0, SEARCH_VERSION_FIELD: 0}
+
+# 컬렉션별 검색 대상: {토큰 접두어: 필드}
+SR_SEARCH_FIELDS = {"dept": "requester_department", "req": "requester_name", "sys": "related_system"}
+ASSET_SEARCH_FIELDS = {"name": "name", "ip": "ip", "aid": "asset_id"}
+DOCUMENT_SEARCH_FIELDS = {"name": "name"}
+
+_SPACES = re.compile(r"\s+")
+
+
+def normalize(text: Any) -> str:
+    if text is None:
+        return ""
+    return _SPACES.sub(" ", unicodedata.normalize("NFKC", str(text)).lower()).strip()
+
+
+def grams(text: Any) -> set[str]:
+    s = normalize(text)
+    out = {c for c in s if c != " "}
+    out.update(s[i:i + 2] for i in range(len(s) - 1))
+    return out
+
+
+def query_grams(q: str) -> List[str]:
+    s = normalize(q)
+    if len(s) < 2:
+        return [s] if s else []
+    return sorted({s[i:i + 2] for i in range(len(s) - 1)})
+
+
+def search_fields(doc: Mapping[str, Any], spec: Mapping[str, str]) -> Dict[str, Any]:
+    """doc에 $set 할 search_tokens / search_v."""
+    tokens = {f"{prefix}:{g}" for prefix, field in spec.items() for g in grams(doc.get(field))}
+    return {SEARCH_FIELD: sorted(tokens), SEARCH_VERSION_FIELD: SEARCH_VERSION}
+
+
+def refresh_search_fields(
+    current: Mapping[str, Any],
+    updates: Dict[str, Any],
+    spec: Mapping[str, str],
+    unset: Optional[Mapping[str, Any]] = None,
+) -> None:
+    """updates($set)나 unset이 검색 대상 필드를 바꾸면 토큰도 다시 만들어 updates에 넣는다."""
+    unset = unset or {}
+    fields = set(spec.values())
+    if not fields & (set(updates) | set(unset)):
+        return
+    merged = {k: v for k, v in {**current, **updates}.items() if k not in unset}
+    updates.update(search_fields(merged, spec))
+
+
+def search_conditions(spec: Mapping[str, str], field: str, q: Optional[str]) -> List[dict]:
+    """field 부분 일치 조건 — 토큰($all, 인덱스)으로 후보를 좁히고 원래 값으로 확인."""
+    if not q or not q.strip():
+        return []
+    prefix = next(p for p, f in spec.items() if f == field)
+    conds: List[dict] = []
+    qg = query_grams(q)
+    if qg:
+        conds.append({SEARCH_FIELD: {"$all": [f"{prefix}:{g}" for g in qg]}})
+    conds.append({field: {"$regex": re.escape(q.strip()), "$options": "i"}})
+    return conds
@@ -0,0 +1,178 @@
+"""TTL + stale-while-revalidate 비동기 결과 캐시.
+
+- 키별 TTL: get_or_load(..., ttl=) 로 항목마다 다르게 줄 수 있다
+- stale-while-revalidate: TTL이 지났어도 stale_ttl 이내면 기존 값을 바로 돌려주고
+  백그라운드에서 한 번만 갱신한다
+- 동일 키 동시 요청은 하나의 upstream 호출로 합친다 (coalesce)
+- sizeof로 추정한 바이트 합계가 max_bytes를 넘으면 LRU 순서로 내보낸다
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: float
+    stale_until: float
+
+
+class AsyncTtlCache:
+    def __init__(
+        self,
+        *,
+        ttl: float,
+        stale_ttl: float = 0.0,
+        max_bytes: int = 64 * 1024 * 1024,
+        sizeof: Callable[[Any], int] = lambda _v: 1,
+    ) -> None:
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._refreshing: Set[asyncio.Task] = set()
+        self.counters: Dict[str, int] = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "refreshes": 0,
+            "evictions": 0,
+            "errors": 0,
+        }
+
+    # ── public ─────────────────────────────────────────────────
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if now < entry.expires_at:
+                self._entries.move_to_end(key)
+                self.counters["hits"] += 1
+                return entry.value
+            if now < entry.stale_until:
+                self._entries.move_to_end(key)
+                self.counters["stale_hits"] += 1
+                self._refresh_in_background(key, loader, ttl)
+                return entry.value
+            self._drop(key)
+
+        fut = self._inflight.get(key)
+        if fut is not None:
+            self.counters["coalesced"] += 1
+            try:
+                return await asyncio.shield(fut)
+            except asyncio.CancelledError:
+                # 먼저 로드하던 요청이 취소된 경우에만 직접 다시 로드한다
+                if not fut.cancelled():
+                    raise
+
+        self.counters["misses"] += 1
+        return await self._load(key, loader, ttl)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._drop(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "inflight": len(self._inflight),
+        }
+
+    # ── internal ───────────────────────────────────────────────
+
+    async def _load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float],
+    ) -> Any:
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except Exception as e:
+            self.counters["errors"] += 1
+            if not fut.done():
+                fut.set_exception(e)
+                # 기다리는 쪽이 없으면 "exception was never retrieved" 경고 방지
+                fut.exception()
+            raise
+        else:
+            self._store(key, value, ttl)
+            fut.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def _refresh_in_background(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float],
+    ) -> None:
+        if key in self._inflight:
+            return
+        self.counters["refreshes"] += 1
+
+        async def run() -> None:
+            try:
+                await self._load(key, loader, ttl)
+            except Exception:
+                logger.warning("[Cache] 백그라운드 갱신 실패 (key=%s)", key, exc_info=True)
+
+        task = asyncio.create_task(run())
+        self._refreshing.add(task)
+        task.add_done_callback(self._refreshing.discard)
+
+    def _store(self, key: Hashable, value: Any, ttl: Optional[float]) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        size = max(int(self.sizeof(value)), 1)
+        if size > self.max_bytes:
+            return
+        self._drop(key)
+        now = time.monotonic()
+        self._entries[key] = _Entry(
+            value=value,
+            size=size,
+            expires_at=now + ttl,
+            stale_until=now + ttl + self.stale_ttl,
+        )
+        self._bytes += size
+        while self._bytes > self.max_bytes and self._entries:
+            _old_key, old = self._entries.popitem(last=False)
+            self._bytes -= old.size
+            self.counters["evictions"] += 1
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
@@ -0,0 +1,202 @@
+"""대용량 Excel(xlsx/zip) 내보내기 — write-only 워크북 + 청크 스트리밍.
+
+to_list(None)로 문서를 모두 읽어 일반 Workbook을 만들고 BytesIO에 통째로 저장하던
+방식을 대체한다.
+
+- 행은 Mongo 커서에서 배치 단위로 읽어 write-only 워크시트에 바로 쓴다
+  (openpyxl이 시트 XML을 임시 파일로 흘려 쓰므로 행 수와 무관하게 메모리 일정)
+- 저장(zip 압축)은 스레드에서 돌리고, 나오는 바이트를 크기 제한 큐를 거쳐
+  StreamingResponse로 바로 내보낸다. 클라이언트가 느리면 저장도 그만큼 기다린다.
+- 클라이언트가 도중에 끊으면 저장 스레드도 중단한다.
+"""
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import io
+import threading
+from typing import AsyncIterator, Callable, Iterable, List, Optional, Sequence
+from urllib.parse import quote
+
+from fastapi.responses import StreamingResponse
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+ZIP_MEDIA_TYPE = "application/zip"
+
+CHUNK_SIZE = 64 * 1024
+_QUEUE_CHUNKS = 16          # 큐에 쌓아 둘 최대 청크 수 (= 최대 약 1MB)
+ROW_BATCH = 1000            # 커서에서 모아 스레드로 넘기는 행 수
+
+
+class _ClientGone(OSError):
+    pass
+
+
+class _QueueWriter(io.RawIOBase):
+    """스레드에서 쓰는 파일 객체. CHUNK_SIZE 단위로 모아 이벤트 루프의 큐에 넣는다.
+
+    seek/tell을 지원하지 않으므로 zipfile은 데이터 디스크립터 방식으로 순차 기록한다.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue, aborted: threading.Event):
+        self._loop = loop
+        self._queue = queue
+        self._aborted = aborted
+        self._buf = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._buf += b
+        while len(self._buf) >= CHUNK_SIZE:
+            chunk = bytes(self._buf[:CHUNK_SIZE])
+            del self._buf[:CHUNK_SIZE]
+            self._put(chunk)
+        return len(b)
+
+    def flush(self) -> None:
+        # zipfile이 항목마다 flush를 부르므로 여기서는 내보내지 않고 CHUNK_SIZE까지 모은다
+        pass
+
+    def finish(self) -> None:
+        if self._buf:
+            self._put(bytes(self._buf))
+            self._buf.clear()
+
+    def _put(self, chunk: Optional[bytes]) -> None:
+        if self._aborted.is_set():
+            raise _ClientGone("client disconnected")
+        fut = asyncio.run_coroutine_threadsafe(self._queue.put(chunk), self._loop)
+        while True:
+            try:
+                fut.result(timeout=0.5)
+                return
+            except concurrent.futures.TimeoutError:
+                if self._aborted.is_set():
+                    fut.cancel()
+                    raise _ClientGone("client disconnected")
+
+
+async def stream_file(write: Callable[[io.RawIOBase], None]) -> AsyncIterator[bytes]:
+    """write(fileobj)를 스레드에서 실행하며 기록되는 바이트를 청크로 내보낸다."""
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_CHUNKS)
+    aborted = threading.Event()
+    writer = _QueueWriter(loop, queue, aborted)
+
+    def run() -> None:
+        try:
+            write(writer)
+            writer.finish()
+        finally:
+            if not aborted.is_set():
+                try:
+                    writer._put(None)
+                except _ClientGone:
+                    pass
+
+    task = asyncio.ensure_future(asyncio.to_thread(run))
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                break
+            yield chunk
+        await task  # 저장 중 예외가 있으면 여기서 올라온다
+    finally:
+        if not task.done():
+            aborted.set()
+            # 큐가 가득 차 막힌 put을 풀어 스레드가 중단을 알아채게 한다
+            while not queue.empty():
+                queue.get_nowait()
+            try:
+                await task
+            except Exception:  # noqa: BLE001 — 이미 끊긴 응답이라 보고할 곳이 없다
+                pass
+
+
+def content_disposition(filename: str) -> dict:
+    return {"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"}
+
+
+def file_response(
+    write: Callable[[io.RawIOBase], None],
+    filename: str,
+    media_type: str = XLSX_MEDIA_TYPE,
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_file(write),
+        media_type=media_type,
+        headers=content_disposition(filename),
+    )
+
+
+def workbook_response(wb, filename: str) -> StreamingResponse:
+    """일반/write-only Workbook을 스레드에서 저장하며 청크 단위로 응답."""
+    return file_response(wb.save, filename)
+
+
+# ── write-only 워크시트 작성 도우미 ──────────────────────────────────────
+
+def header_row(ws, labels: Sequence[str], fill=None, font=None, alignment=None) -> list:
+    """스타일을 입힌 헤더 행(WriteOnlyCell 목록)."""
+    from openpyxl.cell import WriteOnlyCell
+
+    cells = []
+    for label in labels:
+        c = WriteOnlyCell(ws, value=label)
+        if fill is not None:
+            c.fill = fill
+        if font is not None:
+            c.font = font
+        if alignment is not None:
+            c.alignment = alignment
+        cells.append(c)
+    return cells
+
+
+def set_column_widths(ws, widths: Iterable[float]) -> None:
+    """write-only 시트는 첫 행을 쓰기 전에 열 너비를 지정해야 한다."""
+    from openpyxl.utils import get_column_letter
+
+    for ci, width in enumerate(widths, start=1):
+        ws.column_dimensions[get_column_letter(ci)].width = width
+
+
+async def batched(docs: AsyncIterator[dict], size: int = ROW_BATCH) -> AsyncIterator[List[dict]]:
+    """커서(또는 async iterator)를 size개씩 묶어서 낸다."""
+    batch: List[dict] = []
+    async for doc in docs:
+        batch.append(doc)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _append_many(ws, docs: List[dict], to_row: Callable[[dict], Optional[list]]) -> int:
+    n = 0
+    for doc in docs:
+        row = to_row(doc)
+        if row is not None:
+            ws.append(row)
+            n += 1
+    return n
+
+
+async def append_rows(
+    ws,
+    docs: AsyncIterator[dict],
+    to_row: Callable[[dict], Optional[list]],
+    batch: int = ROW_BATCH,
+) -> int:
+    """문서를 to_row로 변환해 ws에 추가하고 추가한 행 수를 반환. to_row가 None이면 건너뜀.
+
+    batch개씩 모아 변환/기록을 스레드에서 하므로 이벤트 루프를 오래 막지 않는다.
+    """
+    count = 0
+    async for chunk in batched(docs, batch):
+        count += await asyncio.to_thread(_append_many, ws, chunk, to_row)
+    return count
@@ -121,6 +121,7 @@ export interface ActionProgress {
 export interface ImportLog {
   id: string
   createdAt?: string | null
+  status: 'running' | 'done' | 'failed'
   recordsBefore: number
   inserted: number
   updated: number
@@ -139,6 +140,20 @@ export interface ImportResult {
   logId: string
 }
 
+export interface ImportJob {
+  id: string
+  status: 'queued' | 'running' | 'succeeded' | 'failed'
+  filename?: string | null
+  logId?: string | null
+  uploaderEmail?: string | null
+  progress: { phase: 'read' | 'write' | 'images' | null; done: number; total: number }
+  result?: ImportResult | null
+  error?: string | null
+  createdAt?: string | null
+  startedAt?: string | null
+  finishedAt?: string | null
+}
+
 const BASE = '/isms-p/vulnerabilities'
 
 export async function listVulnerabilities(filter: VulnListFilter): Promise<VulnerabilityListPage> {
@@ -203,11 +218,30 @@ export async function listImportHistory(): Promise<ImportLog[]> {
   return data
 }
 
-export async function importExcel(file: File): Promise<ImportResult> {
+export async function getImportJob(jobId: string): Promise<ImportJob> {
+  const { data } = await api.get<ImportJob>(`${BASE}/import-jobs/${jobId}`)
+  return data
+}
+
+const IMPORT_POLL_MS = 1000
+
+/** 가져오기 작업이 서버에서 실패했을 때 (message = 작업의 오류 메시지) */
+export class ImportJobError extends Error {}
+
+/** 가져오기 작업을 등록하고 끝날 때까지 상태를 폴링한다. 실패하면 작업의 오류 메시지로 throw. */
+export async function importExcel(file: File, onProgress?: (job: ImportJob) => void): Promise<ImportResult> {
   const form = new FormData()
   form.append('file', file)
-  const { data } = await api.post<ImportResult>(`${BASE}/import`, form)
-  return data
+  let { data: job } = await api.post<ImportJob>(`${BASE}/import`, form)
+  while (job.status === 'queued' || job.status === 'running') {
+    onProgress?.(job)
+    await new Promise((resolve) => setTimeout(resolve, IMPORT_POLL_MS))
+    job = await getImportJob(job.id)
+  }
+  if (job.status === 'failed' || !job.result) {
+    throw new ImportJobError(job.error || '가져오기에 실패했습니다.')
+  }
+  return job.result
 }
 
 export async function rollbackImport(logId: string): Promise<{ success: boolean; restored: number; deleted: number }> {
@@ -292,6 +292,7 @@ export type SRStats = {
   cancelled: number
   urgentCount: number
   byType: Record<string, number>
+  byPriority: Record<string, number>
   byDepartment: Record<string, number>
   bySystem: Record<string, number>
   byAssignee: Record<string, number>
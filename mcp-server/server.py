@@ -1,5 +1,7 @@
 import json
 import os
+import re
+import unicodedata
 from datetime import datetime
 
 from bson import ObjectId
@@ -53,6 +55,29 @@ def _dump(docs) -> str:
     return json.dumps(_serialize(docs), ensure_ascii=False, indent=2)
 
 
+# 검색 토큰 — app/utils/search_tokens.py 와 같은 규칙 (백엔드 이미지와 따로 빌드되므로 복사)
+_SEARCH_FIELD = "search_tokens"
+_ASSET_SEARCH_FIELDS = {"name": "name", "ip": "ip", "aid": "asset_id"}
+_SPACES = re.compile(r"\s+")
+
+
+def _normalize(text) -> str:
+    return _SPACES.sub(" ", unicodedata.normalize("NFKC", str(text)).lower()).strip()
+
+
+def _search_match(spec: dict, query: str) -> list:
+    """필드별 부분 일치 조건 목록 ($or 용) — 토큰 인덱스로 후보를 좁히고 원래 값으로 확인."""
+    s = _normalize(query)
+    if not s:
+        return []
+    qg = sorted({s[i:i + 2] for i in range(len(s) - 1)}) if len(s) >= 2 else [s]
+    pattern = {"$regex": re.escape(query.strip()), "$options": "i"}
+    return [
+        {_SEARCH_FIELD: {"$all": [f"{prefix}:{g}" for g in qg]}, field: pattern}
+        for prefix, field in spec.items()
+    ]
+
+
 # ── 자산 ──────────────────────────────────────────────────────────────────────
 
 @mcp.tool()
@@ -76,15 +101,11 @@ def search_assets(query: str, category: str = "서버") -> str:
     category: 서버 | 네트워크 | 정보보호시스템 | DBMS | VMware
     """
     col = ASSET_COLLECTIONS.get(category, "assets_servers")
-    flt = {
-        "is_deleted": {"$ne": True},
-        "$or": [
-            {"name": {"$regex": query, "$options": "i"}},
-            {"ip": {"$regex": query, "$options": "i"}},
-            {"asset_id": {"$regex": query, "$options": "i"}},
-        ],
-    }
-    docs = list(db[col].find(flt).limit(20))
+    conds = _search_match(_ASSET_SEARCH_FIELDS, query)
+    if not conds:
+        return _dump([])
+    flt = {"is_deleted": {"$ne": True}, "$or": conds}
+    docs = list(db[col].find(flt, {_SEARCH_FIELD: 0, "search_v": 0}).limit(20))
     return _dump(docs)
 
 
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark: JiraClient.search — 호출마다 새 AsyncClient vs 공유 커넥션 풀
+
+로컬 가짜 Jira(/rest/api/3/search/jql)를 띄우고 2,000건(기본) 검색을 반복 실행해
+p50/p95 지연 시간을 비교한다.
+
+  before : 검색 호출마다 httpx.AsyncClient를 새로 만든다 (기존 동작)
+  after  : HttpClientManager의 프로세스 전역 풀을 재사용한다
+
+Usage:
+    python scripts/bench_jira_search.py [--issues 2000] [--runs 50] [--latency-ms 5]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+
+# Allow running from project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Settings는 필수 값이 없으면 import 단계에서 실패하므로 벤치마크용 더미 값을 채운다.
+for _k, _v in {
+    "JIRA_BASE_URL": "http://127.0.0.1",
+    "JIRA_EMAIL": "bench@example.com",
+    "JIRA_API_TOKEN": "bench",
+    "MONGO_URI": "mongodb://127.0.0.1:27017",
+    "JWT_SECRET_KEY": "bench",
+    "JWT_ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "60",
+    "APP_DB_NAME": "bench",
+}.items():
+    os.environ.setdefault(_k, _v)
+
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.core.http_client import HttpClientManager
+from app.jira.client import JiraClient
+
+
+def _make_fake_jira(total: int, latency_ms: float) -> Starlette:
+    issues = [
+        {
+            "key": f"BENCH-{i}",
+            "fields": {
+                "summary": f"benchmark issue {i}",
+                "status": {"name": "진행 중"},
+                "assignee": {"displayName": f"user{i % 25}"},
+                "created": "2025-08-01T09:00:00.000+0900",
+                "updated": "2025-08-02T09:00:00.000+0900",
+                "duedate": "2025-08-08",
+            },
+        }
+        for i in range(total)
+    ]
+
+    async def search(request: Request):
+        body = await request.json()
+        size = int(body.get("maxResults", 100))
+        offset = int(body.get("nextPageToken") or 0)
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        page = issues[offset:offset + size]
+        data = {"issues": page}
+        if offset + size < total:
+            data["nextPageToken"] = str(offset + size)
+        return JSONResponse(data)
+
+    return Starlette(routes=[Route("/rest/api/3/search/jql", search, methods=["POST"])])
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start_server(app: Starlette, port: int) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[idx]
+
+
+async def _run(base_url: str, runs: int, expected: int) -> dict[str, list[float]]:
+    results: dict[str, list[float]] = {"before": [], "after": []}
+
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        async with httpx.AsyncClient(timeout=30.0) as fresh:
+            issues = await JiraClient(base_url=base_url, http_client=fresh).search("bench")
+        results["before"].append((time.perf_counter() - t0) * 1000)
+        assert len(issues) == expected, len(issues)
+
+    HttpClientManager.init_client()
+    pooled = JiraClient(base_url=base_url)
+    await pooled.search("warmup")
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        issues = await pooled.search("bench")
+        results["after"].append((time.perf_counter() - t0) * 1000)
+        assert len(issues) == expected, len(issues)
+    await HttpClientManager.close_client()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--issues", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="가짜 Jira 페이지당 응답 지연")
+    args = parser.parse_args()
+
+    port = _free_port()
+    server = _start_server(_make_fake_jira(args.issues, args.latency_ms), port)
+    try:
+        results = asyncio.run(_run(f"http://127.0.0.1:{port}", args.runs, args.issues))
+    finally:
+        server.should_exit = True
+
+    print(f"{args.issues} issues x {args.runs} runs (page latency {args.latency_ms}ms)")
+    print(f"{'mode':<8} {'p50(ms)':>10} {'p95(ms)':>10} {'mean(ms)':>10}")
+    for mode, values in results.items():
+        print(
+            f"{mode:<8} {_percentile(values, 50):>10.1f} {_percentile(values, 95):>10.1f} "
+            f"{statistics.mean(values):>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Benchmark: PM 주간/월간 보고서 집계(aggregate_period) — 이슈별 find_one vs 컬렉션별 $in 일괄 조회 vs 기간 롤업
+
+mongomock 위에 왕복마다 지연(--latency-ms)을 주는 가짜 async 컬렉션을 올리고,
+이슈 10,000건(기본)에서 주간(7일)/월간(한 달) 기간의 WorkItem 목록을 만드는 시간과
+Mongo 왕복 횟수를 비교한다.
+
+  before : 이슈마다 프로젝트/조직/스프린트/에픽을 find_one (요청 안 캐시) — 기존 동작
+  after  : pm_issues를 조건 조회하고 필요한 id를 모아 컬렉션마다 $in 한 번 (PM_ROLLUP_ENABLED=false)
+  rollup : 기간 롤업(pm_period_rollup)에서 주차 버킷만 읽고 같은 $in 조회 (PM_ROLLUP_ENABLED=true)
+           — 롤업은 측정 전에 rebuild_rollup()으로 한 번 만들어 두고 그 시간도 출력한다
+
+mongomock이 필요하다: pip install -r requirements-dev.txt
+
+Usage:
+    python scripts/bench_report_agg.py [--issues 10000] [--latency-ms 1] [--mode all|before|after|rollup]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+# Allow running from project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Settings는 필수 값이 없으면 import 단계에서 실패하므로 벤치마크용 더미 값을 채운다.
+for _k, _v in {
+    "JIRA_BASE_URL": "http://127.0.0.1",
+    "JIRA_EMAIL": "bench@example.com",
+    "JIRA_API_TOKEN": "bench",
+    "MONGO_URI": "mongodb://127.0.0.1:27017",
+    "JWT_SECRET_KEY": "bench",
+    "JWT_ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "60",
+    "APP_DB_NAME": "bench",
+}.items():
+    os.environ.setdefault(_k, _v)
+
+import mongomock
+from bson import ObjectId
+
+from app.core.config import settings
+from app.db.mongo import MongoClientManager
+from app.models.pm.reports import WorkItem
+from app.routers.pm import report_agg
+from app.services.pm.period_rollup import rebuild_rollup
+from app.services.user_directory import user_directory
+
+_BASE = datetime(2025, 1, 6)
+
+
+class _Stats:
+    round_trips = 0
+
+
+class _FakeCursor:
+    def __init__(self, cur, latency: float):
+        self._cur = cur
+        self._latency = latency
+
+    def sort(self, *args, **kwargs):
+        self._cur = self._cur.sort(*args, **kwargs)
+        return self
+
+    async def to_list(self, _length):
+        _Stats.round_trips += 1
+        await asyncio.sleep(self._latency)
+        return list(self._cur)
+
+    def __aiter__(self):
+        return self._gen()
+
+    async def _gen(self):
+        for d in await self.to_list(None):
+            yield d
+
+
+class _FakeCollection:
+    """왕복(find_one / 커서 읽기)마다 latency만큼 기다리는 motor 흉내."""
+
+    def __init__(self, col, latency: float):
+        self._col = col
+        self._latency = latency
+
+    def find(self, *args, **kwargs):
+        return _FakeCursor(self._col.find(*args, **kwargs), self._latency)
+
+    async def find_one(self, *args, **kwargs):
+        _Stats.round_trips += 1
+        await asyncio.sleep(self._latency)
+        return self._col.find_one(*args, **kwargs)
+
+    def __getattr__(self, name):
+        # 그 외 쓰기/관리 명령(insert_many, bulk_write, rename ...)도 왕복 한 번으로 센다
+        method = getattr(self._col, name)
+
+        async def call(*args, **kwargs):
+            _Stats.round_trips += 1
+            await asyncio.sleep(self._latency)
+            return method(*args, **kwargs)
+
+        return call
+
+
+class _FakeDb:
+    """롤업 재구축의 임시 컬렉션(db[이름]) 접근용."""
+
+    def __init__(self, db, latency: float):
+        self._db = db
+        self._latency = latency
+
+    def __getitem__(self, name: str) -> _FakeCollection:
+        return _FakeCollection(self._db[name], self._latency)
+
+
+def _seed(db, n_issues: int) -> None:
+    rnd = random.Random(42)
+    orgs = [{"_id": ObjectId(), "name": f"조직{i}"} for i in range(8)]
+    projects = [
+        {"_id": ObjectId(), "name": f"프로젝트{i}", "org_id": orgs[i % len(orgs)]["_id"]}
+        for i in range(40)
+    ]
+    sprints = [{"_id": ObjectId(), "name": f"스프린트{i}"} for i in range(120)]
+    users = [
+        {"_id": ObjectId(), "email": f"user{i}@example.com", "full_name": f"사용자{i}"}
+        for i in range(150)
+    ]
+    epics = [
+        {"_id": ObjectId(), "number": i, "title": f"에픽{i}", "type": "EPIC",
+         "project_id": projects[i % len(projects)]["_id"]}
+        for i in range(200)
+    ]
+    issues = []
+    for i in range(n_issues):
+        start = _BASE + timedelta(days=rnd.randrange(0, 365))
+        issues.append({
+            "_id": ObjectId(),
+            "number": 1000 + i,
+            "title": f"벤치마크 이슈 {i}",
+            "description": "x" * 400,
+            "type": "SUB_TASK" if i % 4 == 0 else "TASK",
+            "project_id": rnd.choice(projects)["_id"],
+            "assignee_id": rnd.choice(users)["_id"] if i % 10 else None,
+            "status": rnd.choice(["DONE", "DONE", "IN_PROGRESS", "TODO", "BACKLOG"]),
+            "priority": "MEDIUM",
+            "epic_id": rnd.choice(epics)["_id"] if i % 3 else None,
+            "sprint_id": rnd.choice(sprints)["_id"] if i % 2 else None,
+            "start_date": start,
+            "due_date": start + timedelta(days=rnd.randrange(1, 21)),
+            "story_points": rnd.choice([1, 2, 3, 5, 8]),
+        })
+    db.pm_organizations.insert_many(orgs)
+    db.pm_projects.insert_many(projects)
+    db.pm_sprints.insert_many(sprints)
+    db.users.insert_many(users)
+    db.pm_issues.insert_many(epics + issues)
+
+
+def _install(db, latency: float) -> None:
+    cols = {
+        "get_pm_issues_collection": db.pm_issues,
+        "get_pm_projects_collection": db.pm_projects,
+        "get_pm_organizations_collection": db.pm_organizations,
+        "get_pm_sprints_collection": db.pm_sprints,
+        "get_pm_project_members_collection": db.pm_project_members,
+        "get_users_collection": db.users,
+        "get_pm_period_rollup_collection": db.pm_period_rollup,
+        "get_pm_rollup_tombstones_collection": db.pm_rollup_tombstones,
+    }
+    for name, col in cols.items():
+        fake = _FakeCollection(col, latency)
+        setattr(MongoClientManager, name, classmethod(lambda cls, _f=fake: _f))
+    fake_db = _FakeDb(db, latency)
+    MongoClientManager.get_db = classmethod(lambda cls: fake_db)
+
+
+async def before(start_dt: datetime, end_dt: datetime) -> list[WorkItem]:
+    """기존 aggregate_period의 이슈 → WorkItem 변환 (현재 기간만)."""
+    now = datetime.now(timezone.utc)
+    issues_col   = MongoClientManager.get_pm_issues_collection()
+    projects_col = MongoClientManager.get_pm_projects_collection()
+    orgs_col     = MongoClientManager.get_pm_organizations_collection()
+    sprints_col  = MongoClientManager.get_pm_sprints_collection()
+    cache: dict = {}
+
+    async def get(col, key, _id, projection=None):
+        if not _id:
+            return None
+        k = (key, str(_id))
+        if k not in cache:
+            cache[k] = await col.find_one({"_id": _id}, projection)
+        return cache[k]
+
+    in_range = {"$gte": start_dt, "$lte": end_dt}
+    docs = await issues_col.find({
+        "type": {"$in": ["TASK", "SUB_TASK"]},
+        "$or": [{"start_date": in_range}, {"due_date": in_range}, {"status": "IN_PROGRESS"}],
+    }).sort("number", 1).to_list(None)
+
+    items = []
+    for doc in docs:
+        proj = await get(projects_col, "p", doc["project_id"])
+        if not proj:
+            continue
+        org = await get(orgs_col, "o", proj.get("org_id"))
+        name = await user_directory.name_by_id(doc.get("assignee_id"))
+        sprint = await get(sprints_col, "s", doc.get("sprint_id"))
+        epic = await get(issues_col, "e", doc.get("epic_id"), {"title": 1})
+        maps = {
+            "projects": {proj["_id"]: proj},
+            "orgs": {org["_id"]: org} if org else {},
+            "sprints": {sprint["_id"]: sprint} if sprint else {},
+            "epics": {epic["_id"]: epic} if epic else {},
+            "names": {str(doc["assignee_id"]): name} if name else {},
+        }
+        items.append(report_agg._to_work_item(doc, maps, now))
+    return items
+
+
+async def after(start_dt: datetime, end_dt: datetime) -> list[WorkItem]:
+    settings.PM_ROLLUP_ENABLED = False
+    all_items, *_ = await report_agg.aggregate_period(start_dt, end_dt)
+    return all_items
+
+
+async def rollup(start_dt: datetime, end_dt: datetime) -> list[WorkItem]:
+    settings.PM_ROLLUP_ENABLED = True
+    all_items, *_ = await report_agg.aggregate_period(start_dt, end_dt)
+    return all_items
+
+
+async def _measure(name: str, fn, label: str, start_dt: datetime, end_dt: datetime) -> None:
+    _Stats.round_trips = 0
+    t0 = time.perf_counter()
+    items = await fn(start_dt, end_dt)
+    elapsed = time.perf_counter() - t0
+    print(
+        f"{name:<7} {label:<8} items={len(items):>6}  "
+        f"{elapsed * 1000:9.1f} ms  round trips {_Stats.round_trips:>6}"
+    )
+
+
+async def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--issues", type=int, default=10_000)
+    ap.add_argument("--latency-ms", type=float, default=1.0, help="Mongo 왕복당 지연(ms)")
+    ap.add_argument("--mode", choices=["all", "before", "after", "rollup"], default="all")
+    args = ap.parse_args()
+
+    db = mongomock.MongoClient().bench
+    _seed(db, args.issues)
+    _install(db, args.latency_ms / 1000)
+    await user_directory.name_by_id("warmup")  # 사용자 디렉터리 스냅샷은 모든 방식이 공유
+
+    if args.mode in ("all", "rollup"):
+        t0 = time.perf_counter()
+        result = await rebuild_rollup()
+        print(
+            f"rollup build: issues={result['issues']} buckets={result['buckets']}  "
+            f"{(time.perf_counter() - t0) * 1000:9.1f} ms"
+        )
+
+    windows = [
+        ("weekly", datetime(2025, 6, 2), datetime(2025, 6, 8)),
+        ("monthly", datetime(2025, 6, 1), datetime(2025, 6, 30)),
+    ]
+    for label, start_dt, end_dt in windows:
+        if args.mode in ("all", "before"):
+            await _measure("before", before, label, start_dt, end_dt)
+        if args.mode in ("all", "after"):
+            await _measure("after", after, label, start_dt, end_dt)
+        if args.mode in ("all", "rollup"):
+            await _measure("rollup", rollup, label, start_dt, end_dt)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
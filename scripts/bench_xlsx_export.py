@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Excel 내보내기 — 메모리 Workbook + BytesIO vs write-only 스트리밍
+
+SR 목록 내보내기(/sr/admin/export)와 같은 16개 열의 문서 100,000건(기본)을
+가짜 async 커서로 흘려 xlsx를 만들고, 경과 시간 / 첫 바이트까지 시간 / 파이썬 힙 최대
+사용량(tracemalloc)을 비교한다.
+
+  before : to_list(None) → openpyxl.Workbook() → wb.save(BytesIO) (기존 동작)
+  after  : 커서 → write-only 워크시트(append_rows) → stream_file 청크 응답
+
+Usage:
+    python scripts/bench_xlsx_export.py [--rows 100000] [--mode both|before|after] [--no-memory]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+# Allow running from project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import openpyxl
+from openpyxl.styles import Alignment, Font, PatternFill
+
+from app.utils.xlsx_stream import append_rows, header_row, set_column_widths, stream_file
+
+HEADERS = [
+    "SR번호", "요청제목", "요청부서", "요청자", "요청유형", "관련시스템",
+    "중요도", "긴급여부", "희망완료일", "완료목표일", "실제완료일",
+    "담당자", "상태", "지연여부", "접수일", "최종수정일",
+]
+_BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _doc(i: int) -> dict:
+    created = _BASE + timedelta(minutes=i)
+    return {
+        "sr_no": f"SR-2025-{i:06d}",
+        "title": f"벤치마크 요청 {i} — 계정 권한 변경 및 접근 통제 점검",
+        "requester_department": f"부서{i % 17}",
+        "requester_name": f"요청자{i % 211}",
+        "request_type": "ETC",
+        "related_system": f"시스템{i % 9}",
+        "priority": "MEDIUM",
+        "is_urgent": i % 13 == 0,
+        "desired_due_date": created + timedelta(days=7),
+        "planned_due_date": created + timedelta(days=10),
+        "actual_completed_at": created + timedelta(days=9) if i % 3 else None,
+        "assignee_name": f"담당자{i % 31}",
+        "status": "IN_PROGRESS",
+        "created_at": created,
+        "updated_at": created + timedelta(hours=5),
+    }
+
+
+class _FakeCursor:
+    """motor 커서처럼 async for로 문서를 하나씩 만들어 낸다 (미리 메모리에 올리지 않음)."""
+
+    def __init__(self, n: int):
+        self.n = n
+
+    def __aiter__(self):
+        return self._gen()
+
+    async def _gen(self):
+        for i in range(self.n):
+            yield _doc(i)
+            if i % 1000 == 0:
+                await asyncio.sleep(0)
+
+    async def to_list(self, _length):
+        return [d async for d in self]
+
+
+def _fmt(dt):
+    return dt.strftime("%Y-%m-%d") if dt else ""
+
+
+def _to_row(d: dict) -> list:
+    return [
+        d["sr_no"], d["title"], d["requester_department"], d["requester_name"],
+        d["request_type"], d["related_system"], d["priority"],
+        "Y" if d["is_urgent"] else "N",
+        _fmt(d["desired_due_date"]), _fmt(d["planned_due_date"]), _fmt(d["actual_completed_at"]),
+        d["assignee_name"], d["status"], "N", _fmt(d["created_at"]), _fmt(d["updated_at"]),
+    ]
+
+
+_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+_FONT = Font(color="FFFFFF", bold=True)
+
+
+async def before(rows: int) -> tuple[int, float]:
+    docs = await _FakeCursor(rows).to_list(None)
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for ci, h in enumerate(HEADERS, 1):
+        c = ws.cell(row=1, column=ci, value=h)
+        c.fill = _FILL
+        c.font = _FONT
+        c.alignment = Alignment(horizontal="center")
+    for d in docs:
+        ws.append(_to_row(d))
+    buf = io.BytesIO()
+    wb.save(buf)
+    size = buf.tell()
+    return size, 0.0
+
+
+async def after(rows: int) -> tuple[int, float]:
+    t0 = time.perf_counter()
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("SR목록")
+    set_column_widths(ws, [15] * len(HEADERS))
+    ws.append(header_row(ws, HEADERS, _FILL, _FONT, Alignment(horizontal="center")))
+    await append_rows(ws, _FakeCursor(rows), _to_row)
+    size = 0
+    first = None
+    async for chunk in stream_file(wb.save):
+        if first is None:
+            first = time.perf_counter() - t0
+        size += len(chunk)
+    return size, first or 0.0
+
+
+async def _measure(name: str, fn, rows: int, trace: bool) -> None:
+    # tracemalloc은 할당마다 기록하므로 켜면 시간이 몇 배로 늘어난다 — 시간은 --no-memory로 따로 잰다
+    if trace:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    size, ttfb = await fn(rows)
+    elapsed = time.perf_counter() - t0
+    line = f"{name:<7} rows={rows:>7}  total {elapsed:6.2f}s"
+    if ttfb:
+        line += f"  first byte {ttfb:6.2f}s"
+    if trace:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        line += f"  peak heap {peak / 1024 / 1024:8.1f} MB"
+    print(line + f"  file {size / 1024 / 1024:6.1f} MB")
+
+
+async def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--mode", choices=["both", "before", "after"], default="both")
+    ap.add_argument("--no-memory", action="store_true", help="tracemalloc 없이 시간만 측정")
+    args = ap.parse_args()
+
+    if args.mode in ("both", "before"):
+        await _measure("before", before, args.rows, not args.no_memory)
+    if args.mode in ("both", "after"):
+        await _measure("after", after, args.rows, not args.no_memory)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+PM 기간 롤업(pm_period_rollup) 재구축
+
+pm_issues 전체로 (ISO 주차, 프로젝트, 담당자) 버킷을 다시 만들고 기존 롤업과 교체한다.
+롤업이 어긋났다고 의심될 때나 이슈를 DB에서 직접 고친 뒤 실행한다.
+앱이 서비스 중이어도 실행할 수 있다 — 재구축 중 앱에서 수정/삭제된 이슈는
+updated_at과 삭제 기록(pm_rollup_tombstones)으로 찾아 교체 후 다시 반영한다.
+단, DB에서 직접 삭제한 이슈는 기록이 남지 않으므로 삭제를 마친 뒤 실행한다.
+접속 정보는 앱과 같은 설정(app/secret/.env 또는 환경 변수)을 사용한다.
+
+Usage:
+    python scripts/rebuild_pm_rollup.py
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sys
+
+# Allow running from project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.mongo import MongoClientManager
+from app.services.pm.period_rollup import rebuild_rollup
+
+
+async def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    MongoClientManager.init_client()
+    try:
+        result = await rebuild_rollup()
+    finally:
+        await MongoClientManager.close_client()
+    print(f"issues={result['issues']} buckets={result['buckets']} resynced={result['resynced']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())